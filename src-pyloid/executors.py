@@ -0,0 +1,43 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+
+# 블로킹 작업 자원 구분
+FILE_IO = "file_io"   # openpyxl 읽기/쓰기
+BROWSER = "browser"   # 아이소식 페이지 요청, Chrome(Selenium)
+EXCEL = "excel"       # Excel COM (한 번에 하나의 Excel 인스턴스만 사용)
+
+# 자원별 동시 실행 수
+EXECUTOR_LIMITS = {
+    FILE_IO: 4,
+    BROWSER: 2,
+    EXCEL: 1,
+}
+
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_executor(resource: str) -> ThreadPoolExecutor:
+    with _executors_lock:
+        executor = _executors.get(resource)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=EXECUTOR_LIMITS[resource],
+                thread_name_prefix=f"tdm-{resource}",
+            )
+            _executors[resource] = executor
+        return executor
+
+
+async def run_blocking(resource: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    블로킹 함수를 자원별 executor에서 실행
+
+    RPC 이벤트 루프가 openpyxl, Excel COM, Chrome 작업 동안 멈추지 않도록 async 핸들러에서 사용
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(resource), functools.partial(func, *args, **kwargs))
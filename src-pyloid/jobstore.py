@@ -0,0 +1,108 @@
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Dict, Optional
+
+
+TERMINAL_STATUSES = ("done", "error")
+
+DEFAULT_MAX_WARNINGS = 500   # 작업 1개가 보관하는 최대 경고 수
+DEFAULT_TTL = 600.0          # 끝난 작업 상태를 보관하는 시간(초)
+
+# 작업이 보낸 payload 대신 저장소가 관리하는 키
+_MANAGED_KEYS = ("seq", "warnings", "warnings_dropped")
+
+
+class JobRecord:
+    __slots__ = ("payload", "seq", "warnings", "warnings_dropped", "last_warning", "finished_at")
+
+    def __init__(self, max_warnings: int):
+        self.payload: Dict[str, Any] = {}
+        self.seq = 0
+        self.warnings: deque = deque(maxlen=max_warnings)
+        self.warnings_dropped = 0
+        self.last_warning: Optional[str] = None
+        self.finished_at: Optional[float] = None
+
+
+class JobStore:
+    """
+    작업 진행상태 저장소
+
+    - 경고는 작업별 deque에 추가만 하므로 emit 1회 비용이 경고 수와 무관
+    - `max_warnings`를 넘는 오래된 경고는 버리고 버린 개수만 `warnings_dropped`로 기록
+    - 끝난 작업은 `ttl`초가 지나면 제거
+    """
+
+    def __init__(self, max_warnings: int = DEFAULT_MAX_WARNINGS, ttl: float = DEFAULT_TTL):
+        self.max_warnings = max_warnings
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._records: Dict[str, JobRecord] = {}
+        self._finished: "OrderedDict[str, float]" = OrderedDict()
+
+    def update(self, job_id: str, payload: Dict[str, Any]) -> int:
+        """
+        진행상태를 반영하고 새 seq 반환
+
+        경고 목록 복사는 조회(`get`) 때만 하므로 emit 1회 비용이 경고 수와 무관
+        """
+        now = time.time()
+        with self._lock:
+            self._evict_locked(now)
+
+            record = self._records.get(job_id)
+            if record is None:
+                record = self._records[job_id] = JobRecord(self.max_warnings)
+
+            record.payload = {k: v for k, v in payload.items() if k not in _MANAGED_KEYS}
+            record.seq += 1
+
+            if payload.get("level") == "warning" and payload.get("message"):
+                msg = str(payload["message"])
+                if msg != record.last_warning:
+                    if len(record.warnings) == record.warnings.maxlen:
+                        record.warnings_dropped += 1
+                    record.warnings.append(msg)
+                    record.last_warning = msg
+
+            if payload.get("status") in TERMINAL_STATUSES:
+                record.finished_at = now
+                self._finished[job_id] = now
+                self._finished.move_to_end(job_id)
+            elif record.finished_at is not None:
+                record.finished_at = None
+                self._finished.pop(job_id, None)
+
+            return record.seq
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._evict_locked(time.time())
+            record = self._records.get(job_id)
+            return self._snapshot_locked(record) if record is not None else None
+
+    def seq(self, job_id: str) -> int:
+        with self._lock:
+            record = self._records.get(job_id)
+            return record.seq if record is not None else 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._records)
+
+    def _snapshot_locked(self, record: JobRecord) -> Dict[str, Any]:
+        return {
+            **record.payload,
+            "seq": record.seq,
+            "warnings": list(record.warnings),
+            "warnings_dropped": record.warnings_dropped,
+        }
+
+    def _evict_locked(self, now: float) -> None:
+        while self._finished:
+            job_id, finished_at = next(iter(self._finished.items()))
+            if now - finished_at < self.ttl:
+                break
+            self._finished.popitem(last=False)
+            self._records.pop(job_id, None)
@@ -9,7 +9,7 @@ from pyloid.utils import (
 )
 from pyloid.serve import pyloid_serve
 from pyloid import Pyloid
-from server import server
+from server import server, get_job_pool
 from license import verify_license_or_exit
 
 WIDTH, HEIGHT = 1400, 830
@@ -194,6 +194,9 @@ def main():
     window.set_resizable(False)
     window.show_and_focus()
 
+    # 첫 작업 전에 작업자 프로세스를 미리 띄워 둠
+    get_job_pool()
+
     app.run()
 
 
@@ -0,0 +1,93 @@
+import threading
+from typing import Callable, Dict, Iterable, List, Optional
+
+
+# 작업이 읽고 쓰는 파일 구분
+DATA_FILE = "데이터 파일"
+MAKEUP_TEST_LIST = "재시험 명단"
+STUDENT_INFO = "학생 정보"
+CLASS_INFO = "반 정보"
+
+
+class _Entry:
+    def __init__(self, job_id: str, start: Callable[[], None], reads: Iterable[str], writes: Iterable[str], notify: bool = True):
+        self.job_id = job_id
+        self.start = start
+        self.notify = notify
+        self.writes = frozenset(writes)
+        self.reads = frozenset(reads) - self.writes
+        self.position: Optional[int] = None
+
+    def conflicts(self, other: "_Entry") -> frozenset:
+        """두 작업이 동시에 실행될 수 없게 만드는 파일 목록"""
+        return (self.writes & (other.reads | other.writes)) | (other.writes & self.reads)
+
+
+class JobScheduler:
+    """
+    파일 단위 읽기/쓰기 잠금으로 작업 실행 순서를 정하는 스케줄러
+
+    - 같은 파일을 읽기만 하는 작업이나 서로 다른 파일을 다루는 작업은 동시에 실행
+    - 한쪽이라도 쓰는 파일이 겹치면 먼저 들어온 작업이 끝날 때까지 대기 (FIFO)
+    - 대기 중인 작업의 순번이 바뀌면 `on_wait(job_id, position, blocking_files)` 호출 (`notify=False`로 등록한 항목 제외)
+    """
+
+    def __init__(self, on_wait: Callable[[str, int, List[str]], None]):
+        self.on_wait = on_wait
+        self._lock = threading.Lock()
+        self._running: Dict[str, _Entry] = {}
+        self._waiting: List[_Entry] = []
+
+    def submit(
+        self,
+        job_id: str,
+        start: Callable[[], None],
+        reads: Iterable[str] = (),
+        writes: Iterable[str] = (),
+        notify: bool = True,
+    ) -> None:
+        """실행 가능하면 바로 `start()`를 호출하고, 아니면 대기열에 추가"""
+        with self._lock:
+            self._waiting.append(_Entry(job_id, start, reads, writes, notify))
+            ready, notices = self._pump_locked()
+        self._dispatch(ready, notices)
+
+    def release(self, job_id: str) -> None:
+        """작업 종료 시 잠금을 풀고 다음 작업 실행"""
+        with self._lock:
+            if self._running.pop(job_id, None) is None:
+                # 시작 전에 취소된 작업
+                self._waiting = [e for e in self._waiting if e.job_id != job_id]
+            ready, notices = self._pump_locked()
+        self._dispatch(ready, notices)
+
+    def _pump_locked(self):
+        ready: List[_Entry] = []
+        notices = []
+        still_waiting: List[_Entry] = []
+
+        for entry in self._waiting:
+            blocking = set()
+            for other in list(self._running.values()) + still_waiting:
+                blocking |= entry.conflicts(other)
+
+            if blocking:
+                still_waiting.append(entry)
+                position = len(still_waiting)
+                if entry.position != position:
+                    entry.position = position
+                    if entry.notify:
+                        notices.append((entry.job_id, position, sorted(blocking)))
+                continue
+
+            self._running[entry.job_id] = entry
+            ready.append(entry)
+
+        self._waiting = still_waiting
+        return ready, notices
+
+    def _dispatch(self, ready: List[_Entry], notices) -> None:
+        for job_id, position, blocking in notices:
+            self.on_wait(job_id, position, blocking)
+        for entry in ready:
+            entry.start()
@@ -1,4 +1,6 @@
-﻿import base64
+﻿import asyncio
+import base64
+import contextlib
 from datetime import datetime
 import hashlib
 import json
@@ -9,12 +11,12 @@ import sys
 import tempfile
 import threading
 import multiprocessing
-from queue import Empty
 import time
 import traceback
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from urllib.error import URLError, HTTPError
 from urllib.request import Request, urlopen
 import webbrowser
@@ -31,7 +33,16 @@ import tdm.datafile
 import tdm.dataform
 import tdm.studentinfo
 import tdm.makeuptest
-from tdm.exception import NoMatchingSheetException, FileOpenException, ExcelRequiredException, ChromeDriverVersionMismatchException
+import tdm.backup
+import tdm.makeuparchive
+import tdm.makeupplan
+import tdm.messageplan
+from executors import run_blocking, FILE_IO, BROWSER, EXCEL
+from jobstore import JobStore, TERMINAL_STATUSES
+from scheduler import JobScheduler, DATA_FILE, MAKEUP_TEST_LIST, STUDENT_INFO, CLASS_INFO
+from workerpool import WorkerPool
+from tdm.defs import MakeupTestList
+from tdm.exception import NoMatchingSheetException, FileOpenException, ReopenFileException, ExcelRequiredException, ChromeDriverVersionMismatchException
 
 
 ####################################### 상태 관리 메서드 #######################################
@@ -39,59 +50,187 @@ from tdm.exception import NoMatchingSheetException, FileOpenException, ExcelRequ
 
 server = PyloidRPC()
 
-# 진행상태 저장소: job_id -> {step, status, message}
-progress: dict[str, dict] = {}
-job_threads: dict[str, threading.Thread] = {}
-job_processes: dict[str, multiprocessing.Process] = {}
-progress_queues: dict[str, multiprocessing.Queue] = {}
-progress_listeners: dict[str, threading.Thread] = {}
-job_process_started_at: dict[str, float] = {}
-job_process_seen_payload: dict[str, bool] = {}
+# 진행상태 저장소: job_id -> {seq, step, status, message, warnings}
+job_store = JobStore()
+
+
+# wait_progress 대기자: job_id -> [(event loop, future)]
+progress_waiters: dict[str, list[tuple[asyncio.AbstractEventLoop, asyncio.Future]]] = {}
+progress_waiters_lock = threading.Lock()
+
+PROGRESS_WAIT_TIMEOUT = 20.0
+
+
+def _resolve_waiter(fut: asyncio.Future) -> None:
+    if not fut.done():
+        fut.set_result(None)
+
+
+def _store_progress(job_id: str, payload: dict) -> None:
+    """진행상태 저장 후 seq 부여 및 wait_progress 대기자 깨우기"""
+    job_store.update(job_id, payload)
+
+    with progress_waiters_lock:
+        waiters = progress_waiters.pop(job_id, [])
+    for loop, fut in waiters:
+        try:
+            loop.call_soon_threadsafe(_resolve_waiter, fut)
+        except RuntimeError:
+            # 이벤트 루프가 이미 닫힌 경우
+            pass
 
 
 def make_emit(job_id: str):
     def _emit(payload: dict):
-        prev = progress.get(job_id, {})
-        warnings = list(prev.get("warnings", []))
-        if payload.get("level") == "warning":
-            msg = payload.get("message")
-            if msg:
-                msg_str = str(msg)
-                if not warnings or warnings[-1] != msg_str:
-                    warnings.append(msg_str)
-        payload = {**payload, "warnings": warnings}
-        progress[job_id] = payload
-        # (옵션) 추후 실시간 브로드캐스트가 필요하면 이 지점에서 처리
+        # 경고 누적은 job_store에서 처리
+        _store_progress(job_id, payload)
 
     return _emit
 
 
-def _queue_listener(job_id: str, q: multiprocessing.Queue, proc: multiprocessing.Process) -> None:
-    while True:
-        try:
-            payload = q.get(timeout=0.5)
-        except Empty:
-            if not proc.is_alive():
-                if proc.pid is None:
-                    started_at = job_process_started_at.get(job_id, 0)
-                    if started_at and (time.time() - started_at) < 5.0:
-                        continue
-                break
-            continue
-        if payload is None:
-            break
-        job_process_seen_payload[job_id] = True
-        make_emit(job_id)(payload)
-    progress_queues.pop(job_id, None)
-    progress_listeners.pop(job_id, None)
-    job_process_seen_payload.pop(job_id, None)
-    job_process_started_at.pop(job_id, None)
+def _finish_job(job_id: str, failed: bool) -> None:
+    """작업자에서 작업이 끝났을 때 종료 상태를 남기지 못한 작업 마무리"""
+    payload = job_store.get(job_id)
+    if payload is None or payload.get("status") not in ("running", "unknown"):
+        return
 
+    if failed:
+        _store_progress(job_id, {
+            **payload,
+            "status": "error",
+            "level": "error",
+            "message": "작업 프로세스가 비정상적으로 종료되었습니다.",
+            "error": "작업 프로세스가 비정상적으로 종료되었습니다.",
+            "ts": time.time(),
+        })
+        return
 
-@server.method()
-async def get_progress(ctx: RPCContext, job_id: str) -> Dict[str, Any]:
-    """진행상태 조회 (프런트 폴링)"""
+    _store_progress(job_id, {
+        **payload,
+        "status": "done",
+        "level": "success",
+        "message": payload.get("message") or "작업이 완료되었습니다.",
+        "ts": time.time(),
+    })
+
+
+def _on_job_wait(job_id: str, position: int, blocking: list[str]) -> None:
+    total = (job_store.get(job_id) or {}).get("total")
+    Progress(make_emit(job_id), total=total).info(
+        f"{', '.join(blocking)} 파일을 사용하는 작업이 끝나기를 기다리는 중입니다. (대기 {position}번째)"
+    )
+
+
+def _on_job_end(job_id: str, failed: bool) -> None:
+    _finish_job(job_id, failed)
+    job_scheduler.release(job_id)
+
+
+job_scheduler = JobScheduler(on_wait=_on_job_wait)
+
+job_pool: Optional[WorkerPool] = None
+job_pool_lock = threading.Lock()
+
+
+def get_job_pool() -> WorkerPool:
+    """백그라운드 작업용 작업자 풀 (첫 호출 시 작업자 생성)"""
+    global job_pool
+
+    with job_pool_lock:
+        if job_pool is None:
+            job_pool = WorkerPool(
+                on_progress=lambda job_id, payload: make_emit(job_id)(payload),
+                on_job_end=_on_job_end,
+            )
+        job_pool.start()
+        return job_pool
+
+
+def _fail_job(job_id: str, message: str, detail: str = "") -> Dict[str, Any]:
+    make_emit(job_id)({
+        "ts": time.time(),
+        "step": 0,
+        "total": 0,
+        "level": "error",
+        "status": "error",
+        "message": message,
+        "error": message,
+        "detail": detail,
+        "warnings": [],
+    })
+    return {"job_id": job_id}
+
+
+def _dispatch_job(job_id: str, target, kwargs: Dict[str, Any]) -> None:
+    try:
+        get_job_pool().submit(job_id, target, kwargs)
+    except Exception:
+        _fail_job(job_id, f"{target.__name__} 작업을 시작하지 못했습니다.", traceback.format_exc())
+        job_scheduler.release(job_id)
+
+
+def _submit_job(
+    job_id: str,
+    target,
+    kwargs: Dict[str, Any],
+    total: int,
+    message: str,
+    reads: tuple[str, ...] = (),
+    writes: tuple[str, ...] = (),
+) -> Dict[str, Any]:
+    """읽고 쓰는 파일이 겹치는 작업이 끝난 뒤 작업자 풀에서 실행"""
+    make_emit(job_id)({
+        "ts": time.time(),
+        "step": 0,
+        "total": total,
+        "level": "info",
+        "status": "running",
+        "message": message,
+        "warnings": [],
+    })
+
+    job_scheduler.submit(
+        job_id,
+        lambda: _dispatch_job(job_id, target, kwargs),
+        reads=reads,
+        writes=writes,
+    )
+
+    return {"job_id": job_id}
+
+
+@contextlib.asynccontextmanager
+async def file_lock(reads: tuple[str, ...] = (), writes: tuple[str, ...] = ()):
+    """
+    백그라운드 작업과 같은 스케줄러로 파일 잠금을 잡은 채 RPC 본문 실행
+
+    RPC에서 바로 파일을 읽고 쓸 때도 같은 파일을 쓰는 작업(다른 RPC 포함)이 끝난 뒤에 실행되고,
+    읽기끼리는 동시에 실행됨
+    """
+    loop = asyncio.get_running_loop()
+    acquired = loop.create_future()
+    lock_id = f"rpc-{uuid.uuid4()}"
+
+    def start() -> None:
+        loop.call_soon_threadsafe(lambda: acquired.done() or acquired.set_result(None))
+
+    job_scheduler.submit(lock_id, start, reads=reads, writes=writes, notify=False)
+    try:
+        await acquired
+        yield
+    finally:
+        job_scheduler.release(lock_id)
+
+
+async def run_locked(resource: str, func, *args, reads: tuple[str, ...] = (), writes: tuple[str, ...] = (), **kwargs):
+    """`file_lock`을 잡고 `run_blocking` 실행"""
+    async with file_lock(reads=reads, writes=writes):
+        return await run_blocking(resource, func, *args, **kwargs)
+
+
+def _current_progress(job_id: str) -> Dict[str, Any]:
     default_payload = {
+        "seq": 0,
         "step": 0,
         "total": 0,
         "level": "info",
@@ -100,52 +239,50 @@ async def get_progress(ctx: RPCContext, job_id: str) -> Dict[str, Any]:
         "error": "",
         "detail": "",
         "warnings": [],
+        "warnings_dropped": 0,
         "ts": time.time(),
     }
-    payload = progress.get(job_id, default_payload)
-    thread = job_threads.get(job_id)
-    if thread and not thread.is_alive():
-        status = payload.get("status")
-        if status in ("running", "unknown"):
-            payload = {
-                **payload,
-                "status": "done",
-                "level": "success",
-                "message": payload.get("message") or "작업이 완료되었습니다.",
-                "ts": time.time(),
-            }
-            progress[job_id] = payload
-        job_threads.pop(job_id, None)
-    proc = job_processes.get(job_id)
-    if proc and not proc.is_alive():
-        status = payload.get("status")
-        if status in ("running", "unknown"):
-            started_at = job_process_started_at.get(job_id, 0)
-            seen_payload = job_process_seen_payload.get(job_id, False)
-            if not seen_payload and (time.time() - started_at) < 2.0:
-                return payload
-            if proc.exitcode not in (0, None):
-                payload = {
-                    **payload,
-                    "status": "error",
-                    "level": "error",
-                    "message": payload.get("message") or "update_class process failed.",
-                    "ts": time.time(),
-                }
-                progress[job_id] = payload
-                job_processes.pop(job_id, None)
-                return payload
-            payload = {
-                **payload,
-                "status": "done",
-                "level": "success",
-                "message": payload.get("message") or "작업이 완료되었습니다.",
-                "ts": time.time(),
-            }
-            progress[job_id] = payload
-        job_processes.pop(job_id, None)
+    # 종료 상태는 작업자 풀 디스패처가 작업 종료/프로세스 종료 시점에 바로 기록
+    return job_store.get(job_id) or default_payload
+
+
+@server.method()
+async def get_progress(ctx: RPCContext, job_id: str) -> Dict[str, Any]:
+    """진행상태 조회 (프런트 폴링)"""
+    return _current_progress(job_id)
+
+
+@server.method()
+async def wait_progress(ctx: RPCContext, job_id: str, since_seq: int = 0, timeout: float = PROGRESS_WAIT_TIMEOUT) -> Dict[str, Any]:
+    """
+    진행상태 long-poll
+
+    `since_seq`보다 새로운 진행상태가 생기거나 작업이 끝나면 즉시 반환하고, 없으면 `timeout`초 동안 대기
+    """
+    payload = _current_progress(job_id)
+    if payload.get("seq", 0) > since_seq or payload.get("status") in TERMINAL_STATUSES:
+        return payload
+
+    loop = asyncio.get_running_loop()
+    fut = loop.create_future()
+    with progress_waiters_lock:
+        progress_waiters.setdefault(job_id, []).append((loop, fut))
+
+    try:
+        # 등록 직전에 도착한 진행상태 확인
+        if job_store.seq(job_id) <= since_seq:
+            await asyncio.wait_for(fut, timeout=max(0.0, min(float(timeout), PROGRESS_WAIT_TIMEOUT)))
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        with progress_waiters_lock:
+            waiters = progress_waiters.get(job_id)
+            if waiters is not None:
+                waiters[:] = [w for w in waiters if w[1] is not fut]
+                if not waiters:
+                    progress_waiters.pop(job_id, None)
 
-    return payload
+    return _current_progress(job_id)
 
 
 ####################################### 파일 열기 #######################################
@@ -178,6 +315,66 @@ def _decode_upload_to_temp(filename: str, b64: str) -> Path:
         raise
 
 
+# 파일 선택창으로 고른 파일: token -> 로컬 경로 (작업 제출 시 사용한 token은 제거)
+picked_files: dict[str, str] = {}
+picked_files_lock = threading.Lock()
+PICKED_FILES_MAX = 32  # 고르기만 하고 쓰지 않은 token은 오래된 것부터 제거
+
+
+def _register_picked_file(path: Path) -> str:
+    token = uuid.uuid4().hex
+    with picked_files_lock:
+        picked_files[token] = str(path)
+        while len(picked_files) > PICKED_FILES_MAX:
+            del picked_files[next(iter(picked_files))]
+    return token
+
+
+def _resolve_picked_file(token: str, consume: bool = False) -> str:
+    with picked_files_lock:
+        path = picked_files.pop(token, None) if consume else picked_files.get(token)
+    if not path or not os.path.isfile(path):
+        raise FileNotFoundError("선택한 파일을 찾을 수 없습니다. 파일을 다시 선택해주세요.")
+    return path
+
+
+def _snapshot_to_temp(path: str) -> Path:
+    """
+    로컬 파일을 작업용 임시 경로에 고정
+
+    같은 볼륨이면 하드 링크로 복사 없이 고정하고, 안되면 파일 복사
+    """
+    tmp_root = Path(tempfile.mkdtemp(prefix="tdm_job_"))
+    tmp_path = tmp_root / Path(path).name
+    try:
+        try:
+            os.link(path, tmp_path)
+        except OSError:
+            shutil.copyfile(path, tmp_path)
+        return tmp_path
+    except Exception:
+        shutil.rmtree(tmp_root, ignore_errors=True)
+        raise
+
+
+def _materialize_upload(filename: str, b64: str = "", path: str = "") -> Path:
+    """선택한 파일 경로가 있으면 스냅샷을, 없으면 업로드된 base64 데이터를 임시 파일로 저장"""
+    if path:
+        return _snapshot_to_temp(path)
+    return _decode_upload_to_temp(filename, b64)
+
+
+def _upload_kwargs(filename: str, b64: str, token: str, consume: bool = True) -> Dict[str, Any]:
+    """
+    작업자로 넘길 업로드 정보 (파일 선택창 token은 로컬 경로로 변환)
+
+    `consume`: 작업을 제출할 때는 token을 제거하여 끝난 작업의 token을 다시 쓰지 못하게 함 (미리보기는 유지)
+    """
+    if token:
+        return {"filename": filename, "b64": "", "path": _resolve_picked_file(token, consume)}
+    return {"filename": filename, "b64": b64, "path": ""}
+
+
 def _cleanup_temp(path: Path) -> None:
     """임시 파일/폴더 정리"""
     try:
@@ -240,6 +437,45 @@ def _update_class_job_process(job_id: str, q: multiprocessing.Queue) -> None:
         tdm.classinfo.delete_temp()
 
 
+def _archive_makeup_test_job_process(job_id: str, q: multiprocessing.Queue, after_days: int) -> None:
+    def _emit(payload: dict):
+        q.put(payload)
+
+    prog = Progress(_emit, total=1)
+
+    prog.info("재시험 명단 보관 준비중...")
+    try:
+        archived = tdm.makeuparchive.archive_completed_tests(prog, after_days)
+        if archived == 0:
+            prog.done(f"{after_days}일이 지난 완료된 재시험이 없습니다.")
+        else:
+            prog.done(f"완료된 재시험 {archived}건을 보관했습니다.")
+    except NoMatchingSheetException as e:
+        prog.error(f"파일에서 목표 시트를 찾을 수 없습니다:\n {e}")
+    except FileOpenException as e:
+        prog.error(f"파일이 열려 있습니다:\n {e}")
+    except (ReopenFileException, FileNotFoundError) as e:
+        prog.error(str(e))
+    except Exception:
+        prog.error("예상치 못한 오류가 발생했습니다.", detail=traceback.format_exc())
+
+
+def _send_exam_total(backend: str) -> int:
+    """양식 검증 + 메시지 작성 방식의 단계 + 작업 완료"""
+    return 2 + tdm.chrome.message_backend_steps(backend)
+
+
+def _save_and_send_total(save_data: bool, save_makeup: bool, send_message: bool, backend: str) -> int:
+    """양식 검증 + 데이터 파일(3) + 재시험 명단 + 파일 저장 + 메시지 작성 방식의 단계와 작성 완료 (생략한 단계 제외)"""
+    return (
+        1
+        + (3 if save_data else 0)
+        + (1 if save_makeup else 0)
+        + (1 if save_data or save_makeup else 0)
+        + (1 + tdm.chrome.message_backend_steps(backend) if send_message else 0)
+    )
+
+
 def _send_exam_message_job_process(
     job_id: str,
     q: multiprocessing.Queue,
@@ -247,16 +483,20 @@ def _send_exam_message_job_process(
     filename: str,
     b64: str,
     makeup_test_date: Dict[str, Any],
+    path: str = "",
+    backend: str = "selenium",
+    holidays: Optional[List[str]] = None,
 ) -> None:
     def _emit(payload: dict):
         q.put(payload)
 
-    prog = Progress(_emit, total=3)
+    total = _send_exam_total(backend)
+    prog = Progress(_emit, total=total)
 
     _emit({
         "ts": time.time(),
         "step": 0,
-        "total": 3,
+        "total": total,
         "level": "info",
         "status": "running",
         "message": "작업을 준비하고 있습니다.",
@@ -264,8 +504,9 @@ def _send_exam_message_job_process(
     })
 
     tmp_file: Optional[Path] = None
+    message_backend: Optional[tdm.chrome.MessageBackend] = None
     try:
-        tmp_file = _decode_upload_to_temp(filename, b64)
+        tmp_file = _materialize_upload(filename, b64, path)
 
         try:
             tdm.dataform.data_validation(str(tmp_file))
@@ -277,8 +518,17 @@ def _send_exam_message_job_process(
         for k, v in makeup_test_date.items():
             makeup_test_date[k] = datetime.strptime(v, "%Y-%m-%d")
 
+        # 사전 점검(양식 분석, 명단 조회)과 브라우저 실행을 동시에 진행
+        message_backend = tdm.chrome.get_message_backend(backend)
+        message_backend.prepare()
+
+        plan = tdm.messageplan.preflight(str(tmp_file), makeup_test_date, prog, holidays=holidays)
+        if plan.is_empty():
+            prog.done("작성할 시험 결과가 없어 메시지 작성을 건너뛰었습니다.")
+            return
+
         try:
-            tdm.chrome.send_test_result_message(str(tmp_file), makeup_test_date, prog)
+            message_backend.write(str(tmp_file), makeup_test_date, prog, plan=plan)
         except ChromeDriverVersionMismatchException as e:
             prog.error(str(e))
             return
@@ -291,6 +541,8 @@ def _send_exam_message_job_process(
     except Exception:
         prog.error("예상치 못한 오류가 발생했습니다.", detail=traceback.format_exc())
     finally:
+        if message_backend is not None:
+            message_backend.discard()
         if tmp_file:
             _cleanup_temp(tmp_file)
 
@@ -302,6 +554,8 @@ def _save_exam_job_process(
     filename: str,
     b64: str,
     makeup_test_date: Dict[str, Any],
+    path: str = "",
+    holidays: Optional[List[str]] = None,
 ) -> None:
     def _emit(payload: dict):
         q.put(payload)
@@ -320,7 +574,7 @@ def _save_exam_job_process(
 
     tmp_file: Optional[Path] = None
     try:
-        tmp_file = _decode_upload_to_temp(filename, b64)
+        tmp_file = _materialize_upload(filename, b64, path)
 
         try:
             tdm.dataform.data_validation(str(tmp_file))
@@ -333,8 +587,21 @@ def _save_exam_job_process(
             makeup_test_date[k] = datetime.strptime(v, "%Y-%m-%d")
 
         try:
-            datafile_wb = tdm.datafile.save_test_data(str(tmp_file), prog)
-            makeuptest_wb = tdm.makeuptest.save_makeup_test_list(str(tmp_file), makeup_test_date, prog)
+            # 양식과 학생 정보는 한 번만 읽고, 서로 다른 파일을 쓰는 두 작업을 동시에 실행
+            form = tdm.dataform.read_form(str(tmp_file))
+            student_index = tdm.studentinfo.load_student_index()
+
+            with ThreadPoolExecutor(max_workers=2, thread_name_prefix="tdm-save") as executor:
+                datafile_future = executor.submit(
+                    tdm.datafile.save_test_data, str(tmp_file), prog,
+                    form=form, student_index=student_index,
+                )
+                makeuptest_future = executor.submit(
+                    tdm.makeuptest.save_makeup_test_list, str(tmp_file), makeup_test_date, prog,
+                    form=form, student_index=student_index, holidays=holidays,
+                )
+                datafile_wb = datafile_future.result()
+                makeuptest_wb = makeuptest_future.result()
             prog.step("재시험 명단 입력 완료")
         except ExcelRequiredException as e:
             prog.error(str(e))
@@ -365,6 +632,196 @@ def _save_exam_job_process(
             _cleanup_temp(tmp_file)
 
 
+def _save_and_send_job_process(
+    job_id: str,
+    q: multiprocessing.Queue,
+    *,
+    filename: str,
+    b64: str,
+    makeup_test_date: Dict[str, Any],
+    path: str = "",
+    save_data: bool = True,
+    save_makeup: bool = True,
+    send_message: bool = True,
+    backend: str = "selenium",
+    holidays: Optional[List[str]] = None,
+) -> None:
+    """
+    양식 검증 -> 데이터 파일 저장 -> 재시험 명단 저장 -> 메시지 작성을 하나의 작업으로 실행
+
+    양식, 학생 정보 색인은 한 번만 읽어 모든 단계에서 공유하며 각 단계는 `save_data`, `save_makeup`, `send_message`로 생략 가능
+    """
+    def _emit(payload: dict):
+        q.put(payload)
+
+    prog = Progress(_emit, total=_save_and_send_total(save_data, save_makeup, send_message, backend))
+
+    tmp_file: Optional[Path] = None
+    message_backend: Optional[tdm.chrome.MessageBackend] = None
+    try:
+        tmp_file = _materialize_upload(filename, b64, path)
+
+        try:
+            tdm.dataform.data_validation(str(tmp_file))
+        except tdm.dataform.DataValidationException as exc:
+            prog.error(f"데이터 검증 오류가 발생하였습니다:\n{exc}")
+            return
+        prog.step("데이터 입력 양식 검증 완료")
+
+        for k, v in makeup_test_date.items():
+            makeup_test_date[k] = datetime.strptime(v, "%Y-%m-%d")
+
+        if send_message:
+            # 양식 분석/저장/사전 점검과 브라우저 실행을 동시에 진행
+            message_backend = tdm.chrome.get_message_backend(backend)
+            message_backend.prepare()
+
+        form = tdm.dataform.read_form(str(tmp_file))
+        student_index = tdm.studentinfo.load_student_index()
+        # 재시험 명단과 메시지가 같은 재시험 일정을 쓰도록 한 번만 배정
+        planner = tdm.makeupplan.plan_makeup_wave(form, student_index, makeup_test_date, holidays)
+
+        if save_data or save_makeup:
+            try:
+                with ThreadPoolExecutor(max_workers=2, thread_name_prefix="tdm-save") as executor:
+                    datafile_future = makeuptest_future = None
+                    if save_data:
+                        datafile_future = executor.submit(
+                            tdm.datafile.save_test_data, str(tmp_file), prog,
+                            form=form, student_index=student_index,
+                        )
+                    if save_makeup:
+                        makeuptest_future = executor.submit(
+                            tdm.makeuptest.save_makeup_test_list, str(tmp_file), makeup_test_date, prog,
+                            form=form, student_index=student_index, planner=planner,
+                        )
+                    datafile_wb = datafile_future.result() if datafile_future else None
+                    makeuptest_wb = makeuptest_future.result() if makeuptest_future else None
+                if save_makeup:
+                    prog.step("재시험 명단 입력 완료")
+            except ExcelRequiredException as e:
+                prog.error(str(e))
+                return
+            except NoMatchingSheetException as e:
+                prog.error(f"파일에서 목표 시트를 찾을 수 없습니다:\n {e}")
+                return
+            except tdm.datafile.NoReservedColumnError as e:
+                prog.error(f"파일에 필수 열이 없습니다:\n {e}")
+                return
+
+            try:
+                if datafile_wb is not None:
+                    tdm.datafile.save(datafile_wb)
+                if makeuptest_wb is not None:
+                    tdm.makeuptest.save(makeuptest_wb)
+            except FileOpenException as e:
+                prog.error(f"파일이 열려 있습니다:\n {e}")
+                return
+            prog.step("파일 저장 완료")
+
+        if send_message:
+            plan = tdm.messageplan.preflight(str(tmp_file), makeup_test_date, prog, form=form, student_index=student_index, planner=planner)
+            if plan.is_empty():
+                prog.step("작성할 시험 결과가 없어 메시지 작성을 건너뛰었습니다.")
+            else:
+                try:
+                    message_backend.write(str(tmp_file), makeup_test_date, prog, plan=plan)
+                except ChromeDriverVersionMismatchException as e:
+                    prog.error(str(e))
+                    return
+                except Exception as e:
+                    prog.error(f"메시지 작성 중 오류가 발생했습니다:\n {e}")
+                    return
+                prog.step("메시지 작성 완료")
+
+        if send_message:
+            prog.done("데이터 저장과 메시지 작성이 완료되었습니다. 전송 전 내용을 확인하세요.")
+        else:
+            prog.done("데이터 저장을 완료하였습니다.")
+    except Exception:
+        prog.error("예상치 못한 오류가 발생했습니다.", detail=traceback.format_exc())
+    finally:
+        if message_backend is not None:
+            message_backend.discard()
+        tdm.datafile.delete_temp()
+        if tmp_file:
+            _cleanup_temp(tmp_file)
+
+
+def _save_individual_result_job_process(
+    job_id: str,
+    q: multiprocessing.Queue,
+    *,
+    student_name: str,
+    class_name: str,
+    test_name: str,
+    target_row: int,
+    target_col: int,
+    test_score: int | float,
+    makeup_test_check: bool,
+    makeup_test_date: Dict[str, Any],
+    holidays: Optional[List[str]] = None,
+) -> None:
+    """개별 시험 결과 저장 및 메시지 작성 (데이터 파일 저장과 크롬 실행을 동시에 진행)"""
+    def _emit(payload: dict):
+        q.put(payload)
+
+    needs_makeup = test_score < 80 and not makeup_test_check
+    prog = Progress(_emit, total=4 if needs_makeup else 3)
+
+    browser_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tdm-chrome")
+    browser_future = None
+    filled = False
+    try:
+        for k, v in makeup_test_date.items():
+            makeup_test_date[k] = datetime.strptime(v, "%Y-%m-%d")
+
+        # 크롬 실행/페이지 로딩은 평균 계산이 필요 없으므로 데이터 파일 저장과 동시에 진행
+        browser_future = browser_executor.submit(tdm.chrome.launch_individual_message_browser, needs_makeup)
+
+        prog.info("시험 결과를 저장하는 중입니다...")
+        try:
+            test_average = tdm.datafile.save_individual_test_data(target_row, target_col, test_score)
+        except ExcelRequiredException as e:
+            prog.error(str(e))
+            return
+        except FileOpenException as e:
+            prog.error(f"파일이 열려 있습니다:\n {e}")
+            return
+        prog.step("데이터 파일 저장 완료")
+
+        if needs_makeup:
+            tdm.makeuptest.save_individual_makeup_test(student_name, class_name, test_name, test_score, makeup_test_date, prog, holidays)
+            prog.step("재시험 명단 저장 완료")
+
+        try:
+            driver, table_index_dict = browser_future.result()
+        except ChromeDriverVersionMismatchException as e:
+            prog.error(str(e))
+            return
+        prog.step("브라우저 준비 완료")
+
+        tdm.chrome.fill_individual_test_message(
+            driver, table_index_dict,
+            student_name, class_name, test_name, test_score, test_average,
+            makeup_test_check, makeup_test_date, prog, holidays,
+        )
+        filled = True
+        prog.step("메시지 작성 완료")
+
+        prog.done("점수가 저장되었습니다. 시험 결과 메시지를 확인하고 전송해주세요.")
+    except Exception:
+        prog.error("예상치 못한 오류가 발생했습니다.", detail=traceback.format_exc())
+    finally:
+        # 저장 실패 시 띄워 둔 브라우저 정리
+        if browser_future is not None and not filled:
+            try:
+                browser_future.result()[0].quit()
+            except Exception:
+                pass
+        browser_executor.shutdown(wait=False)
+
+
 ####################################### 데이터 요청 API #######################################
 
 @server.method()
@@ -729,7 +1186,7 @@ async def get_startup_messages(ctx: RPCContext) -> Dict[str, Any]:
 @server.method()
 async def get_datafile_data(ctx: RPCContext, mocktest = False) -> Dict[Any, Any]:
     try:
-        return {"ok": True, "data": tdm.datafile.get_data_sorted_dict(mocktest)}
+        return {"ok": True, "data": await run_locked(FILE_IO, tdm.datafile.get_data_sorted_dict, mocktest, reads=(DATA_FILE,))}
     except Exception as e:
         return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
 
@@ -737,7 +1194,7 @@ async def get_datafile_data(ctx: RPCContext, mocktest = False) -> Dict[Any, Any]
 @server.method()
 async def get_aisosic_data(ctx: RPCContext):
     try:
-        return {"ok": True, "data": tdm.chrome.get_class_names()}
+        return {"ok": True, "data": await run_blocking(BROWSER, tdm.chrome.get_class_names)}
     except Exception as e:
         return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
 
@@ -745,7 +1202,7 @@ async def get_aisosic_data(ctx: RPCContext):
 @server.method()
 async def get_aisosic_student_data(ctx: RPCContext):
     try:
-        return {"ok": True, "data": tdm.chrome.get_class_student_dict()}
+        return {"ok": True, "data": await run_blocking(BROWSER, tdm.chrome.get_class_student_dict)}
     except Exception as e:
         return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
 
@@ -753,8 +1210,10 @@ async def get_aisosic_student_data(ctx: RPCContext):
 @server.method()
 async def check_aisosic_difference(ctx: RPCContext):
     try:
-        aisosic = tdm.chrome.get_class_student_dict()
-        datafile_raw = tdm.datafile.get_data_sorted_dict()
+        aisosic, datafile_raw = await asyncio.gather(
+            run_blocking(BROWSER, tdm.chrome.get_class_student_dict),
+            run_locked(FILE_IO, tdm.datafile.get_data_sorted_dict, reads=(DATA_FILE,)),
+        )
         if isinstance(datafile_raw, (list, tuple)) and len(datafile_raw) >= 1:
             datafile = datafile_raw[0]
         else:
@@ -778,7 +1237,81 @@ async def check_aisosic_difference(ctx: RPCContext):
 @server.method()
 async def get_makeuptest_data(ctx: RPCContext):
     try:
-        return {"ok": True, "data": tdm.makeuptest.get_studnet_test_index_dict()}
+        return {"ok": True, "data": await run_locked(FILE_IO, tdm.makeuptest.get_studnet_test_index_dict, reads=(MAKEUP_TEST_LIST,))}
+    except Exception as e:
+        return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
+
+
+def _parse_roster_date(date: str) -> datetime:
+    try:
+        return datetime.strptime(date.strip()[:10], "%Y-%m-%d")
+    except (AttributeError, ValueError):
+        raise ValueError(f"날짜 형식이 올바르지 않습니다: {date} (YYYY-MM-DD)")
+
+
+@server.method()
+async def get_makeup_test_capacity(ctx: RPCContext):
+    return {"ok": True, "data": tdm.config.MAKEUP_TEST_CAPACITY}
+
+
+@server.method()
+async def set_makeup_test_capacity(ctx: RPCContext, capacity: Dict[str, Any]):
+    """capacity: {"월": 20, "월 16": 8} (요일 또는 "요일 시간"별 재시험 정원)"""
+    try:
+        tdm.config.set_makeup_test_capacity(capacity)
+        return {"ok": True, "data": tdm.config.MAKEUP_TEST_CAPACITY}
+    except Exception as e:
+        return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
+
+
+@server.method()
+async def get_backup_usage(ctx: RPCContext):
+    try:
+        data = await run_locked(FILE_IO, tdm.backup.backup_usage, reads=(DATA_FILE, CLASS_INFO))
+        data["retention"] = tdm.config.BACKUP_RETENTION
+        return {"ok": True, "data": data}
+    except Exception as e:
+        return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
+
+
+@server.method()
+async def set_backup_retention(ctx: RPCContext, retention: Dict[str, Any], prune: bool = True):
+    """retention: {"hourly": 24, "daily": 30, "monthly": 0} (monthly 0은 계속 보관)"""
+    try:
+        tdm.config.set_backup_retention(retention)
+        removed = await run_locked(FILE_IO, tdm.backup.prune_backups, writes=(DATA_FILE, CLASS_INFO)) if prune else []
+        return {"ok": True, "data": {"retention": tdm.config.BACKUP_RETENTION, "removed": len(removed)}}
+    except Exception as e:
+        return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
+
+
+@server.method()
+async def prune_backups(ctx: RPCContext):
+    try:
+        removed = await run_locked(FILE_IO, tdm.backup.prune_backups, writes=(DATA_FILE, CLASS_INFO))
+        return {"ok": True, "data": {"removed": len(removed)}}
+    except Exception as e:
+        return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
+
+
+@server.method()
+async def get_makeup_test_roster(ctx: RPCContext, date: str, by_test_date: bool = False):
+    """date: "YYYY-MM-DD" -> 재시 날짜(또는 응시일)가 date인 학생을 응시 시간별로 묶은 명단"""
+    try:
+        column = MakeupTestList.TEST_DATE_COLUMN if by_test_date else MakeupTestList.MAKEUPTEST_DATE_COLUMN
+        data = await run_locked(FILE_IO, tdm.makeuptest.get_makeup_test_roster, _parse_roster_date(date), column, reads=(MAKEUP_TEST_LIST, STUDENT_INFO))
+        return {"ok": True, "data": data}
+    except Exception as e:
+        return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
+
+
+@server.method()
+async def export_makeup_test_roster(ctx: RPCContext, date: str, open_file: bool = True):
+    try:
+        path = await run_locked(FILE_IO, tdm.makeuptest.export_makeup_test_roster, _parse_roster_date(date), reads=(MAKEUP_TEST_LIST, STUDENT_INFO))
+        if open_file:
+            _open_path_cross_platform(path)
+        return {"ok": True, "path": path}
     except Exception as e:
         return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
 
@@ -786,7 +1319,7 @@ async def get_makeuptest_data(ctx: RPCContext):
 @server.method()
 async def get_class_list(ctx: RPCContext):
     try:
-        return {"ok": True, "data": tdm.classinfo.get_class_names()}
+        return {"ok": True, "data": await run_locked(FILE_IO, tdm.classinfo.get_class_names, reads=(CLASS_INFO,))}
     except Exception as e:
         return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
 
@@ -794,7 +1327,7 @@ async def get_class_list(ctx: RPCContext):
 @server.method()
 async def get_class_info(ctx: RPCContext, class_name:str):
     try:
-        return {"ok": True, "data": tdm.classinfo.get_class_info(class_name)}
+        return {"ok": True, "data": await run_locked(FILE_IO, tdm.classinfo.get_class_info, class_name, reads=(CLASS_INFO,))}
     except Exception as e:
         return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
 
@@ -802,7 +1335,7 @@ async def get_class_info(ctx: RPCContext, class_name:str):
 @server.method()
 async def get_new_class_list(ctx: RPCContext):
     try:
-        return {"ok": True, "data": tdm.classinfo.get_new_class_names()}
+        return {"ok": True, "data": await run_locked(FILE_IO, tdm.classinfo.get_new_class_names, reads=(CLASS_INFO,))}
     except Exception as e:
         return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
 
@@ -810,7 +1343,7 @@ async def get_new_class_list(ctx: RPCContext):
 @server.method()
 async def is_cell_empty(ctx: RPCContext, row:int, col:int):
     try:
-        empty, value = tdm.datafile.is_cell_empty(row, col)
+        empty, value = await run_locked(FILE_IO, tdm.datafile.is_cell_empty, row, col, reads=(DATA_FILE,))
         return {"ok": True, "empty": empty, "value": value}
     except Exception as e:
             return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
@@ -868,165 +1401,194 @@ async def open_url(ctx: RPCContext, url: str) -> Dict[str, Any]:
 
 
 @server.method()
-async def start_send_exam_message(ctx: RPCContext, filename: str, b64: str, makeup_test_date: Dict[str, Any]) -> Dict[str, Any]:
-    job_id = str(uuid.uuid4())
-
-    make_emit(job_id)({
-        "ts": time.time(),
-        "step": 0,
-        "total": 3,
-        "level": "info",
-        "status": "running",
-        "message": "작업 대기 중...",
-        "warnings": [],
-    })
+async def start_send_exam_message(
+    ctx: RPCContext,
+    filename: str,
+    makeup_test_date: Dict[str, Any],
+    b64: str = "",
+    token: str = "",
+    backend: str = "selenium",
+    holidays: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    `token`(파일 선택창) 또는 `b64`(드래그 앤 드롭 업로드) 중 하나로 데이터 양식 전달
 
-    ctx_mp = multiprocessing.get_context("spawn")
-    q = ctx_mp.Queue()
-    proc = ctx_mp.Process(
-        target=_send_exam_message_job_process,
-        kwargs={
-            "job_id": job_id,
-            "q": q,
-            "filename": filename,
-            "b64": b64,
+    `holidays`: 휴일 선택 창에서 고른 휴일 ("YYYY-MM-DD")
+    """
+    job_id = str(uuid.uuid4())
+    try:
+        upload = _upload_kwargs(filename, b64, token)
+    except FileNotFoundError as e:
+        return _fail_job(job_id, str(e))
+
+    return _submit_job(
+        job_id,
+        _send_exam_message_job_process,
+        {
+            **upload,
             "makeup_test_date": makeup_test_date,
+            "backend": backend,
+            "holidays": holidays or [],
         },
-        daemon=True,
-    )
-    progress_queues[job_id] = q
-    job_processes[job_id] = proc
-    job_process_started_at[job_id] = time.time()
-    job_process_seen_payload[job_id] = False
-    listener = threading.Thread(
-        target=_queue_listener,
-        args=(job_id, q, proc),
-        daemon=True,
+        total=_send_exam_total(backend),
+        message="작업 대기 중...",
+        # 재시험 일정 배정이 재시험 명단에 이미 잡힌 재시험을 읽음
+        reads=(STUDENT_INFO, MAKEUP_TEST_LIST),
     )
-    progress_listeners[job_id] = listener
-    listener.start()
+
+
+@server.method()
+async def preview_exam_message(
+    ctx: RPCContext,
+    filename: str,
+    makeup_test_date: Dict[str, Any],
+    b64: str = "",
+    token: str = "",
+    holidays: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """브라우저 없이 작성될 메시지를 계산하여 json/html 보고서로 저장"""
+    tmp_file: Optional[Path] = None
     try:
-        proc.start()
-    except Exception:
-        make_emit(job_id)({
-            "ts": time.time(),
-            "step": 0,
-            "total": 0,
-            "level": "error",
-            "status": "error",
-            "message": "send_exam_message process failed to start.",
-            "warnings": [],
-        })
+        tmp_file = _materialize_upload(**_upload_kwargs(filename, b64, token, consume=False))
 
-    return {"job_id": job_id}
+        try:
+            await run_blocking(FILE_IO, tdm.dataform.data_validation, str(tmp_file))
+        except tdm.dataform.DataValidationException as exc:
+            return {"ok": False, "error": f"데이터 검증 오류가 발생하였습니다:\n{exc}"}
+
+        makeup_test_date = {k: datetime.strptime(v, "%Y-%m-%d") for k, v in makeup_test_date.items()}
+
+        plan, json_path, html_path = await run_locked(FILE_IO, tdm.messageplan.dry_run, str(tmp_file), makeup_test_date, holidays=holidays, reads=(STUDENT_INFO, MAKEUP_TEST_LIST))
+        report = plan.to_dict()
+        return {
+            "ok": True,
+            "summary": report["summary"],
+            "warnings": report["warnings"],
+            "json_path": json_path,
+            "html_path": html_path,
+        }
+    except Exception as e:
+        return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
+    finally:
+        if tmp_file:
+            _cleanup_temp(tmp_file)
 
 
 @server.method()
-async def start_save_exam(ctx: RPCContext, filename: str, b64: str, makeup_test_date: Dict[str, Any]) -> Dict[str, Any]:
+async def start_save_exam(
+    ctx: RPCContext,
+    filename: str,
+    makeup_test_date: Dict[str, Any],
+    b64: str = "",
+    token: str = "",
+    holidays: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    `token`(파일 선택창) 또는 `b64`(드래그 앤 드롭 업로드) 중 하나로 데이터 양식 전달
+
+    `holidays`: 휴일 선택 창에서 고른 휴일 ("YYYY-MM-DD")
+    """
     job_id = str(uuid.uuid4())
+    try:
+        upload = _upload_kwargs(filename, b64, token)
+    except FileNotFoundError as e:
+        return _fail_job(job_id, str(e))
+
+    return _submit_job(
+        job_id,
+        _save_exam_job_process,
+        {
+            **upload,
+            "makeup_test_date": makeup_test_date,
+            "holidays": holidays or [],
+        },
+        total=4,
+        message="작업 대기 중...",
+        reads=(STUDENT_INFO,),
+        writes=(DATA_FILE, MAKEUP_TEST_LIST),
+    )
 
-    make_emit(job_id)({
-        "ts": time.time(),
-        "step": 0,
-        "total": 4,
-        "level": "info",
-        "status": "running",
-        "message": "작업 대기 중...",
-        "warnings": [],
-    })
 
-    ctx_mp = multiprocessing.get_context("spawn")
-    q = ctx_mp.Queue()
-    proc = ctx_mp.Process(
-        target=_save_exam_job_process,
-        kwargs={
-            "job_id": job_id,
-            "q": q,
-            "filename": filename,
-            "b64": b64,
+@server.method()
+async def start_save_and_send_exam(
+    ctx: RPCContext,
+    filename: str,
+    makeup_test_date: Dict[str, Any],
+    b64: str = "",
+    token: str = "",
+    save_data: bool = True,
+    save_makeup: bool = True,
+    send_message: bool = True,
+    backend: str = "selenium",
+    holidays: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """데이터 저장과 메시지 작성을 한 번의 양식 검증/파싱으로 처리 (단계별 생략 가능)"""
+    job_id = str(uuid.uuid4())
+    if not (save_data or save_makeup or send_message):
+        return _fail_job(job_id, "실행할 단계가 없습니다.")
+    try:
+        upload = _upload_kwargs(filename, b64, token)
+    except FileNotFoundError as e:
+        return _fail_job(job_id, str(e))
+
+    writes = tuple(name for name, enabled in ((DATA_FILE, save_data), (MAKEUP_TEST_LIST, save_makeup)) if enabled)
+    return _submit_job(
+        job_id,
+        _save_and_send_job_process,
+        {
+            **upload,
             "makeup_test_date": makeup_test_date,
+            "save_data": save_data,
+            "save_makeup": save_makeup,
+            "send_message": send_message,
+            "backend": backend,
+            "holidays": holidays or [],
         },
-        daemon=True,
+        total=_save_and_send_total(save_data, save_makeup, send_message, backend),
+        message="작업 대기 중...",
+        # 재시험 일정 배정이 재시험 명단에 이미 잡힌 재시험을 읽음
+        reads=(STUDENT_INFO, MAKEUP_TEST_LIST),
+        writes=writes,
     )
-    progress_queues[job_id] = q
-    job_processes[job_id] = proc
-    job_process_started_at[job_id] = time.time()
-    job_process_seen_payload[job_id] = False
-    listener = threading.Thread(
-        target=_queue_listener,
-        args=(job_id, q, proc),
-        daemon=True,
-    )
-    progress_listeners[job_id] = listener
-    listener.start()
-    try:
-        proc.start()
-    except Exception:
-        make_emit(job_id)({
-            "ts": time.time(),
-            "step": 0,
-            "total": 0,
-            "level": "error",
-            "status": "error",
-            "message": "save_exam process failed to start.",
-            "warnings": [],
-        })
-
-    return {"job_id": job_id}
 
 
 @server.method()
 async def start_update_class(ctx: RPCContext) -> Dict[str, Any]:
-    job_id = str(uuid.uuid4())
+    return _submit_job(
+        str(uuid.uuid4()),
+        _update_class_job_process,
+        {},
+        total=6,
+        message="반 업데이트 준비중...",
+        writes=(DATA_FILE, CLASS_INFO),
+    )
 
-    make_emit(job_id)({
-        "ts": time.time(),
-        "step": 0,
-        "total": 6,
-        "level": "info",
-        "status": "running",
-        "message": "반 업데이트 준비중...",
-        "warnings": [],
-    })
 
-    ctx_mp = multiprocessing.get_context("spawn")
-    q = ctx_mp.Queue()
-    proc = ctx_mp.Process(
-        target=_update_class_job_process,
-        kwargs={"job_id": job_id, "q": q},
-        daemon=True,
-    )
-    progress_queues[job_id] = q
-    job_processes[job_id] = proc
-    job_process_started_at[job_id] = time.time()
-    job_process_seen_payload[job_id] = False
-    listener = threading.Thread(
-        target=_queue_listener,
-        args=(job_id, q, proc),
-        daemon=True,
+@server.method()
+async def start_archive_makeup_tests(ctx: RPCContext, after_days: Optional[int] = None) -> Dict[str, Any]:
+    return _submit_job(
+        str(uuid.uuid4()),
+        _archive_makeup_test_job_process,
+        {"after_days": MakeupTestList.ARCHIVE_AFTER_DAYS if after_days is None else int(after_days)},
+        total=1,
+        message="재시험 명단 보관 준비중...",
+        writes=(MAKEUP_TEST_LIST,),
     )
-    progress_listeners[job_id] = listener
-    listener.start()
-    try:
-        proc.start()
-    except Exception:
-        make_emit(job_id)({
-            "ts": time.time(),
-            "step": 0,
-            "total": 0,
-            "level": "error",
-            "status": "error",
-            "message": "update_class process failed to start.",
-            "warnings": [],
-        })
 
-    return {"job_id": job_id}
+
+@server.method()
+async def search_makeup_archive(ctx: RPCContext, student_name: str = "", class_name: str = "", test_name: str = ""):
+    try:
+        data = await run_locked(FILE_IO, tdm.makeuparchive.search_archive, student_name, class_name, test_name, reads=(MAKEUP_TEST_LIST,))
+        return {"ok": True, "data": data}
+    except Exception as e:
+        return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
 
 
 @server.method()
 async def make_class_info(ctx: RPCContext):
     try:
-        tdm.classinfo.make_file()
+        await run_locked(FILE_IO, tdm.classinfo.make_file, writes=(CLASS_INFO,))
         return {"ok": True, "path": str(Path(tdm.config.DATA_DIR) / '반 정보.xlsx')}
     except Exception as e:
         return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
@@ -1043,7 +1605,7 @@ async def make_data_file(ctx: RPCContext):
         if not tdm.config.DATA_FILE_NAME:
             return {"ok": False, "error": "config.json의 dataFileName을 설정해 주세요."}
 
-        tdm.datafile.make_file()
+        await run_locked(FILE_IO, tdm.datafile.make_file, reads=(CLASS_INFO,), writes=(DATA_FILE,))
         return {"ok": True}
     except Exception as e:
         return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
@@ -1052,7 +1614,7 @@ async def make_data_file(ctx: RPCContext):
 @server.method()
 async def make_student_info(ctx: RPCContext):
     try:
-        tdm.studentinfo.make_file()
+        await run_locked(FILE_IO, tdm.studentinfo.make_file, writes=(STUDENT_INFO,))
         return {"ok": True, "path": str(Path(tdm.config.DATA_DIR) / '학생 정보.xlsx')}
     except Exception as e:
         return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
@@ -1061,7 +1623,7 @@ async def make_student_info(ctx: RPCContext):
 @server.method()
 async def make_data_form(ctx: RPCContext):
     try:
-        tdm.dataform.make_file()
+        await run_blocking(FILE_IO, tdm.dataform.make_file)
         return {"ok": True}
     except Exception as e:
         return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
@@ -1070,7 +1632,7 @@ async def make_data_form(ctx: RPCContext):
 @server.method()
 async def reapply_conditional_format(ctx: RPCContext):
     try:
-        warnings = tdm.datafile.conditional_formatting()
+        warnings = await run_locked(EXCEL, tdm.datafile.conditional_formatting, reads=(STUDENT_INFO,), writes=(DATA_FILE,))
         return {"ok": True, "warnings": warnings}
     except Exception as e:
         return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
@@ -1079,7 +1641,7 @@ async def reapply_conditional_format(ctx: RPCContext):
 @server.method()
 async def update_student_info(ctx: RPCContext):
     try:
-        tdm.studentinfo.update_student()
+        await run_locked(FILE_IO, tdm.studentinfo.update_student, writes=(STUDENT_INFO,))
         return {"ok": True}
     except Exception as e:
         return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
@@ -1088,12 +1650,13 @@ async def update_student_info(ctx: RPCContext):
 @server.method()
 async def add_student(ctx: RPCContext, target_student_name, target_class_name):
     try:
-        if not tdm.chrome.check_student_exists(target_student_name, target_class_name):
+        if not await run_blocking(BROWSER, tdm.chrome.check_student_exists, target_student_name, target_class_name):
             return {"ok": False, "error": f"아이소식에 {target_student_name} 학생이 {target_class_name} 반에 업데이트 되지 않아 중단되었습니다."}
 
-        warnings = tdm.datafile.add_student(target_student_name, target_class_name)
+        async with file_lock(reads=(CLASS_INFO,), writes=(DATA_FILE, STUDENT_INFO)):
+            warnings = await run_blocking(FILE_IO, tdm.datafile.add_student, target_student_name, target_class_name)
 
-        tdm.studentinfo.add_student(target_student_name)
+            await run_blocking(FILE_IO, tdm.studentinfo.add_student, target_student_name)
 
         return {"ok": True, "warnings": warnings}
     except Exception as e:
@@ -1103,10 +1666,11 @@ async def add_student(ctx: RPCContext, target_student_name, target_class_name):
 @server.method()
 async def remove_student(ctx: RPCContext, target_class_name, target_student_name):
     try:
-        tdm.datafile.delete_student(target_class_name, target_student_name)
+        async with file_lock(writes=(DATA_FILE, STUDENT_INFO)):
+            await run_blocking(FILE_IO, tdm.datafile.delete_student, target_class_name, target_student_name)
 
-        if not tdm.datafile.check_student_exist:
-            tdm.studentinfo.delete_student(target_student_name)
+            if not tdm.datafile.check_student_exist:
+                await run_blocking(FILE_IO, tdm.studentinfo.delete_student, target_student_name)
 
         return {"ok": True}
     except Exception as e:
@@ -1116,10 +1680,10 @@ async def remove_student(ctx: RPCContext, target_class_name, target_student_name
 @server.method()
 async def move_student(ctx: RPCContext, target_student_name, target_class_name, current_class_name):
     try:
-        if not tdm.chrome.check_student_exists(target_student_name, target_class_name):
+        if not await run_blocking(BROWSER, tdm.chrome.check_student_exists, target_student_name, target_class_name):
             return {"ok": False, "error": f"아이소식에 {target_student_name} 학생이 {target_class_name} 반에 업데이트 되지 않아 중단되었습니다."}
 
-        tdm.datafile.move_student(target_student_name, target_class_name, current_class_name)
+        await run_locked(FILE_IO, tdm.datafile.move_student, target_student_name, target_class_name, current_class_name, reads=(CLASS_INFO,), writes=(DATA_FILE,))
 
         return {"ok": True}
     except Exception as e:
@@ -1129,9 +1693,10 @@ async def move_student(ctx: RPCContext, target_student_name, target_class_name,
 @server.method()
 async def change_class_info(ctx: RPCContext, target_class_name, target_teacher_name):
     try:
-        tdm.classinfo.change_class_info(target_class_name, target_teacher_name)
+        async with file_lock(writes=(CLASS_INFO, DATA_FILE)):
+            await run_blocking(FILE_IO, tdm.classinfo.change_class_info, target_class_name, target_teacher_name)
 
-        tdm.datafile.change_class_info(target_class_name, target_teacher_name)
+            await run_blocking(FILE_IO, tdm.datafile.change_class_info, target_class_name, target_teacher_name)
 
         return {"ok": True}
     except Exception as e:
@@ -1141,7 +1706,7 @@ async def change_class_info(ctx: RPCContext, target_class_name, target_teacher_n
 @server.method()
 async def make_temp_class_info(ctx: RPCContext, new_class_list):
     try:
-        filepath = tdm.classinfo.make_temp_file_for_update(new_class_list)
+        filepath = await run_locked(FILE_IO, tdm.classinfo.make_temp_file_for_update, new_class_list, writes=(CLASS_INFO,))
         return {"ok": True, "path": filepath}
     except Exception as e:
         return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
@@ -1149,67 +1714,78 @@ async def make_temp_class_info(ctx: RPCContext, new_class_list):
 
 @server.method()
 async def update_class(ctx: RPCContext):
-    try:
-        tdm.datafile.update_class()
-        tdm.classinfo.update_class()
-        return {"ok": True}
-    except Exception as e:
-        return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
-    finally:
+    async with file_lock(writes=(DATA_FILE, CLASS_INFO)):
         try:
-            tdm.classinfo.delete_temp()
-        except:
-            pass
+            await run_blocking(EXCEL, tdm.datafile.update_class)
+            await run_blocking(FILE_IO, tdm.classinfo.update_class)
+            return {"ok": True}
+        except Exception as e:
+            return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
+        finally:
+            try:
+                tdm.classinfo.delete_temp()
+            except:
+                pass
 
 
 @server.method()
 async def delete_class_info_temp(ctx: RPCContext):
     try:
-        tdm.classinfo.delete_temp()
+        await run_locked(FILE_IO, tdm.classinfo.delete_temp, writes=(CLASS_INFO,))
         return {"ok": True}
     except Exception as e:
         return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
 
 
 @server.method()
-async def save_individual_result(ctx: RPCContext, student_name:str, class_name:str, test_name:str, target_row:int, target_col:int, test_score:int|float, makeup_test_check:bool, makeup_test_date:dict):
-    try:
-        job_id = str(uuid.uuid4())
-        emit = make_emit(job_id)
-        prog = Progress(emit, total=3)
-
-        prog_warnings: list[str] = []
-        _orig_warning = prog.warning
-
-        def _capture_warning(msg: str):
-            try:
-                prog_warnings.append(str(msg))
-            finally:
-                # 원래 동작(실시간 이벤트 전송)도 유지
-                _orig_warning(msg)
-
-        prog.warning = _capture_warning  # type: ignore[attr-defined]
-
-        for k, v in makeup_test_date.items():
-            makeup_test_date[k] = datetime.strptime(v, "%Y-%m-%d")
-
-        test_average = tdm.datafile.save_individual_test_data(target_row, target_col, test_score)
-
-        if test_score < 80 and not makeup_test_check:
-            tdm.makeuptest.save_individual_makeup_test(student_name, class_name, test_name, test_score, makeup_test_date, prog)
+async def start_save_individual_result(
+    ctx: RPCContext,
+    student_name: str,
+    class_name: str,
+    test_name: str,
+    target_row: int,
+    target_col: int,
+    test_score: int | float,
+    makeup_test_check: bool,
+    makeup_test_date: Dict[str, Any],
+    holidays: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    return _submit_job(
+        str(uuid.uuid4()),
+        _save_individual_result_job_process,
+        {
+            "student_name": student_name,
+            "class_name": class_name,
+            "test_name": test_name,
+            "target_row": target_row,
+            "target_col": target_col,
+            "test_score": test_score,
+            "makeup_test_check": makeup_test_check,
+            "makeup_test_date": makeup_test_date,
+            "holidays": holidays or [],
+        },
+        total=4,
+        message="작업 대기 중...",
+        reads=(STUDENT_INFO, CLASS_INFO),
+        writes=(DATA_FILE, MAKEUP_TEST_LIST),
+    )
 
-        tdm.chrome.send_individual_test_message(student_name, class_name, test_name, test_score, test_average, makeup_test_check, makeup_test_date, prog)
 
+@server.method()
+async def save_retest_result(ctx: RPCContext, target_row:int, makeup_test_score:str):
+    try:
+        await run_locked(FILE_IO, tdm.makeuptest.save_makeup_test_result, target_row, makeup_test_score, writes=(MAKEUP_TEST_LIST,))
         return {"ok": True}
     except Exception as e:
         return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
 
 
 @server.method()
-async def save_retest_result(ctx: RPCContext, target_row:int, makeup_test_score:str):
+async def save_retest_results(ctx: RPCContext, entries: List[Dict[str, Any]]):
+    """entries: [{"row", "score", "student_name", "test_name"}] -> 항목별 저장 결과"""
     try:
-        tdm.makeuptest.save_makeup_test_result(target_row, makeup_test_score)
-        return {"ok": True}
+        results = await run_locked(FILE_IO, tdm.makeuptest.save_makeup_test_results, entries, writes=(MAKEUP_TEST_LIST,))
+        return {"ok": True, "data": results}
     except Exception as e:
         return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
 
@@ -1237,8 +1813,8 @@ async def open_file_picker(ctx: RPCContext):
             return {"ok": False}
 
         path_obj = Path(selected_file)
-        file_b64 = base64.b64encode(path_obj.read_bytes()).decode()
+        token = _register_picked_file(path_obj)
 
-        return {"ok": True, "path": str(path_obj), "name": path_obj.name, "b64": file_b64}
+        return {"ok": True, "path": str(path_obj), "name": path_obj.name, "token": token}
     except Exception as e:
         return {"ok": False, "error": str(e), "detail": traceback.format_exc()}
@@ -0,0 +1,266 @@
+import ctypes
+import importlib
+import multiprocessing
+import multiprocessing.connection
+import os
+import threading
+import time
+import traceback
+from queue import Empty
+from typing import Any, Callable, Dict, Optional
+
+
+# 작업자가 시작할 때 미리 불러 둘 모듈 (openpyxl, selenium, bs4, win32com 등은 tdm 모듈이 함께 불러옴)
+PRELOAD_MODULES = (
+    "tdm.config",
+    "tdm.progress",
+    "tdm.backup",
+    "tdm.classinfo",
+    "tdm.chrome",
+    "tdm.datafile",
+    "tdm.dataform",
+    "tdm.studentinfo",
+    "tdm.makeuptest",
+    "tdm.makeupindex",
+    "tdm.makeuparchive",
+    "tdm.messageplan",
+)
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_MAX_JOBS = 20                       # 작업자 1개가 처리할 최대 작업 수
+DEFAULT_MAX_RSS_GROWTH = 300 * 1024 * 1024  # 시작 시점 대비 허용 메모리 증가량(byte)
+
+
+def _rss_bytes() -> Optional[int]:
+    """현재 프로세스 메모리 사용량(working set / RSS)"""
+    try:
+        if os.name == "nt":
+            from ctypes import wintypes
+
+            class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                _fields_ = [
+                    ("cb", wintypes.DWORD),
+                    ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t),
+                    ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t),
+                    ("PeakPagefileUsage", ctypes.c_size_t),
+                ]
+
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            handle = ctypes.windll.kernel32.GetCurrentProcess()
+            if not ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+                return None
+            return int(counters.WorkingSetSize)
+
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        return None
+
+
+class _JobQueue:
+    """작업 함수의 `q.put(payload)`를 작업자 결과 큐의 진행상태 메시지로 전달"""
+
+    def __init__(self, result_q: multiprocessing.Queue, job_id: str):
+        self.result_q = result_q
+        self.job_id = job_id
+
+    def put(self, payload: dict) -> None:
+        self.result_q.put(("progress", self.job_id, payload))
+
+
+def _worker_main(
+    worker_id: int,
+    job_q: multiprocessing.Queue,
+    result_q: multiprocessing.Queue,
+    max_jobs: int,
+    max_rss_growth: int,
+) -> None:
+    for name in PRELOAD_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            # 미리 불러오기는 최적화일 뿐이므로 실패해도 작업 시점에 다시 시도
+            pass
+
+    base_rss = _rss_bytes()
+    jobs_done = 0
+
+    while True:
+        job = job_q.get()
+        if job is None:
+            result_q.put(("exit", worker_id, "shutdown"))
+            return
+
+        job_id, module_name, func_name, kwargs = job
+        result_q.put(("start", worker_id, job_id))
+        failed = False
+        try:
+            # 작업자가 떠 있는 동안 변경된 설정 반영
+            importlib.import_module("tdm.config").reload()
+            func = getattr(importlib.import_module(module_name), func_name)
+            func(job_id=job_id, q=_JobQueue(result_q, job_id), **kwargs)
+        except Exception:
+            failed = True
+            result_q.put(("progress", job_id, {
+                "ts": time.time(),
+                "step": 0,
+                "total": 0,
+                "level": "error",
+                "status": "error",
+                "message": "예상치 못한 오류가 발생했습니다.",
+                "error": "예상치 못한 오류가 발생했습니다.",
+                "detail": traceback.format_exc(),
+            }))
+        result_q.put(("end", worker_id, job_id, failed))
+
+        jobs_done += 1
+        if jobs_done >= max_jobs:
+            result_q.put(("exit", worker_id, "max_jobs"))
+            return
+        rss = _rss_bytes()
+        if base_rss is not None and rss is not None and rss - base_rss > max_rss_growth:
+            result_q.put(("exit", worker_id, "memory"))
+            return
+
+
+class _Worker:
+    def __init__(self, worker_id: int, proc: multiprocessing.Process, result_q: multiprocessing.Queue):
+        self.worker_id = worker_id
+        self.proc = proc
+        self.result_q = result_q
+        self.current_job: Optional[str] = None
+
+
+class WorkerPool:
+    """
+    미리 띄워 둔 작업자 프로세스 풀
+
+    - 작업자는 시작 시 `PRELOAD_MODULES`를 불러 두고 공유 큐에서 작업을 받아 실행
+    - 진행상태는 작업자별 결과 큐로 전달되고, 디스패처 스레드 1개가 모든 결과 큐와 프로세스 sentinel을
+      `multiprocessing.connection.wait`로 함께 기다리다가 `on_progress(job_id, payload)`로 전달
+    - 작업이 끝나면 `on_job_end(job_id, failed)` 호출 (작업자 비정상 종료 시 `failed=True`)
+    - `max_jobs`개 작업을 처리했거나 메모리가 `max_rss_growth`만큼 늘어난 작업자는 스스로 종료하고 새 작업자로 교체
+    """
+
+    def __init__(
+        self,
+        on_progress: Callable[[str, dict], None],
+        on_job_end: Callable[[str, bool], None],
+        size: int = DEFAULT_POOL_SIZE,
+        max_jobs: int = DEFAULT_MAX_JOBS,
+        max_rss_growth: int = DEFAULT_MAX_RSS_GROWTH,
+    ):
+        self.on_progress = on_progress
+        self.on_job_end = on_job_end
+        self.size = size
+        self.max_jobs = max_jobs
+        self.max_rss_growth = max_rss_growth
+
+        self._ctx = multiprocessing.get_context("spawn")
+        self._job_q = self._ctx.Queue()
+        self._workers: Dict[int, _Worker] = {}
+        self._lock = threading.Lock()
+        self._next_worker_id = 0
+        self._started = False
+        self._closing = False
+
+        # 작업자 목록이 바뀌었을 때 디스패처의 wait를 깨우는 파이프
+        self._wake_r, self._wake_w = self._ctx.Pipe(duplex=False)
+        self._dispatcher: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+            for _ in range(self.size):
+                self._spawn_locked()
+            self._dispatcher = threading.Thread(target=self._dispatch_loop, name="tdm-job-dispatcher", daemon=True)
+            self._dispatcher.start()
+
+    def _spawn_locked(self) -> _Worker:
+        worker_id = self._next_worker_id
+        self._next_worker_id += 1
+
+        result_q = self._ctx.Queue()
+        proc = self._ctx.Process(
+            target=_worker_main,
+            args=(worker_id, self._job_q, result_q, self.max_jobs, self.max_rss_growth),
+            daemon=True,
+        )
+        worker = _Worker(worker_id, proc, result_q)
+        proc.start()
+
+        self._workers[worker_id] = worker
+        self._wake_w.send(None)
+        return worker
+
+    def submit(self, job_id: str, func: Callable[..., Any], kwargs: Dict[str, Any]) -> None:
+        """`func(job_id=..., q=..., **kwargs)`를 작업자에서 실행하도록 대기열에 추가"""
+        self.start()
+        self._job_q.put((job_id, func.__module__, func.__name__, kwargs))
+
+    def _dispatch_loop(self) -> None:
+        while True:
+            with self._lock:
+                if self._closing and not self._workers:
+                    return
+                workers = list(self._workers.values())
+
+            readers = {worker.result_q._reader: worker for worker in workers}
+            sentinels = {worker.proc.sentinel: worker for worker in workers}
+            ready = multiprocessing.connection.wait([self._wake_r, *readers, *sentinels])
+
+            for conn in ready:
+                if conn is self._wake_r:
+                    self._wake_r.recv()
+                elif conn in readers:
+                    self._drain(readers[conn])
+
+            for conn in ready:
+                if conn in sentinels:
+                    # 종료 직전에 보낸 메시지까지 처리한 뒤 교체
+                    worker = sentinels[conn]
+                    self._drain(worker)
+                    worker.proc.join()
+                    self._retire(worker)
+
+    def _drain(self, worker: _Worker) -> None:
+        while True:
+            try:
+                msg = worker.result_q.get_nowait()
+            except (Empty, EOFError, OSError):
+                return
+            kind = msg[0]
+            if kind == "progress":
+                self.on_progress(msg[1], msg[2])
+            elif kind == "start":
+                worker.current_job = msg[2]
+            elif kind == "end":
+                worker.current_job = None
+                self.on_job_end(msg[2], msg[3])
+
+    def _retire(self, worker: _Worker) -> None:
+        if worker.current_job is not None:
+            # 작업 도중 작업자가 종료됨
+            self.on_job_end(worker.current_job, True)
+            worker.current_job = None
+
+        with self._lock:
+            self._workers.pop(worker.worker_id, None)
+            if not self._closing:
+                self._spawn_locked()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closing = True
+            workers = list(self._workers.values())
+        for _ in workers:
+            self._job_q.put(None)
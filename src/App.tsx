@@ -108,6 +108,7 @@ const groups: {
       { key: "send-exam-message", label: "시험 결과 메시지 전송", icon: MessageSquare },
       { key: "save-individual-exam", label: "개별 시험 결과 저장", icon: Save },
       { key: "save-retest", label: "재시험 결과 저장", icon: Save },
+      { key: "makeup-roster", label: "재시험 응시자 조회", icon: ClipboardList },
     ],
   },
   {
@@ -37,7 +37,7 @@ export default function HolidayDialog({
 }: {
   open: boolean;
   onOpenChange: (v: boolean) => void;
-  onConfirm: (result: WeekdayKRMap) => void;
+  onConfirm: (result: WeekdayKRMap, holidays: string[]) => void;
   title?: string;
   confirmText?: string;
   baseDate?: Date;
@@ -70,12 +70,16 @@ export default function HolidayDialog({
 
   const handleConfirm = () => {
     const out = {} as WeekdayKRMap;
+    const holidays: string[] = [];
     WEEKDAYS.forEach((w, idx) => {
       const d = new Date(initialMap[w]);
-      if (checked.has(idx)) d.setDate(d.getDate() + 7);
+      if (checked.has(idx)) {
+        holidays.push(fmt(initialMap[w])); // 휴일로 체크한 원래 날짜
+        d.setDate(d.getDate() + 7);
+      }
       out[w] = fmt(d); // ← 서버에 주기 좋은 문자열 포맷
     });
-    onConfirm(out);
+    onConfirm(out, holidays);
   };
 
   return (
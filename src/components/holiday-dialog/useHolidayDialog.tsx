@@ -20,6 +20,8 @@ type HolidayDialogContextValue = {
   openHolidayDialog: (opts?: HolidayDialogOptions) => Promise<WeekdayKRMap | null>;
   lastHolidaySelection: WeekdayKRMap | null;
   clearHolidaySelection: () => void;
+  // 선택 결과에서 휴일로 체크한 날짜('YYYY-MM-DD') 목록
+  holidaysOf: (selection: WeekdayKRMap | null) => string[];
 };
 
 const HolidayDialogContext = createContext<HolidayDialogContextValue | null>(null);
@@ -29,6 +31,7 @@ export function HolidayDialogProvider({ children }: { children: ReactNode }) {
   const [open, setOpen] = useState(false);
   const [dialogOptions, setDialogOptions] = useState<HolidayDialogOptions | undefined>(undefined);
   const [selection, setSelection] = useState<WeekdayKRMap | null>(null);
+  const holidaysRef = useRef(new WeakMap<WeekdayKRMap, string[]>());
 
   const settle = useCallback((result: WeekdayKRMap | null) => {
     const resolver = resolverRef.current;
@@ -39,7 +42,8 @@ export function HolidayDialogProvider({ children }: { children: ReactNode }) {
   }, []);
 
   const handleConfirm = useCallback(
-    (map: WeekdayKRMap) => {
+    (map: WeekdayKRMap, holidays: string[]) => {
+      holidaysRef.current.set(map, holidays);
       setSelection(map);
       settle(map);
     },
@@ -68,13 +72,19 @@ export function HolidayDialogProvider({ children }: { children: ReactNode }) {
 
   const clearHolidaySelection = useCallback(() => setSelection(null), []);
 
+  const holidaysOf = useCallback(
+    (map: WeekdayKRMap | null) => (map ? holidaysRef.current.get(map) ?? [] : []),
+    []
+  );
+
   const value = useMemo<HolidayDialogContextValue>(
     () => ({
       openHolidayDialog,
       lastHolidaySelection: selection,
       clearHolidaySelection,
+      holidaysOf,
     }),
-    [clearHolidaySelection, openHolidayDialog, selection]
+    [clearHolidaySelection, holidaysOf, openHolidayDialog, selection]
   );
 
   return (
@@ -6,6 +6,7 @@ export type ProgressLevel = "info" | "success" | "warning" | "error";
 export type ProgressStatus = "running" | "done" | "error" | "unknown";
 
 export type ProgressPayload = {
+  seq: number;
   step: number;
   total: number;
   phase_step?: number | null;
@@ -16,10 +17,13 @@ export type ProgressPayload = {
   error?: string;
   detail?: string;
   warnings: string[];
+  // 보관 한도를 넘어 서버에서 버려진 오래된 경고 수
+  warnings_dropped?: number;
   ts: number;
 };
 
 export const initialProgress: ProgressPayload = {
+  seq: 0,
   step: 0,
   total: 0,
   phase_step: null,
@@ -30,6 +34,7 @@ export const initialProgress: ProgressPayload = {
   error: "",
   detail: "",
   warnings: [],
+  warnings_dropped: 0,
   ts: 0,
 };
 
@@ -96,6 +101,7 @@ function isSameProgress(a: ProgressPayload, b: ProgressPayload) {
   const aLastWarn = a.warnings[a.warnings.length - 1];
   const bLastWarn = b.warnings[b.warnings.length - 1];
   return (
+    a.seq === b.seq &&
     a.step === b.step &&
     a.total === b.total &&
     a.phase_step === b.phase_step &&
@@ -111,28 +117,29 @@ function isSameProgress(a: ProgressPayload, b: ProgressPayload) {
   );
 }
 
+// 서버 wait_progress 대기 시간(초)보다 길게 잡아 long-poll 응답을 끊지 않는다.
+const WAIT_PROGRESS_TIMEOUT_S = 20;
+const WAIT_PROGRESS_CLIENT_TIMEOUT_MS = (WAIT_PROGRESS_TIMEOUT_S + 5) * 1000;
+
+/**
+ * 진행상태 구독
+ *
+ * `wait_progress` long-poll로 새 seq가 생길 때마다 즉시 갱신하고,
+ * 실패 시에만 `interval`부터 최대 5초까지 늘려가며 재시도한다.
+ */
 export function useProgressPoller(jobId?: string, interval = 500) {
   const [prog, setProg] = useState<ProgressPayload>(initialProgress);
   const timer = useRef<number | null>(null);
-  const failCount = useRef(0);
-  const lastSuccess = useRef(0);
   const delayRef = useRef(interval);
-  const inFlight = useRef(false);
-  const inFlightStartedAt = useRef(0);
-  const requestSeq = useRef(0);
-  const activeRequestId = useRef(0);
+  const lastSeqRef = useRef(0);
   const lastPayloadRef = useRef<ProgressPayload>(initialProgress);
 
   useEffect(() => {
     if (!jobId){
       setProg(initialProgress);
-      failCount.current = 0;
-      lastSuccess.current = 0;
       delayRef.current = interval;
+      lastSeqRef.current = 0;
       lastPayloadRef.current = initialProgress;
-      inFlight.current = false;
-      inFlightStartedAt.current = 0;
-      activeRequestId.current = 0;
       if (timer.current) {
         clearTimeout(timer.current);
         timer.current = null;
@@ -141,6 +148,7 @@ export function useProgressPoller(jobId?: string, interval = 500) {
     }
     if (timer.current) clearTimeout(timer.current);
     delayRef.current = interval;
+    lastSeqRef.current = 0;
     let cancelled = false;
 
     const schedule = (delayMs: number) => {
@@ -150,34 +158,19 @@ export function useProgressPoller(jobId?: string, interval = 500) {
 
     const tick = async () => {
       if (cancelled) return;
-      if (inFlight.current) {
-        const age = Date.now() - inFlightStartedAt.current;
-        if (age < Math.max(4_000, interval * 8)) {
-          schedule(delayRef.current);
-          return;
-        }
-        inFlight.current = false;
-      }
-      inFlight.current = true;
-      inFlightStartedAt.current = Date.now();
-      const requestId = ++requestSeq.current;
-      activeRequestId.current = requestId;
       try {
         const p = await rpcCallWithTimeout<Record<string, any>>(
-          "get_progress",
-          { job_id: jobId },
-          Math.max(3000, interval * 4),
+          "wait_progress",
+          { job_id: jobId, since_seq: lastSeqRef.current, timeout: WAIT_PROGRESS_TIMEOUT_S },
+          WAIT_PROGRESS_CLIENT_TIMEOUT_MS,
         );
-        if (activeRequestId.current !== requestId) {
-          return;
-        }
-        failCount.current = 0;
-        lastSuccess.current = Date.now();
+        if (cancelled) return;
         delayRef.current = interval;
 
         const status = (p?.status ?? "unknown") as ProgressStatus;
         const warnings = Array.isArray(p?.warnings) ? p.warnings.map((w: any) => String(w)) : [];
         const nextProg = {
+          seq: Number(p?.seq ?? 0),
           step: Number(p?.step ?? 0),
           total: Number(p?.total ?? 0),
           phase_step: p?.phase_step == null ? null : Number(p?.phase_step),
@@ -188,8 +181,10 @@ export function useProgressPoller(jobId?: string, interval = 500) {
           error: p?.error == null ? "" : String(p.error),
           detail: p?.detail == null ? "" : String(p.detail),
           warnings,
+          warnings_dropped: Number(p?.warnings_dropped ?? 0),
           ts: Number(p?.ts ?? Date.now()),
         } as ProgressPayload;
+        lastSeqRef.current = Math.max(lastSeqRef.current, nextProg.seq);
         if (!isSameProgress(lastPayloadRef.current, nextProg)) {
           lastPayloadRef.current = nextProg;
           setProg(nextProg);
@@ -198,14 +193,11 @@ export function useProgressPoller(jobId?: string, interval = 500) {
         if (status === "done" || status === "error") {
           return;
         }
-        schedule(delayRef.current);
+        // 서버가 새 진행상태가 생길 때까지 응답을 보류하므로 바로 다시 대기
+        schedule(0);
       } catch (e) {
-        if (activeRequestId.current !== requestId) {
-          return;
-        }
-        failCount.current += 1;
+        if (cancelled) return;
         const now = Date.now();
-        if (!lastSuccess.current) lastSuccess.current = now;
         delayRef.current = Math.min(delayRef.current * 2, 5_000);
         setProg((prev) => ({
           ...prev,
@@ -215,11 +207,6 @@ export function useProgressPoller(jobId?: string, interval = 500) {
           ts: now,
         }));
         schedule(delayRef.current);
-      } finally {
-        if (activeRequestId.current === requestId) {
-          inFlight.current = false;
-          inFlightStartedAt.current = 0;
-        }
       }
     };
 
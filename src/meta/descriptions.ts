@@ -56,6 +56,11 @@ export const descriptions: Record<tdmActionKey, ActionMeta> = {
     guide: "재시험 명단에 작성된 학생의 재시험 결과를 저장합니다.",
     steps: ["재시험 스코어 로드", "원점수 대비 비교", "최종 점수 산출", "머지/저장"],
   },
+  "makeup-roster": {
+    title: "재시험 응시자 조회",
+    guide: "선택한 날짜에 재시험을 보는 학생을 응시 시간별로 확인하고 엑셀 파일로 내보냅니다.",
+    steps: [],
+  },
   "reapply-conditional-format": {
     title: "데이터 파일 조건부 서식 재지정",
     guide: "데이터 파일의 조건부 서식을 재지정합니다.",
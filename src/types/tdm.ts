@@ -10,6 +10,7 @@ export type tdmActionKey =
   | "send-exam-message"
   | "save-individual-exam"
   | "save-retest"
+  | "makeup-roster"
   | "reapply-conditional-format"
   | "manage-student";
 
@@ -10,3 +10,19 @@ export async function fileToBase64(file: File): Promise<string> {
   }
   return btoa(binary)
 }
+
+// 파일 선택창으로 고른 파일은 내용 없이 이름과 서버 token만 보관
+const pickedFileTokens = new WeakMap<File, string>()
+
+export function pickedFile(name: string, token: string): File {
+  const file = new File([], name)
+  pickedFileTokens.set(file, token)
+  return file
+}
+
+// 작업 시작 RPC에 넘길 파일 정보 (파일 선택창: token, 드래그 앤 드롭: base64)
+export async function fileUploadParams(file: File): Promise<{ filename: string; token?: string; b64?: string }> {
+  const token = pickedFileTokens.get(file)
+  if (token) return { filename: file.name, token }
+  return { filename: file.name, b64: await fileToBase64(file) }
+}
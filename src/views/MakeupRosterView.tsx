@@ -0,0 +1,147 @@
+// src/views/MakeupRosterView.tsx (재시험 응시자 조회 화면)
+import { useEffect, useState } from "react";
+import type { ViewProps } from "@/types/tdm";
+import { rpc } from "pyloid-js";
+import { useAppDialog } from "@/components/app-dialog/AppDialogProvider";
+
+import { Card, CardContent } from "@/components/ui/card";
+import { Separator } from "@/components/ui/separator";
+import { Button } from "@/components/ui/button";
+import { Input } from "@/components/ui/input";
+import { ScrollArea } from "@/components/ui/scroll-area";
+import { Clock, FileDown, Loader2 } from "lucide-react";
+
+// 서버 응답 타입
+type RosterStudent = {
+  row: number;
+  student_name: string;
+  class_name: string;
+  test_name: string;
+  teacher_name: string | null;
+  test_date: string | null;
+  scored: boolean;
+  new_student: boolean;
+};
+type RosterSlot = { time: string; students: RosterStudent[] };
+type Roster = { date: string; count: number; slots: RosterSlot[] };
+
+const todayText = () => {
+  const d = new Date();
+  const mm = String(d.getMonth() + 1).padStart(2, "0");
+  const dd = String(d.getDate()).padStart(2, "0");
+  return `${d.getFullYear()}-${mm}-${dd}`;
+};
+
+export default function MakeupRosterView({ meta }: ViewProps) {
+  const dialog = useAppDialog();
+
+  const [date, setDate] = useState<string>(todayText());
+  const [roster, setRoster] = useState<Roster | null>(null);
+  const [loading, setLoading] = useState(false);
+  const [exporting, setExporting] = useState(false);
+
+  const loadRoster = async (target: string) => {
+    if (!target) return;
+    try {
+      setLoading(true);
+      const res = await rpc.call("get_makeup_test_roster", { date: target });
+      if (res?.ok) {
+        setRoster(res.data as Roster);
+      } else {
+        setRoster(null);
+        await dialog.error({ title: "재시험 명단 조회 실패", message: res?.error || "", detail: res?.detail });
+      }
+    } finally {
+      setLoading(false);
+    }
+  };
+
+  useEffect(() => {
+    loadRoster(date);
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [date]);
+
+  const handleExport = async () => {
+    try {
+      setExporting(true);
+      const res = await rpc.call("export_makeup_test_roster", { date });
+      if (!res?.ok) {
+        await dialog.error({ title: "재시험 명단 내보내기 실패", message: res?.error || "", detail: res?.detail });
+      }
+    } finally {
+      setExporting(false);
+    }
+  };
+
+  return (
+    <Card className="h-full rounded-2xl border-border/80 shadow-sm">
+      <CardContent className="flex h-full flex-col">
+        <div className="mb-3">
+          {meta?.guide && (
+            <p className="mt-1 text-sm text-muted-foreground">{meta.guide}</p>
+          )}
+        </div>
+        <Separator className="mb-4" />
+
+        <div className="mb-3 flex items-center gap-2">
+          <Input
+            type="date"
+            value={date}
+            onChange={(e) => setDate(e.target.value)}
+            className="h-9 w-44 rounded-lg"
+            disabled={loading}
+          />
+          <span className="text-sm text-muted-foreground">
+            {loading ? "불러오는 중…" : roster ? `${roster.count}명` : ""}
+          </span>
+        </div>
+
+        <div className="flex-1 rounded-lg border">
+          <ScrollArea className="h-[380px] w-full p-2">
+            {!loading && (roster?.slots.length ?? 0) === 0 && (
+              <div className="p-2 text-xs text-muted-foreground">이 날 재시험 응시자가 없습니다</div>
+            )}
+            {roster?.slots.map((slot) => (
+              <div key={slot.time} className="mb-3">
+                <div className="flex items-center gap-1 px-2 py-1 text-xs font-semibold text-muted-foreground">
+                  <Clock className="h-3 w-3" />
+                  {slot.time} ({slot.students.length}명)
+                </div>
+                <ul className="space-y-1">
+                  {slot.students.map((s) => (
+                    <li key={s.row} className="flex items-center gap-2 rounded-md px-2 py-1 text-xs hover:bg-accent">
+                      <span className={`w-20 shrink-0 font-medium ${s.new_student ? "text-blue-600" : ""}`}>{s.student_name}</span>
+                      <span className="flex-1 min-w-0 truncate">({s.class_name}) {s.test_name}</span>
+                      <span className="text-muted-foreground">{s.test_date ?? ""}</span>
+                      {s.scored && <span className="text-emerald-600">완료</span>}
+                    </li>
+                  ))}
+                </ul>
+              </div>
+            ))}
+          </ScrollArea>
+        </div>
+
+        <div className="mt-6 flex items-center justify-end gap-2">
+          <Button
+            className="rounded-xl"
+            variant="outline"
+            onClick={() => loadRoster(date)}
+            disabled={loading}
+          >
+            {loading ? "불러오는 중…" : "새로고침"}
+          </Button>
+          <Button
+            className="rounded-xl bg-black text-white"
+            onClick={handleExport}
+            disabled={loading || exporting || !roster || roster.count === 0}
+            title="이 날의 재시험 명단을 엑셀 파일로 저장합니다."
+          >
+            {exporting ? <Loader2 className="mr-2 h-4 w-4 animate-spin" /> : <FileDown className="mr-2 h-4 w-4" />}
+            {exporting ? "저장 중..." : "엑셀로 내보내기"}
+          </Button>
+        </div>
+      </CardContent>
+    </Card>
+  );
+}
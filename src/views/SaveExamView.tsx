@@ -6,7 +6,7 @@ import { Card, CardContent } from "@/components/ui/card";
 import { Separator } from "@/components/ui/separator";
 import { AlertTriangle, FileSpreadsheet, FileUp, Loader2, Play, Square, SquareCheck, X } from "lucide-react";
 import { rpc } from "pyloid-js";
-import { fileToBase64 } from "@/utils/rpc";
+import { fileUploadParams, pickedFile } from "@/utils/rpc";
 
 // 공통 진행 훅/시작 함수 (앞서 만든 표준 유틸)
 import { ProgressStatus, startJob, useProgressPoller, type ProgressPayload } from "@/lib/progress";
@@ -19,7 +19,7 @@ import useHolidayDialog from "@/components/holiday-dialog/useHolidayDialog";
 export default function SaveExamView({ meta, onAction }: ViewProps) {
   const dialog = useAppDialog()
   const { enforcePrereq } = usePrereq()
-  const { openHolidayDialog, lastHolidaySelection } = useHolidayDialog() 
+  const { openHolidayDialog, lastHolidaySelection, holidaysOf } = useHolidayDialog() 
 
   const [file, setFile] = useState<File | null>(null)
   const [dragging, setDragging] = useState(false)
@@ -55,16 +55,6 @@ export default function SaveExamView({ meta, onAction }: ViewProps) {
     if (first) setAcceptedFile(first)
   }
 
-  const base64ToFile = (b64: string, filename: string) => {
-    const binary = atob(b64)
-    const len = binary.length
-    const bytes = new Uint8Array(len)
-    for (let i = 0; i < len; i += 1) {
-      bytes[i] = binary.charCodeAt(i)
-    }
-    return new File([bytes], filename)
-  }
-
   const pickFromBackend = async () => {
     if (running || picking) return
     setPicking(true)
@@ -76,11 +66,11 @@ export default function SaveExamView({ meta, onAction }: ViewProps) {
         }
         return
       }
-      if (!res?.b64 || !res?.name) {
+      if (!res?.token || !res?.name) {
         await dialog.error({ title: "파일 선택 실패", message: "파일 정보를 받아오지 못했습니다." })
         return
       }
-      const selected = base64ToFile(res.b64, res.name)
+      const selected = pickedFile(res.name, res.token)
       setAcceptedFile(selected)
     } catch (err: any) {
       await dialog.error({ title: "파일 선택 실패", message: String(err?.message ?? err) })
@@ -123,12 +113,12 @@ export default function SaveExamView({ meta, onAction }: ViewProps) {
       }
       setPrecheckStatus("done")
       onAction?.("save-exam")
-      const b64 = await fileToBase64(file)
-      // filename: str, b64: str, makeup_test_date: Dict[str, Any]
+      const upload = await fileUploadParams(file)
+      // filename: str, makeup_test_date: Dict[str, Any], token?: str, b64?: str, holidays?: str[]
       const id = await startJob("start_save_exam", {
-        filename: file.name,
-        b64: b64,
-        makeup_test_date: sel
+        ...upload,
+        makeup_test_date: sel,
+        holidays: holidaysOf(sel),
       })
       setJobId(id)
       lastStatusRef.current = "running"
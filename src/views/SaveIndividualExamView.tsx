@@ -1,5 +1,5 @@
 // src/views/SaveIndividualExamView.tsx
-import { useEffect, useMemo, useState } from "react";
+import { useEffect, useMemo, useRef, useState } from "react";
 import type { ViewProps } from "@/types/tdm";
 import { rpc } from "pyloid-js";
 import { useAppDialog } from "@/components/app-dialog/AppDialogProvider";
@@ -12,6 +12,7 @@ import { ScrollArea } from "@/components/ui/scroll-area";
 import { Checkbox } from "@/components/ui/checkbox";
 import { User, BookCheck, Play, Loader2 } from "lucide-react";
 import useHolidayDialog from "@/components/holiday-dialog/useHolidayDialog";
+import { ProgressStatus, startJob, useProgressPoller, type ProgressPayload } from "@/lib/progress";
 
 type ClassInfo = { id?: string; name: string };
 type StudentItem = { id: string; name: string; className: string }; // id = rowIndex(string)
@@ -22,7 +23,7 @@ type ClassTestDict    = Record<string, Record<string, number>>; // {class: {test
 
 export default function SaveIndividualExamView({ onAction, meta }: ViewProps) {
   const dialog = useAppDialog();
-  const { openHolidayDialog, lastHolidaySelection } = useHolidayDialog()
+  const { openHolidayDialog, lastHolidaySelection, holidaysOf } = useHolidayDialog()
 
   // 서버 맵(그대로 보관)
   const [classStudentMap, setClassStudentMap] = useState<ClassStudentDict>({});
@@ -46,6 +47,10 @@ export default function SaveIndividualExamView({ onAction, meta }: ViewProps) {
   const [loading, setLoading] = useState(false);
   const [running, setRunning] = useState(false);
 
+  const [jobId, setJobId] = useState<string>();
+  const prog: ProgressPayload = useProgressPoller(jobId);
+  const lastStatusRef = useRef<ProgressStatus>("unknown");
+
   const filteredTests = useMemo(() => {
     const q = testQuery.trim().toLowerCase();
     if (!q) return tests;
@@ -213,8 +218,8 @@ export default function SaveIndividualExamView({ onAction, meta }: ViewProps) {
       }
       setRunning(true);
       onAction?.("save-individual-exam");
-      //student_name:str, class_name:str, test_name:str, target_row:int, target_col:int, test_score:int|float, makeup_test_check:bool, makeup_test_date:dict
-      const res = await rpc.call("save_individual_result", {
+      //student_name:str, class_name:str, test_name:str, target_row:int, target_col:int, test_score:int|float, makeup_test_check:bool, makeup_test_date:dict, holidays:str[]
+      const id = await startJob("start_save_individual_result", {
         student_name:      studentName,
         class_name:        klass,
         test_name:         testName.slice(11),
@@ -223,21 +228,46 @@ export default function SaveIndividualExamView({ onAction, meta }: ViewProps) {
         test_score:        scoreNum,
         makeup_test_check: !makeupChecked, //
         makeup_test_date:  sel,
-      }); // {ok:true} 기대
-      if (res?.ok) {
-        await dialog.confirm({ title: "완료", message: "점수가 저장되었습니다.\n시험 결과 메시지를 확인하고 전송해주세요." });
-        setQuery("");
-        loadData();
-      } else {
-        await dialog.error({ title: "개별 시험 결과 저장 실패", message: res?.error || "", detail: res?.detail });
-      }
+        holidays:          holidaysOf(sel),
+      });
+      lastStatusRef.current = "running";
+      setJobId(id);
     } catch (e: any) {
-      await dialog.error({ title: "오류", message: String(e?.message || e) });
-    } finally {
       setRunning(false);
+      await dialog.error({ title: "오류", message: String(e?.message || e) });
     }
   };
 
+  // 작업 종료 처리
+  useEffect(() => {
+    if (!jobId) return;
+    if (prog.status === "running") {
+      lastStatusRef.current = "running";
+      return;
+    }
+
+    if (prog.status === "error" && lastStatusRef.current !== "error") {
+      lastStatusRef.current = "error";
+      void dialog
+        .error({ title: "개별 시험 결과 저장 실패", message: prog.error || prog.message || "", detail: prog.detail })
+        .then(() => {
+          setJobId(undefined);
+          setRunning(false);
+        });
+    } else if (prog.status === "done" && lastStatusRef.current !== "done") {
+      lastStatusRef.current = "done";
+      const warningText = prog.warnings.length ? `\n\n${prog.warnings.join("\n")}` : "";
+      void dialog
+        .confirm({ title: "완료", message: `${prog.message || "점수가 저장되었습니다."}${warningText}` })
+        .then(() => {
+          setJobId(undefined);
+          setRunning(false);
+          setQuery("");
+          loadData();
+        });
+    }
+  }, [jobId, prog.status, prog.message, prog.error, prog.detail, prog.warnings, dialog]);
+
   return (
     <Card className="h-full rounded-2xl border-border/80 shadow-sm">
       <CardContent className="flex h-full flex-col">
@@ -406,7 +436,7 @@ export default function SaveIndividualExamView({ onAction, meta }: ViewProps) {
             }
           >
             {running ? <Loader2 className="mr-2 h-4 w-4 animate-spin" /> : <Play className="mr-2 h-4 w-4" />}
-            {running ? "저장 중..." : "저장"}
+            {running ? (prog.status === "running" && prog.message ? prog.message : "저장 중...") : "저장"}
           </Button>
         </div>
       </CardContent>
@@ -1,20 +1,23 @@
 // src/views/SaveRetestView.tsx (재시험 화면)
-import { useEffect, useMemo, useState } from "react";
+import { useEffect, useMemo, useRef, useState } from "react";
 import type { ViewProps } from "@/types/tdm";
 import { rpc } from "pyloid-js";
 import { useAppDialog } from "@/components/app-dialog/AppDialogProvider";
+import { startJob, useProgressPoller, type ProgressPayload, type ProgressStatus } from "@/lib/progress";
 
 import { Card, CardContent } from "@/components/ui/card";
 import { Separator } from "@/components/ui/separator";
 import { Button } from "@/components/ui/button";
 import { Input } from "@/components/ui/input";
 import { ScrollArea } from "@/components/ui/scroll-area";
-import { BookCheck, Loader2, Play, User } from "lucide-react";
+import { Archive, BookCheck, ListPlus, Loader2, Play, User, X } from "lucide-react";
 
 // 화면에서 쓰는 타입
 type ClassInfo = { id: string; name: string };
 type StudentItem = { id: string; name: string; className: string }; // id = (class 시트) 학생 행 인덱스(문자열)
 type TestInfo = { id: string; name: string };    // id = (재시험 시트) 시험 행 인덱스(문자열)
+type PendingScore = { row: number; studentName: string; testName: string; score: string };
+type SaveResult = { row: number; ok: boolean; error: string | null };
 
 // 서버 맵 타입
 type ClassStudentDict = Record<string, Record<string, number>>; // {반: {학생이름: row}}
@@ -40,9 +43,18 @@ export default function SaveRetestView({ onAction, meta }: ViewProps) {
   const [testId, setTestId]       = useState<string>("");
   const [score, setScore]         = useState<string>("");
 
+  // 한 번에 저장할 점수 목록
+  const [pending, setPending] = useState<PendingScore[]>([]);
+
   const [loading, setLoading] = useState(false);
   const [running, setRunning] = useState(false);
 
+  // 완료된 재시험 보관 작업
+  const [archiveJobId, setArchiveJobId] = useState<string>();
+  const archiveProg: ProgressPayload = useProgressPoller(archiveJobId);
+  const archiving = archiveProg.status === "running";
+  const archiveStatusRef = useRef<ProgressStatus>("unknown");
+
   const loadData = async () => {
     try {
       setLoading(true);
@@ -100,6 +112,41 @@ export default function SaveRetestView({ onAction, meta }: ViewProps) {
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, []);
 
+  // 보관 작업 종료 처리 (행 번호가 바뀌므로 목록을 다시 불러옴)
+  useEffect(() => {
+    if (!archiveJobId || archiveStatusRef.current === archiveProg.status) return;
+    archiveStatusRef.current = archiveProg.status;
+
+    if (archiveProg.status === "done") {
+      setPending([]);
+      dialog.confirm({ title: "완료", message: archiveProg.message || "보관이 완료되었습니다." }).then(() => loadData());
+    } else if (archiveProg.status === "error") {
+      dialog.error({
+        title: "재시험 명단 보관 실패",
+        message: archiveProg.error || archiveProg.message || "",
+        detail: archiveProg.detail,
+      });
+    }
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [archiveJobId, archiveProg.status]);
+
+  const handleArchive = async () => {
+    const yes = await dialog.warning({
+      title: "완료된 재시험 보관",
+      message: "재시 점수가 입력된 지 오래된 재시험을 월별 보관 파일로 옮깁니다.\n저장하지 않은 점수 목록은 초기화됩니다.",
+      confirmText: "보관",
+      cancelText: "취소",
+    });
+    if (!yes) return;
+
+    try {
+      archiveStatusRef.current = "unknown";
+      setArchiveJobId(await startJob("start_archive_makeup_tests", {}));
+    } catch (e: any) {
+      await dialog.error({ title: "오류", message: String(e?.message || e) });
+    }
+  };
+
   // 반 선택 → 학생 목록 계산
   
 
@@ -184,14 +231,35 @@ export default function SaveRetestView({ onAction, meta }: ViewProps) {
   }, [tests, testQuery]);
 
   const scoreValid = score.trim() !== "";
-  const canSave = klass && studentId && testId && scoreValid;
+  const canAdd = klass && studentId && testId && scoreValid;
+  const canSave = canAdd || pending.length > 0;
+
+  // 현재 선택을 저장 목록에 추가 (같은 시험은 마지막 입력으로 교체)
+  const currentScore = (): PendingScore => ({
+    row: Number(testId), // (재시험 시트) 시험 행 인덱스
+    studentName,
+    testName,
+    score: score.trim(),
+  });
+
+  const handleAdd = () => {
+    if (!canAdd) return;
+    const item = currentScore();
+    setPending((prev) => [...prev.filter((p) => p.row !== item.row), item]);
+    setTestId("");
+    setScore("");
+  };
 
   const handleSave = async () => {
     if (!canSave) return;
 
+    const items = canAdd
+      ? [...pending.filter((p) => p.row !== Number(testId)), currentScore()]
+      : pending;
+
     const yes = await dialog.warning({
       title: "재시험 점수 저장",
-      message: `${studentName} / ${testName}\n점수: ${score}`,
+      message: items.map((p) => `${p.studentName} / ${p.testName}\n점수: ${p.score}`).join("\n\n"),
       confirmText: "저장",
       cancelText: "취소",
     });
@@ -200,13 +268,27 @@ export default function SaveRetestView({ onAction, meta }: ViewProps) {
     try {
       setRunning(true);
       onAction?.("save-retest");
-      // target_row:int, makeup_test_score:str
-      const res = await rpc.call("save_retest_result", {
-        target_row:        Number(testId), // (재시험 시트) 시험 행 인덱스 (문자열)
-        makeup_test_score: score,
+      const res = await rpc.call("save_retest_results", {
+        entries: items.map((p) => ({
+          row:          p.row,
+          score:        p.score,
+          student_name: p.studentName,
+          test_name:    p.testName,
+        })),
       });
       if (res?.ok) {
-        await dialog.confirm({ title: "완료", message: "점수가 저장되었습니다." });
+        const results = (res.data ?? []) as SaveResult[];
+        const failed = results.filter((r) => !r.ok);
+        if (failed.length === 0) {
+          await dialog.confirm({ title: "완료", message: `점수 ${results.length}건이 저장되었습니다.` });
+        } else {
+          await dialog.error({
+            title: "일부 점수 저장 실패",
+            message: `${results.length - failed.length}건 저장, ${failed.length}건 실패`,
+            detail: failed.map((r) => r.error).join("\n"),
+          });
+        }
+        setPending([]);
         setQuery("");
         loadData()
       } else {
@@ -340,7 +422,27 @@ export default function SaveRetestView({ onAction, meta }: ViewProps) {
                   value={score}
                   onChange={(e) => setScore(e.target.value)}
                   disabled={!testId || !studentId || loading || running}
+                  onKeyDown={(e) => { if (e.key === "Enter") handleAdd(); }}
                 />
+
+                {pending.length > 0 && (
+                  <ul className="max-h-24 space-y-1 overflow-y-auto rounded-lg border p-1">
+                    {pending.map((p) => (
+                      <li key={p.row} className="flex items-center gap-2 px-2 text-xs">
+                        <span className="flex-1 min-w-0 truncate">{p.studentName} / {p.testName}</span>
+                        <span className="font-medium">{p.score}</span>
+                        <button
+                          type="button"
+                          onClick={() => setPending((prev) => prev.filter((q) => q.row !== p.row))}
+                          disabled={running}
+                          className="text-muted-foreground hover:text-foreground"
+                        >
+                          <X className="h-3 w-3" />
+                        </button>
+                      </li>
+                    ))}
+                  </ul>
+                )}
               </div>
             </div>
           </div>
@@ -348,6 +450,16 @@ export default function SaveRetestView({ onAction, meta }: ViewProps) {
 
         {/* 우하단 저장 버튼 */}
         <div className="mt-6 flex items-center justify-end gap-2">
+          <Button
+            className="mr-auto rounded-xl"
+            variant="ghost"
+            onClick={handleArchive}
+            disabled={loading || running || archiving}
+            title="점수가 입력된 오래된 재시험을 월별 보관 파일로 옮깁니다."
+          >
+            {archiving ? <Loader2 className="mr-2 h-4 w-4 animate-spin" /> : <Archive className="mr-2 h-4 w-4" />}
+            {archiving ? archiveProg.message || "보관 중..." : "완료된 재시험 보관"}
+          </Button>
           <Button
             className="rounded-xl"
             variant="outline"
@@ -357,12 +469,23 @@ export default function SaveRetestView({ onAction, meta }: ViewProps) {
           >
             {loading ? "불러오는 중…" : "새로고침"}
           </Button>
+          <Button
+            className="rounded-xl"
+            variant="outline"
+            disabled={!canAdd || running}
+            onClick={handleAdd}
+            title="입력한 점수를 저장 목록에 추가합니다."
+          >
+            <ListPlus className="mr-2 h-4 w-4" />
+            목록에 추가
+          </Button>
           <Button
             className="rounded-xl bg-black text-white"
             disabled={!canSave || running}
             onClick={handleSave}
             title={
-              !klass ? "반을 선택하세요"
+              pending.length > 0 ? undefined
+              : !klass ? "반을 선택하세요"
               : !studentId ? "학생을 선택하세요"
               : !testId ? "시험을 선택하세요"
               : !scoreValid ? "올바른 점수를 입력하세요"
@@ -370,7 +493,7 @@ export default function SaveRetestView({ onAction, meta }: ViewProps) {
             }
           >
             {running ? <Loader2 className="mr-2 h-4 w-4 animate-spin" /> : <Play className="mr-2 h-4 w-4" />}
-            {running ? "저장 중..." : "저장"}
+            {running ? "저장 중..." : pending.length > 0 ? `저장 (${pending.length + (canAdd ? 1 : 0)}건)` : "저장"}
           </Button>
         </div>
       </CardContent>
@@ -5,7 +5,7 @@ import { Card, CardContent } from "@/components/ui/card"
 import { Separator } from "@/components/ui/separator"
 import { AlertTriangle, FileSpreadsheet, FileUp, Loader2, Play, Square, SquareCheck, X } from "lucide-react"
 import { rpc } from "pyloid-js"
-import { fileToBase64 } from "@/utils/rpc"
+import { fileUploadParams, pickedFile } from "@/utils/rpc"
 import { usePrereq } from "@/contexts/prereq"
 import { useAppDialog } from "@/components/app-dialog/AppDialogProvider"
 import { startJob, useProgressPoller, type ProgressPayload, type ProgressStatus } from "@/lib/progress"
@@ -15,7 +15,7 @@ import useHolidayDialog from "@/components/holiday-dialog/useHolidayDialog"
 
 export default function SendExamMessageView({ meta, onAction }: ViewProps) {
   const dialog = useAppDialog()
-  const { openHolidayDialog, lastHolidaySelection } = useHolidayDialog()
+  const { openHolidayDialog, lastHolidaySelection, holidaysOf } = useHolidayDialog()
   const { enforcePrereq } = usePrereq()
 
   const [file, setFile] = useState<File | null>(null)
@@ -50,16 +50,6 @@ export default function SendExamMessageView({ meta, onAction }: ViewProps) {
     if (first) setAcceptedFile(first)
   }
 
-  const base64ToFile = (b64: string, filename: string) => {
-    const binary = atob(b64)
-    const len = binary.length
-    const bytes = new Uint8Array(len)
-    for (let i = 0; i < len; i += 1) {
-      bytes[i] = binary.charCodeAt(i)
-    }
-    return new File([bytes], filename)
-  }
-
   const pickFromBackend = async () => {
     if (running || picking) return
     setPicking(true)
@@ -71,11 +61,11 @@ export default function SendExamMessageView({ meta, onAction }: ViewProps) {
         }
         return
       }
-      if (!res?.b64 || !res?.name) {
+      if (!res?.token || !res?.name) {
         await dialog.error({ title: "파일 선택 실패", message: "파일 정보를 받아오지 못했습니다." })
         return
       }
-      const selected = base64ToFile(res.b64, res.name)
+      const selected = pickedFile(res.name, res.token)
       setAcceptedFile(selected)
     } catch (err: any) {
       await dialog.error({ title: "파일 선택 실패", message: String(err?.message ?? err) })
@@ -98,11 +88,11 @@ export default function SendExamMessageView({ meta, onAction }: ViewProps) {
 
     try {
       onAction?.("send-exam-message")
-      const b64 = await fileToBase64(file)
+      const upload = await fileUploadParams(file)
       const id = await startJob("start_send_exam_message", {
-        filename: file.name,
-        b64,
-        makeup_test_date: sel
+        ...upload,
+        makeup_test_date: sel,
+        holidays: holidaysOf(sel),
       })
       setJobId(id)
       lastStatusRef.current = "running"
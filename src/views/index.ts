@@ -7,6 +7,7 @@ import SendExamMessageView from "./SendExamMessageView";
 import ReapplyConditionalFormatView from "./ReapplyConditionalFromatView";
 import SaveIndividualExamView from "./SaveIndividualExamView";
 import SaveRetestView from "./SaveRetestView";
+import MakeupRosterView from "./MakeupRosterView";
 import UpdateClassView from "./UpdateClassView";
 import UpdateStudentView from "./UpdateStudentView";
 import UpdateTeacherView from "./UpdateTeacherView";
@@ -23,6 +24,7 @@ const viewMap: Partial<Record<tdmActionKey, FC<ViewProps>>> = {
   "reapply-conditional-format": ReapplyConditionalFormatView,
   "save-individual-exam": SaveIndividualExamView,
   "save-retest": SaveRetestView,
+  "makeup-roster": MakeupRosterView,
   "update-class": UpdateClassView,
   "edit-message-config": EditMessageConfigView,
   "update-students": UpdateStudentView,
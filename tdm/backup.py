@@ -0,0 +1,246 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+
+from datetime import datetime, timedelta
+
+import tdm.config
+
+from tdm.exception import ReopenFileException
+
+HASH_CACHE_NAME  = "백업 해시"
+TIMESTAMP_FORMAT = "%Y%m%d%H%M%S"
+_CHUNK_SIZE      = 1 << 20
+
+# 백업 파일명: 이름(YYYYmmddHHMMSS).xlsx
+_BACKUP_NAME = re.compile(r"^(?P<name>.+)\((?P<stamp>\d{14})\)\.xlsx$")
+
+
+def backup_dir() -> str:
+    return f"{tdm.config.DATA_DIR}/data/backup"
+
+def _cache_path() -> str:
+    return f"{backup_dir()}/{HASH_CACHE_NAME}.json"
+
+def file_digest(path:str) -> str:
+    """파일 내용의 sha256 (조금씩 읽어 큰 파일도 메모리에 올리지 않음)"""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def _load_cache() -> dict[str, list]:
+    try:
+        with open(_cache_path(), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+def _save_cache(cache:dict[str, list]) -> None:
+    path = _cache_path()
+    # 서버 프로세스의 여러 스레드가 동시에 쓸 수 있으므로 스레드마다 다른 임시 파일 사용
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+def _cached_digest(cache:dict[str, list], path:str) -> str:
+    """해시 캐시 항목 `[mtime_ns, size, sha256]`이 현재 파일과 같으면 재사용, 다르면 다시 계산"""
+    st = os.stat(path)
+    key = os.path.basename(path)
+    entry = cache.get(key)
+    if isinstance(entry, list) and len(entry) == 3 and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        return entry[2]
+
+    digest = file_digest(path)
+    cache[key] = [st.st_mtime_ns, st.st_size, digest]
+    return digest
+
+def list_backups(name:str | None = None) -> list[tuple[str, datetime, str]]:
+    """
+    백업 폴더의 백업 파일 목록
+
+    return: 오래된 순 `(이름, 백업 시각, 경로)` 리스트
+    """
+    if not os.path.isdir(backup_dir()):
+        return []
+
+    backups = []
+    for entry in os.scandir(backup_dir()):
+        match = _BACKUP_NAME.match(entry.name)
+        if match is None or not entry.is_file():
+            continue
+        if name is not None and match.group("name") != name:
+            continue
+        try:
+            stamp = datetime.strptime(match.group("stamp"), TIMESTAMP_FORMAT)
+        except ValueError:
+            continue
+        backups.append((match.group("name"), stamp, entry.path))
+
+    backups.sort(key=lambda b: (b[1], b[2]))
+    return backups
+
+def make_backup(src_path:str, name:str, now:datetime | None = None) -> str | None:
+    """
+    `src_path` 파일을 `data/backup/이름(시각).xlsx`로 백업 (엑셀로 열지 않고 바이트 그대로 복사)
+
+    - 가장 최근 백업과 내용이 같으면 새로 만들지 않음
+    - 더 오래된 백업 중 내용이 같은 파일이 있으면 하드 링크로 공간을 나눠 씀 (지원하지 않는 환경이면 복사)
+    - 백업 후 보존 정책에 따라 같은 이름의 오래된 백업 정리
+
+    원본 파일은 저장할 때 같은 파일을 덮어쓰므로 원본과는 링크하지 않음
+
+    return: 백업 파일 경로 (원본이 없으면 `None`)
+    """
+    if not os.path.isfile(src_path):
+        return None
+
+    now = now or datetime.today()
+    os.makedirs(backup_dir(), exist_ok=True)
+
+    try:
+        digest = file_digest(src_path)
+    except PermissionError:
+        raise ReopenFileException(f"{name} 파일에 접근할 수 없습니다.\n파일을 직접 연 후 닫으면 문제가 해결될 수 있습니다.")
+
+    cache = _load_cache()
+    backups = list_backups(name)
+
+    # 마지막 백업 이후 바뀐 내용이 없으면 그대로 사용
+    if backups and _cached_digest(cache, backups[-1][2]) == digest:
+        _save_cache(cache)
+        return backups[-1][2]
+
+    same_path = None
+    for _, _, path in reversed(backups[:-1]):
+        if _cached_digest(cache, path) == digest:
+            same_path = path
+            break
+
+    dst_path = f"{backup_dir()}/{name}({now.strftime(TIMESTAMP_FORMAT)}).xlsx"
+    if os.path.exists(dst_path):
+        os.remove(dst_path)
+
+    linked = False
+    if same_path is not None:
+        try:
+            os.link(same_path, dst_path)
+            linked = True
+        except OSError:
+            pass
+    if not linked:
+        shutil.copy2(src_path, dst_path)
+
+    st = os.stat(dst_path)
+    cache[os.path.basename(dst_path)] = [st.st_mtime_ns, st.st_size, digest]
+
+    prune_backups(name, now=now, cache=cache)
+    _save_cache(cache)
+
+    return dst_path
+
+def _retention_bucket(stamp:datetime, now:datetime, retention:dict[str, int]) -> tuple[str, str] | None:
+    """
+    백업 시각이 속하는 보존 구간
+
+    - `hourly`시간 이내: 시간마다 하나
+    - `daily`일 이내: 하루마다 하나
+    - 그 이후: 한 달마다 하나 (`monthly`개월이 지나면 삭제, 0이면 계속 보관)
+    """
+    age = now - stamp
+    if retention["hourly"] > 0 and age < timedelta(hours=retention["hourly"]):
+        return "hourly", stamp.strftime("%Y%m%d%H")
+    if retention["daily"] > 0 and age < timedelta(days=retention["daily"]):
+        return "daily", stamp.strftime("%Y%m%d")
+
+    months = (now.year - stamp.year) * 12 + now.month - stamp.month
+    if retention["monthly"] == 0 or months < retention["monthly"]:
+        return "monthly", stamp.strftime("%Y%m")
+    return None
+
+def prune_backups(
+    name:str | None = None,
+    retention:dict[str, int] | None = None,
+    now:datetime | None = None,
+    cache:dict[str, list] | None = None,
+) -> list[str]:
+    """
+    보존 정책에 따라 오래된 백업 삭제
+
+    이름마다 가장 최근 백업은 항상 남기고, 구간마다 가장 최근 백업 하나만 남김.
+    `retention`이 없으면 설정의 백업 보존 정책 사용
+
+    return: 삭제한 파일 경로 리스트
+    """
+    retention = tdm.config.normalize_backup_retention(tdm.config.BACKUP_RETENTION if retention is None else retention)
+    now = now or datetime.today()
+    save_cache = cache is None
+    if save_cache:
+        cache = _load_cache()
+
+    groups: dict[str, list[tuple[datetime, str]]] = {}
+    for backup_name, stamp, path in list_backups(name):
+        groups.setdefault(backup_name, []).append((stamp, path))
+
+    removed = []
+    for entries in groups.values():
+        seen = set()
+        for i, (stamp, path) in enumerate(reversed(entries)):
+            bucket = _retention_bucket(stamp, now, retention)
+            if i == 0 or (bucket is not None and bucket not in seen):
+                seen.add(bucket)
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                # 엑셀로 열려 있는 백업은 다음 정리 때 삭제
+                continue
+            cache.pop(os.path.basename(path), None)
+            removed.append(path)
+
+    if save_cache and removed:
+        _save_cache(cache)
+
+    return removed
+
+def backup_usage() -> dict:
+    """
+    백업 저장 공간 사용량
+
+    하드 링크로 공유된 파일은 `disk_bytes`에 한 번만 셈
+
+    return: `{"count", "logical_bytes", "disk_bytes", "files": {이름: {"count", "bytes", "oldest", "newest"}}}`
+    """
+    files = {}
+    inodes = set()
+    logical_bytes = disk_bytes = 0
+    for name, stamp, path in list_backups():
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+
+        logical_bytes += st.st_size
+        inode = (st.st_dev, st.st_ino)
+        if st.st_ino == 0 or inode not in inodes:
+            inodes.add(inode)
+            disk_bytes += st.st_size
+
+        stamp_text = stamp.strftime("%Y-%m-%d %H:%M:%S")
+        item = files.setdefault(name, {"count": 0, "bytes": 0, "oldest": stamp_text, "newest": stamp_text})
+        item["count"] += 1
+        item["bytes"] += st.st_size
+        item["newest"] = stamp_text
+
+    return {
+        "count": sum(item["count"] for item in files.values()),
+        "logical_bytes": logical_bytes,
+        "disk_bytes": disk_bytes,
+        "files": files,
+    }
@@ -1,4 +1,12 @@
-﻿from typing import Any, TypeAlias
+﻿import json
+import os
+import time
+import webbrowser
+
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, TypeAlias
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options as ChromeOptions
@@ -13,39 +21,40 @@ import urllib3
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse
 
-import tdm.dataform
 import tdm.studentinfo
 
 import tdm.config
-from tdm.defs import Chrome, DataForm
-from tdm.util import calculate_makeup_test_schedule, date_to_kor_date
+from tdm.defs import Chrome
+from tdm.util import date_to_kor_date
 from tdm.progress import Progress
 from tdm.exception import ChromeDriverVersionMismatchException
 
 InputTriple: TypeAlias = tuple[WebElement, WebElement, WebElement]
 
-def _fetch_aisosik_soup() -> BeautifulSoup:
+def _fetch_aisosik_soup(url: str | None = None) -> BeautifulSoup:
     """
     아이소식 페이지 HTML을 가져와 BeautifulSoup로 반환.
     - 로그인/쿠키가 필요한 페이지면, 여기에서 세션/쿠키 처리하도록 확장하면 됨.
+    - `url`을 지정하면 설정값 대신 해당 주소(로컬 대체 서버 등)를 사용.
     """
     headers = {
         "User-Agent": "Mozilla/5.0",
         "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
     }
 
-    target_host = urlparse(tdm.config.URL).hostname
+    url = url or tdm.config.URL
+    target_host = urlparse(url).hostname
 
     with requests.Session() as s:
         try:
-            r = s.get(tdm.config.URL, headers=headers, timeout=10)
+            r = s.get(url, headers=headers, timeout=10)
         except requests.exceptions.SSLError:
             # Some deployed iday-b2 endpoints currently serve expired certs.
             # Fallback keeps the app usable until server-side certs are fixed.
             if target_host != "dbserver2.iday-b2.com":
                 raise
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-            r = s.get(tdm.config.URL, headers=headers, timeout=10, verify=False)
+            r = s.get(url, headers=headers, timeout=10, verify=False)
         r.raise_for_status()
 
         # 인코딩이 애매한 사이트면 아래 라인이 도움 될 수 있음
@@ -126,6 +135,42 @@ def get_class_student_dict() -> dict[str, list[str]]:
 
     return class_student_dict
 
+def get_cached_class_student_dict(max_age: float = Chrome.ROSTER_CACHE_MAX_AGE, refresh: bool = False) -> dict[str, list[str]]:
+    """
+    '반 : 학생 리스트' dict를 data 폴더에 캐시하여 반환
+
+    캐시가 `max_age`초보다 오래되었거나 URL이 바뀌었으면 다시 가져오고, 가져오기에 실패하면 남아있는 캐시 사용
+    """
+    cache_path = f"{tdm.config.DATA_DIR}/data/{Chrome.ROSTER_CACHE_NAME}.json"
+
+    cached = None
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cached = json.load(f)
+        if not isinstance(cached, dict) or cached.get("url") != tdm.config.URL:
+            cached = None
+    except (OSError, ValueError):
+        cached = None
+
+    if cached is not None and not refresh and time.time() - cached.get("fetched_at", 0) < max_age:
+        return cached.get("roster", {})
+
+    try:
+        roster = get_class_student_dict()
+    except requests.exceptions.RequestException:
+        if cached is None:
+            raise
+        return cached.get("roster", {})
+
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump({"url": tdm.config.URL, "fetched_at": time.time(), "roster": roster}, f, ensure_ascii=False)
+    except OSError:
+        pass
+
+    return roster
+
 def check_student_exists(student_name: str, target_class_name: str) -> bool:
     """
     특정 반에 특정 학생이 존재하는지 확인
@@ -196,6 +241,70 @@ def _cache_table_inputs(driver: ChromeWebDriver, class_index: int) -> dict[str,
 
     return name_to_inputs
 
+def _capture_page_snapshot(driver: ChromeWebDriver) -> str:
+    """
+    초기 렌더링이 끝난 현재 탭의 DOM을 HTML 문자열로 반환
+    """
+    return driver.execute_script("return '<!DOCTYPE html>' + document.documentElement.outerHTML")
+
+def _clone_tab_from_snapshot(driver: ChromeWebDriver, snapshot: str, class_table_count: int) -> bool:
+    """
+    스냅샷 HTML로 새 탭 생성 (네트워크 재요청 없음)
+
+    복제된 탭의 반 테이블 구성이 원본과 다르면 탭을 닫고 `False` 반환
+    """
+    source_handle = driver.current_window_handle
+    prev_handles = set(driver.window_handles)
+
+    opened = driver.execute_script("""
+        const w = window.open("", "_blank");
+        if (!w) return false;
+        w.document.open();
+        w.document.write(arguments[0]);
+        w.document.close();
+        return true;
+    """, snapshot)
+    new_handles = [h for h in driver.window_handles if h not in prev_handles]
+    if not opened or not new_handles:
+        return False
+
+    driver.switch_to.window(new_handles[0])
+    try:
+        # 스크립트가 다시 실행되어 테이블이 중복/누락되면 복제 실패로 간주
+        cloned = (
+            len(driver.find_elements(By.CLASS_NAME, "style1")) == class_table_count
+            and len(driver.find_elements(By.ID, "ctitle")) == 1
+        )
+    except WebDriverException:
+        cloned = False
+
+    if not cloned:
+        driver.close()
+    driver.switch_to.window(source_handle)
+    return cloned
+
+def _open_makeup_tabs(driver: ChromeWebDriver, clone_tabs: bool) -> None:
+    """
+    재시험 안내 탭 2개 생성
+
+    `clone_tabs`가 참이면 첫 탭의 스냅샷을 복제하고, 복제할 수 없으면 기존처럼 URL을 새 탭으로 연달아 요청
+    """
+    snapshot = None
+    class_table_count = 0
+    if clone_tabs:
+        try:
+            snapshot = _capture_page_snapshot(driver)
+            class_table_count = len(driver.find_elements(By.CLASS_NAME, "style1"))
+        except WebDriverException:
+            snapshot = None
+
+    for _ in (Chrome.MAKEUPTEST_NO_SCHEDULE_TAB, Chrome.MAKEUPTEST_SCHEDULE_TAB):
+        if snapshot is not None and _clone_tab_from_snapshot(driver, snapshot, class_table_count):
+            continue
+        # 한 번 복제에 실패하면 남은 탭은 모두 URL 요청으로 생성
+        snapshot = None
+        driver.execute_script("window.open(arguments[0])", tdm.config.URL)
+
 def _create_chrome_driver(service: Service, options: ChromeOptions) -> ChromeWebDriver:
     try:
         return ChromeWebDriver(service=service, options=options)
@@ -212,157 +321,109 @@ def _create_chrome_driver(service: Service, options: ChromeOptions) -> ChromeWeb
             ) from e
         raise
 
-def send_test_result_message(filepath: str, makeup_test_date: dict[str, Any], prog: Progress) -> bool:
+def _chrome_options() -> ChromeOptions:
+    options = ChromeOptions()
+    options.add_argument("--disable-gpu")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_argument("--ignore-certificate-errors")
+    options.add_argument("--allow-running-insecure-content")
+    options.accept_insecure_certs = True
+    options.page_load_strategy = "eager"
+    options.add_experimental_option("detach", True)
+    return options
+
+def _launch_message_browser(clone_tabs: bool) -> tuple[ChromeWebDriver, dict[str, int]]:
     """
-    기록 양식의 데이터를 추출하여 아이소식 스크립트 작성
+    크롬 실행 후 시험 결과/재시험 탭 3개를 열고 메시지 템플릿 작성
+
+    return `driver`, `dict[반 이름:테이블 인덱스]`
     """
-    form_wb = None
-    student_wb = None
-    try:
-        service = Service()
-        service.creation_flags = CREATE_NO_WINDOW
-        options = ChromeOptions()
-        options.add_argument("--disable-gpu")
-        options.add_argument("--disable-extensions")
-        options.add_argument("--blink-settings=imagesEnabled=false")
-        options.add_argument("--ignore-certificate-errors")
-        options.add_argument("--allow-running-insecure-content")
-        options.accept_insecure_certs = True
-        options.page_load_strategy = "eager"
-        options.add_experimental_option("detach", True)
-
-        form_wb = tdm.dataform.open(filepath)
-        form_ws = tdm.dataform.open_worksheet(form_wb)
-
-        student_wb = tdm.studentinfo.open()
-        student_ws = tdm.studentinfo.open_worksheet(student_wb)
-
-        driver = _create_chrome_driver(service=service, options=options)
-        
-        # 아이소식 접속
-        driver.get(tdm.config.URL)
-        _set_value_with_events(driver, driver.find_element(By.XPATH, '//*[@id="ctitle"]'), tdm.config.TEST_RESULT_MESSAGE)
-        driver.execute_script("document.title = '시험 결과 전송'")
+    service = Service()
+    service.creation_flags = CREATE_NO_WINDOW
 
-        driver.execute_script("window.open(arguments[0])", tdm.config.URL)
-        driver.switch_to.window(driver.window_handles[Chrome.MAKEUPTEST_NO_SCHEDULE_TAB])
-        _set_value_with_events(
-            driver,
-            driver.find_element(By.XPATH, '//*[@id="ctitle"]'),
-            tdm.config.MAKEUP_TEST_NO_SCHEDULE_MESSAGE,
-        )
-        driver.execute_script("document.title = '재시험 일정 없는 학생'")
+    driver = _create_chrome_driver(service=service, options=_chrome_options())
 
-        driver.execute_script("window.open(arguments[0])", tdm.config.URL)
-        driver.switch_to.window(driver.window_handles[Chrome.MAKEUPTEST_SCHEDULE_TAB])
-        _set_value_with_events(
-            driver,
-            driver.find_element(By.XPATH, '//*[@id="ctitle"]'),
-            tdm.config.MAKEUP_TEST_SCHEDULE_MESSAGE,
-        )
-        driver.execute_script("document.title = '재시험 일정 있는 학생'")
+    # 아이소식 접속
+    driver.get(tdm.config.URL)
+    _open_makeup_tabs(driver, clone_tabs)
 
-        driver.switch_to.window(driver.window_handles[Chrome.DAILYTEST_RESULT_TAB])
+    for tab, message, title in (
+        (Chrome.DAILYTEST_RESULT_TAB,       tdm.config.TEST_RESULT_MESSAGE,             "시험 결과 전송"),
+        (Chrome.MAKEUPTEST_NO_SCHEDULE_TAB, tdm.config.MAKEUP_TEST_NO_SCHEDULE_MESSAGE, "재시험 일정 없는 학생"),
+        (Chrome.MAKEUPTEST_SCHEDULE_TAB,    tdm.config.MAKEUP_TEST_SCHEDULE_MESSAGE,    "재시험 일정 있는 학생"),
+    ):
+        driver.switch_to.window(driver.window_handles[tab])
+        _set_value_with_events(driver, driver.find_element(By.XPATH, '//*[@id="ctitle"]'), message)
+        driver.execute_script("document.title = arguments[0]", title)
 
-        # 반 인덱스 dict
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        names = [el.get_text(strip=True) for el in soup.select(".style1")]
-        table_index_dict = {name: i for i, name in enumerate(names) if name}
-        # table_names = driver.find_elements(By.CLASS_NAME, "style1")
-        # table_index_dict = {table_name.text.strip() : i for i, table_name in enumerate(table_names)}
+    driver.switch_to.window(driver.window_handles[Chrome.DAILYTEST_RESULT_TAB])
 
-        # 탭별 캐시: class_index -> (student_name -> inputs)
-        daily_cache: dict[int, dict[str, InputTriple]] = {}
-        nosched_cache: dict[int, dict[str, InputTriple]] = {}
-        sched_cache: dict[int, dict[str, InputTriple]] = {}
+    # 반 인덱스 dict
+    soup = BeautifulSoup(driver.page_source, "html.parser")
+    names = [el.get_text(strip=True) for el in soup.select(".style1")]
+    table_index_dict = {name: i for i, name in enumerate(names) if name}
 
-        # 탭별 작업 큐
-        daily_ops: list[tuple[int, str, str | None, int | float, str | None]] = []
-        nosched_ops: list[tuple[int, str, str | None]] = []
-        sched_ops: list[tuple[int, str, str | None, str]] = []
-
-        # 루프에서 매 행마다 DOM 조작하지 말고 "작업만 수집"
-        class_index = None
-        class_name = None
-        daily_test_name = mock_test_name = None
-        daily_test_average = mock_test_average = None
-
-        for row in range(2, form_ws.max_row + 1):
-            if form_ws.cell(row, DataForm.CLASS_NAME_COLUMN).value is not None:
-                class_name = str(form_ws.cell(row, DataForm.CLASS_NAME_COLUMN).value)
-                daily_name_value = form_ws.cell(row, DataForm.DAILYTEST_NAME_COLUMN).value
-                mock_name_value = form_ws.cell(row, DataForm.MOCKTEST_NAME_COLUMN).value
-                daily_avg_value = form_ws.cell(row, DataForm.DAILYTEST_AVERAGE_COLUMN).value
-                mock_avg_value = form_ws.cell(row, DataForm.MOCKTEST_AVERAGE_COLUMN).value
-
-                daily_test_name = str(daily_name_value) if daily_name_value is not None else None
-                mock_test_name = str(mock_name_value) if mock_name_value is not None else None
-                daily_test_average = str(daily_avg_value) if daily_avg_value is not None else None
-                mock_test_average = str(mock_avg_value) if mock_avg_value is not None else None
-
-                if daily_test_name is None and mock_test_name is None:
-                    continue
+    return driver, table_index_dict
 
-                class_index = table_index_dict.get(class_name)
-                if class_index is None:
-                    prog.warning(f"아이소식에 {class_name} 반이 존재하지 않습니다.")
-                    continue
+def send_test_result_message(
+    filepath: str,
+    makeup_test_date: dict[str, Any],
+    prog: Progress,
+    clone_tabs: bool = True,
+    plan: "tdm.messageplan.MessagePlan | None" = None,
+    browser_future: "Future[tuple[ChromeWebDriver, dict[str, int]]] | None" = None,
+) -> bool:
+    """
+    기록 양식의 데이터를 추출하여 아이소식 스크립트 작성
 
-            student_name_raw = form_ws.cell(row, DataForm.STUDENT_NAME_COLUMN).value
-            if student_name_raw is None:
-                continue
-            student_name = str(student_name_raw).strip()
-            if not student_name:
-                continue
-            daily_test_score = form_ws.cell(row, DataForm.DAILYTEST_SCORE_COLUMN).value
-            mock_test_score  = form_ws.cell(row, DataForm.MOCKTEST_SCORE_COLUMN).value
-
-            if daily_test_score is not None:
-                test_name, test_score, test_average = daily_test_name, daily_test_score, daily_test_average
-            elif mock_test_score is not None:
-                test_name, test_score, test_average = mock_test_name, mock_test_score, mock_test_average
-            else:
-                continue
+    브라우저 실행/페이지 로딩과 양식 분석/재시험 일정 계산을 별도 스레드에서 동시에 진행한 뒤 합류
 
-            if type(test_score) not in (int, float):
-                continue
+    `clone_tabs`: 재시험 탭을 첫 탭의 DOM 스냅샷으로 생성 (불가능하면 URL 재요청)
 
-            if class_index is None:
-                # 반 매핑 실패 상태에서는 쓰기 작업을 생성하지 않는다.
-                continue
+    `plan`: 미리 계산된 `MessagePlan` (경고는 이미 보고된 것으로 간주)
 
-            daily_ops.append((class_index, student_name, test_name, test_score, test_average))
+    `browser_future`: 미리 시작한 `_launch_message_browser` (없으면 여기서 실행)
+    """
+    browser_executor = None
+    if browser_future is None:
+        browser_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tdm-chrome")
+        browser_future = browser_executor.submit(_launch_message_browser, clone_tabs)
+    try:
+        precomputed = plan is not None
+        if not precomputed:
+            # tdm.messageplan이 tdm.dataform을 거쳐 이 모듈을 가져오므로 사용할 때 가져옴
+            # (`import tdm.x`로 가져오면 함수 전체에서 `tdm`이 지역 이름이 되므로 다른 이름으로 가져옴)
+            from tdm import messageplan
+            try:
+                plan = messageplan.load_message_plan(filepath, makeup_test_date)
+            except Exception:
+                # 양식 분석 실패 시 먼저 떠 있는 브라우저를 정리
+                _quit_launched_browser(browser_future)
+                raise
 
-            # 재시험 분기(여기서는 DOM 안 건드리고 “어느 탭에 쓸지”만 결정)
-            if test_score >= 80:
-                continue
-            if form_ws.cell(row, DataForm.MAKEUP_TEST_CHECK_COLUMN).value in ("x", "X"):
-                continue
+        driver, table_index_dict = browser_future.result()
 
-            info_exists, makeup_test_weekday, makeup_test_time, _ = tdm.studentinfo.get_student_info(student_ws, student_name)
-            if info_exists and makeup_test_weekday:
-                complete, calculated_schedule, time_index = calculate_makeup_test_schedule(makeup_test_weekday, makeup_test_date)
-                if complete:
-                    s = date_to_kor_date(calculated_schedule)
-                    if makeup_test_time is not None:
-                        mt = str(makeup_test_time)
-                        if "/" in mt and len(makeup_test_weekday.split("/")) == len(mt.split("/")):
-                            s = f"{s} {mt.split('/')[time_index]}시"
-                        elif "/" not in mt:
-                            s = f"{s} {mt}시"
-                    sched_ops.append((class_index, student_name, test_name, s))
-                    continue
-            elif not info_exists:
-                prog.warning(f"{student_name}의 학생 정보가 존재하지 않습니다.")
+        # 아이소식에 없는 반은 쓰기 작업 제외
+        for class_name in plan.drop_classes(c for c in plan.class_names() if c not in table_index_dict):
+            prog.warning(f"아이소식에 {class_name} 반이 존재하지 않습니다.")
 
-            nosched_ops.append((class_index, student_name, test_name))
+        if not precomputed:
+            for _, msg in plan.student_warnings:
+                prog.warning(msg)
 
         prog.step("시험 결과 요약 완료")
 
+        # 탭별 캐시: class_index -> (student_name -> inputs)
+        daily_cache: dict[int, dict[str, InputTriple]] = {}
+        nosched_cache: dict[int, dict[str, InputTriple]] = {}
+        sched_cache: dict[int, dict[str, InputTriple]] = {}
+
         # DAILY
 
         driver.switch_to.window(driver.window_handles[Chrome.DAILYTEST_RESULT_TAB])
-        for class_index, student_name, test_name, test_score, test_average in daily_ops:
+        for class_name, student_name, test_name, test_score, test_average in plan.daily_ops:
+            class_index = table_index_dict[class_name]
             if class_index not in daily_cache:
                 daily_cache[class_index] = _cache_table_inputs(driver, class_index)
 
@@ -382,7 +443,8 @@ def send_test_result_message(filepath: str, makeup_test_date: dict[str, Any], pr
         # NO_SCHEDULE
 
         driver.switch_to.window(driver.window_handles[Chrome.MAKEUPTEST_NO_SCHEDULE_TAB])
-        for class_index, student_name, test_name in nosched_ops:
+        for class_name, student_name, test_name in plan.nosched_ops:
+            class_index = table_index_dict[class_name]
             if class_index not in nosched_cache:
                 nosched_cache[class_index] = _cache_table_inputs(driver, class_index)
 
@@ -399,7 +461,8 @@ def send_test_result_message(filepath: str, makeup_test_date: dict[str, Any], pr
         # SCHEDULE
 
         driver.switch_to.window(driver.window_handles[Chrome.MAKEUPTEST_SCHEDULE_TAB])
-        for class_index, student_name, test_name, schedule_str in sched_ops:
+        for class_name, student_name, test_name, schedule_str in plan.sched_ops:
+            class_index = table_index_dict[class_name]
             if class_index not in sched_cache:
                 sched_cache[class_index] = _cache_table_inputs(driver, class_index)
 
@@ -420,20 +483,253 @@ def send_test_result_message(filepath: str, makeup_test_date: dict[str, Any], pr
         raise
     except Exception as e:
         raise Exception(f"메시지 작성 중 오류가 발생했습니다: {e}")
-
     finally:
-        try:
-            if form_wb is not None:
-                form_wb.close()
-        except Exception:
-            pass
-        try:
-            if student_wb is not None:
-                student_wb.close()
-        except Exception:
-            pass
+        if browser_executor is not None:
+            browser_executor.shutdown(wait=False)
 
-def send_individual_test_message(
+def _quit_launched_browser(browser_future: Future) -> None:
+    """실행이 끝나기를 기다렸다가 작성에 쓰지 않은 브라우저 종료"""
+    try:
+        driver, _ = browser_future.result()
+        driver.quit()
+    except Exception:
+        pass
+
+# 메시지 작성 방식(backend)
+class MessageBackend(ABC):
+    """
+    아이소식 메시지 작성 방식 공통 인터페이스
+
+    `write`는 `MessagePlan`(없으면 기록 양식으로부터 생성)을 각 탭에 작성
+
+    `prepare`로 브라우저 실행 등 계획과 무관한 준비를 사전 점검과 동시에 시작할 수 있으며,
+    `write`를 호출하지 않고 끝나면 `discard`로 정리
+
+    `steps`: `write`가 보고하는 `prog.step` 횟수 (작업 전체 단계 수 계산에 사용)
+    """
+    name = ""
+    steps = 0
+
+    def prepare(self) -> None:
+        """계획 없이 미리 시작할 수 있는 준비 작업 시작 (기본은 없음)"""
+
+    def discard(self) -> None:
+        """`prepare`로 시작했지만 `write`에 쓰지 않은 준비 작업 정리 (기본은 없음)"""
+
+    @abstractmethod
+    def write(self, filepath: str, makeup_test_date: dict[str, Any], prog: Progress, plan: "tdm.messageplan.MessagePlan | None" = None) -> bool:
+        ...
+
+class SeleniumBackend(MessageBackend):
+    """
+    크롬을 실행하여 아이소식 페이지에 직접 작성 (기존 방식)
+    """
+    name = "selenium"
+    steps = 4
+
+    def __init__(self, clone_tabs: bool = True):
+        self.clone_tabs = clone_tabs
+        self._browser_executor: ThreadPoolExecutor | None = None
+        self._browser_future: Future | None = None
+
+    def prepare(self) -> None:
+        """크롬 실행/페이지 로딩을 별도 스레드에서 시작"""
+        if self._browser_future is None:
+            self._browser_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tdm-chrome")
+            self._browser_future = self._browser_executor.submit(_launch_message_browser, self.clone_tabs)
+
+    def _take_browser(self) -> Future | None:
+        browser_future = self._browser_future
+        if self._browser_executor is not None:
+            self._browser_executor.shutdown(wait=False)
+        self._browser_executor = self._browser_future = None
+        return browser_future
+
+    def discard(self) -> None:
+        browser_future = self._take_browser()
+        if browser_future is not None:
+            _quit_launched_browser(browser_future)
+
+    def write(self, filepath, makeup_test_date, prog, plan=None) -> bool:
+        return send_test_result_message(filepath, makeup_test_date, prog, self.clone_tabs, plan, self._take_browser())
+
+class HttpBackend(MessageBackend):
+    """
+    브라우저 없이 `requests`로 페이지 HTML을 받아 탭별로 값이 채워진 페이지와 입력값(payload)을 생성
+
+    생성된 페이지는 `<base href>`로 원래 주소를 가리키므로 기본 브라우저에서 열어 확인 후 전송
+    """
+    name = "http"
+    steps = 4
+
+    def __init__(self, url: str | None = None, output_dir: str | None = None, open_pages: bool = True):
+        self.url        = url
+        self.output_dir = output_dir
+        self.open_pages = open_pages
+        self.pages: list[str] = []
+        self.payloads: dict[str, dict[str, str]] = {}
+
+    @staticmethod
+    def _set_field(el, value: Any) -> None:
+        value = "" if value is None else str(value)
+        if el.name == "textarea":
+            el.string = value
+        else:
+            el["value"] = value
+
+    @staticmethod
+    def _row_inputs(table) -> dict[str, list]:
+        """
+        `_cache_table_inputs`와 같은 규칙으로 학생이름 -> [시험명, 점수, 평균] input 태그
+        """
+        name_to_inputs = {}
+        for row in table.select(".style12"):
+            name_el = row.select_one(".style9")
+            if name_el is None:
+                continue
+            name = name_el.get_text(strip=True)
+            if not name:
+                continue
+            tds = row.find_all("td")
+            inputs = [td.find("input") for td in tds[:3]]
+            if len(inputs) == 3 and all(inputs):
+                name_to_inputs[name] = inputs
+        return name_to_inputs
+
+    @staticmethod
+    def _payload(soup: BeautifulSoup) -> dict[str, str]:
+        payload = {}
+        for el in soup.select("input, textarea"):
+            key = el.get("name") or el.get("id")
+            if not key:
+                continue
+            payload[key] = el.get_text() if el.name == "textarea" else el.get("value", "")
+        return payload
+
+    def write(self, filepath, makeup_test_date, prog, plan=None) -> bool:
+        url = self.url or tdm.config.URL
+        if plan is None:
+            # 순환 import 회피 (`send_test_result_message` 참고)
+            from tdm import messageplan
+            plan = messageplan.load_message_plan(filepath, makeup_test_date)
+            for _, msg in plan.student_warnings:
+                prog.warning(msg)
+
+        source = str(_fetch_aisosik_soup(url))
+        table_names = [el.get_text(strip=True) for el in BeautifulSoup(source, "html.parser").select(".style1")]
+        table_index_dict = {name: i for i, name in enumerate(table_names) if name}
+
+        for class_name in plan.drop_classes(c for c in plan.class_names() if c not in table_index_dict):
+            prog.warning(f"아이소식에 {class_name} 반이 존재하지 않습니다.")
+
+        prog.step("시험 결과 요약 완료")
+
+        output_dir = self.output_dir or f"{tdm.config.DATA_DIR}/data/{Chrome.HTTP_OUTPUT_DIR_NAME}"
+        os.makedirs(output_dir, exist_ok=True)
+
+        tabs = (
+            ("시험 결과 전송",        tdm.config.TEST_RESULT_MESSAGE,             [(c, s, (n, score, avg)) for c, s, n, score, avg in plan.daily_ops]),
+            ("재시험 일정 없는 학생", tdm.config.MAKEUP_TEST_NO_SCHEDULE_MESSAGE, [(c, s, (n,)) for c, s, n in plan.nosched_ops]),
+            ("재시험 일정 있는 학생", tdm.config.MAKEUP_TEST_SCHEDULE_MESSAGE,    [(c, s, (n, sched)) for c, s, n, sched in plan.sched_ops]),
+        )
+        self.pages = []
+        self.payloads = {}
+        for tab_no, (title, message, ops) in enumerate(tabs):
+            soup = BeautifulSoup(source, "html.parser")
+            ctitle = soup.find(id="ctitle")
+            if ctitle is None:
+                raise Exception("아이소식 페이지에서 메시지 입력란(ctitle)을 찾을 수 없습니다.")
+            self._set_field(ctitle, message)
+
+            inputs_cache: dict[int, dict[str, list]] = {}
+            for class_name, student_name, values in ops:
+                class_index = table_index_dict[class_name]
+                if class_index not in inputs_cache:
+                    table = soup.find(id=f"table_{class_index}")
+                    inputs_cache[class_index] = self._row_inputs(table) if table is not None else {}
+
+                inputs = inputs_cache[class_index].get(student_name)
+                if not inputs:
+                    if tab_no == Chrome.DAILYTEST_RESULT_TAB:
+                        prog.warning(f"아이소식에 {student_name} 학생이 존재하지 않습니다.")
+                    continue
+
+                for el, value in zip(inputs, values):
+                    self._set_field(el, value)
+
+            if soup.head is not None:
+                if soup.title is not None:
+                    soup.title.string = title
+                base = soup.new_tag("base", href=url)
+                soup.head.insert(0, base)
+
+            page_path = os.path.abspath(f"{output_dir}/{title}.html")
+            with open(page_path, "w", encoding="utf-8") as f:
+                f.write(str(soup))
+            self.pages.append(page_path)
+            self.payloads[title] = self._payload(soup)
+
+            prog.step(f"{title} 페이지 작성 완료")
+
+        with open(f"{output_dir}/payload.json", "w", encoding="utf-8") as f:
+            json.dump(self.payloads, f, ensure_ascii=False, indent=2)
+
+        if self.open_pages:
+            for page_path in reversed(self.pages):
+                webbrowser.open(Path(page_path).as_uri())
+
+        return True
+
+MESSAGE_BACKENDS: dict[str, type[MessageBackend]] = {
+    SeleniumBackend.name: SeleniumBackend,
+    HttpBackend.name: HttpBackend,
+}
+
+def get_message_backend(name: str = SeleniumBackend.name, **kwargs) -> MessageBackend:
+    try:
+        return MESSAGE_BACKENDS[name](**kwargs)
+    except KeyError:
+        raise ValueError(f"지원하지 않는 메시지 작성 방식입니다: {name}")
+
+def message_backend_steps(name: str = SeleniumBackend.name) -> int:
+    """메시지 작성 방식별 `write` 단계 수 (알 수 없는 방식이면 0)"""
+    backend = MESSAGE_BACKENDS.get(name)
+    return backend.steps if backend is not None else 0
+
+def launch_individual_message_browser(makeup_tab: bool) -> tuple[ChromeWebDriver, dict[str, int]]:
+    """
+    개별 시험 결과 메시지용 크롬 실행 및 메시지 템플릿 작성
+
+    `makeup_tab`: 재시험 안내 탭도 미리 열어 둠
+
+    return `driver`, `dict[반 이름:테이블 인덱스]`
+    """
+    service = Service()
+    service.creation_flags = CREATE_NO_WINDOW
+
+    driver = _create_chrome_driver(service=service, options=_chrome_options())
+
+    # 아이소식 접속
+    driver.get(tdm.config.URL)
+    driver.execute_script("document.title = '시험 결과 전송'")
+    _set_value_with_events(driver, driver.find_element(By.XPATH, '//*[@id="ctitle"]'), tdm.config.TEST_RESULT_MESSAGE)
+
+    # 반 인덱스 dict (BeautifulSoup 사용으로 DOM 접근 최소화)
+    soup = BeautifulSoup(driver.page_source, "html.parser")
+    table_names = [el.get_text(strip=True) for el in soup.select(".style1")]
+    table_index_dict = {name: i for i, name in enumerate(table_names) if name}
+
+    if makeup_tab:
+        driver.execute_script("window.open(arguments[0])", tdm.config.URL)
+        driver.switch_to.window(driver.window_handles[Chrome.INDIVIDUAL_MAKEUPTEST_TAB])
+        driver.execute_script("document.title = '재시험 안내'")
+        driver.switch_to.window(driver.window_handles[Chrome.DAILYTEST_RESULT_TAB])
+
+    return driver, table_index_dict
+
+def fill_individual_test_message(
+    driver: ChromeWebDriver,
+    table_index_dict: dict[str, int],
     student_name: str,
     class_name: str,
     test_name: str,
@@ -442,127 +738,119 @@ def send_individual_test_message(
     makeup_test_check: bool,
     makeup_test_date: dict[str, Any],
     prog: Progress,
+    holidays: list | None = None,
 ) -> bool:
     """
-    개별 시험에 대한 결과 메시지 전송
-    """
-
-    service = Service()
-    service.creation_flags = CREATE_NO_WINDOW
-    options = ChromeOptions()
-    options.add_argument("--disable-gpu")
-    options.add_argument("--disable-extensions")
-    options.add_argument("--blink-settings=imagesEnabled=false")
-    options.add_argument("--ignore-certificate-errors")
-    options.add_argument("--allow-running-insecure-content")
-    options.accept_insecure_certs = True
-    options.page_load_strategy = "eager"
-    options.add_experimental_option("detach", True)
+    `launch_individual_message_browser`로 띄운 탭에 개별 시험 결과 및 재시험 안내 작성
 
+    재시험 일정은 재시험 명단 저장과 같은 배정(`tdm.makeupplan.plan_student`) 사용
+    """
     if " (모의고사)" in class_name:
         class_name = class_name[:-7]
 
-    student_wb = None
-    student_ws = None
-    try:
-        driver = _create_chrome_driver(service=service, options=options)
-        # 아이소식 접속
-        driver.get(tdm.config.URL)
-        driver.execute_script("document.title = '시험 결과 전송'")
-        _set_value_with_events(driver, driver.find_element(By.XPATH, '//*[@id="ctitle"]'), tdm.config.TEST_RESULT_MESSAGE)
-
-        # 반 인덱스 dict (BeautifulSoup 사용으로 DOM 접근 최소화)
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        table_names = [el.get_text(strip=True) for el in soup.select(".style1")]
-        table_index_dict = {name: i for i, name in enumerate(table_names) if name}
-
-        class_index = table_index_dict.get(class_name)
-        if class_index is None:
-            prog.warning(f"아이소식에 {class_name} 반이 존재하지 않습니다.")
-            return False
-
-        # DAILY 탭에서 학생 입력칸 캐시
-        daily_inputs = _cache_table_inputs(driver, class_index)
-        target_inputs = daily_inputs.get(student_name)
-        if not target_inputs:
-            prog.warning(f"아이소식의 {class_name} 내 {student_name} 학생이 존재하지 않습니다.")
-            return False
+    class_index = table_index_dict.get(class_name)
+    if class_index is None:
+        prog.warning(f"아이소식에 {class_name} 반이 존재하지 않습니다.")
+        return False
 
-        in0, in1, in2 = target_inputs
-        _set_input(driver, in0, test_name)
-        _set_input(driver, in1, test_score)
-        _set_value_with_events(driver, in2, test_average)
+    # DAILY 탭에서 학생 입력칸 캐시
+    driver.switch_to.window(driver.window_handles[Chrome.DAILYTEST_RESULT_TAB])
+    daily_inputs = _cache_table_inputs(driver, class_index)
+    target_inputs = daily_inputs.get(student_name)
+    if not target_inputs:
+        prog.warning(f"아이소식의 {class_name} 내 {student_name} 학생이 존재하지 않습니다.")
+        return False
 
-        if test_score >= 80 or makeup_test_check:
-            return True
+    in0, in1, in2 = target_inputs
+    _set_input(driver, in0, test_name)
+    _set_input(driver, in1, test_score)
+    _set_value_with_events(driver, in2, test_average)
 
-        # 재시험 안내가 필요한 경우에만 학생정보 파일 오픈
-        student_wb = tdm.studentinfo.open()
-        student_ws = tdm.studentinfo.open_worksheet(student_wb)
+    if test_score >= 80 or makeup_test_check:
+        return True
 
-        # 재시험 탭 오픈
+    # 재시험 탭 (미리 열려 있지 않으면 새로 오픈)
+    if len(driver.window_handles) <= Chrome.INDIVIDUAL_MAKEUPTEST_TAB:
         driver.execute_script("window.open(arguments[0])", tdm.config.URL)
         driver.switch_to.window(driver.window_handles[Chrome.INDIVIDUAL_MAKEUPTEST_TAB])
         driver.execute_script("document.title = '재시험 안내'")
+    else:
+        driver.switch_to.window(driver.window_handles[Chrome.INDIVIDUAL_MAKEUPTEST_TAB])
+
+    makeup_inputs = _cache_table_inputs(driver, class_index)
+    makeup_target_inputs = makeup_inputs.get(student_name)
+    if not makeup_target_inputs:
+        prog.warning(f"아이소식의 {class_name} 내 {student_name} 학생이 존재하지 않습니다.")
+        driver.switch_to.window(driver.window_handles[Chrome.DAILYTEST_RESULT_TAB])
+        return False
 
-        makeup_inputs = _cache_table_inputs(driver, class_index)
-        makeup_target_inputs = makeup_inputs.get(student_name)
-        if not makeup_target_inputs:
-            prog.warning(f"아이소식의 {class_name} 내 {student_name} 학생이 존재하지 않습니다.")
+    m0, m1, m2 = makeup_target_inputs
+
+    # 학생 정보 검색
+    student_index = tdm.studentinfo.load_student_index()
+    student_info = student_index.get(student_name)
+    info_exists = student_info is not None
+    makeup_test_weekday, _, _, schedule = student_info if info_exists else (None, None, False, None)
+    if not info_exists:
+        prog.warning(f"{student_name}의 학생 정보가 존재하지 않습니다.")
+
+    if info_exists and makeup_test_weekday is not None:
+        # tdm.makeupplan이 tdm.dataform을 거쳐 이 모듈을 가져오므로 사용할 때 가져옴
+        # (`import tdm.x`로 가져오면 함수 전체에서 `tdm`이 지역 이름이 되므로 다른 이름으로 가져옴)
+        from tdm import makeupplan
+        complete, calculated_schedule, time_index = makeupplan.plan_student(student_name, student_index, makeup_test_date, holidays)
+        if complete:
+            _set_value_with_events(
+                driver,
+                driver.find_element(By.XPATH, '//*[@id="ctitle"]'),
+                tdm.config.MAKEUP_TEST_SCHEDULE_MESSAGE,
+            )
+            _set_input(driver, m0, test_name)
+
+            calculated_schedule_str = date_to_kor_date(calculated_schedule)
+            schedule_text = calculated_schedule_str
+
+            if not schedule.time_valid:
+                prog.warning(f"{student_name}의 재시험 시간이 올바른 양식이 아닙니다.")
+            elif schedule.time_at(time_index) is not None:
+                schedule_text = f"{calculated_schedule_str} {schedule.time_at(time_index)}시"
+
+            _set_value_with_events(driver, m1, schedule_text)
+            _set_value_with_events(driver, m2, "")
             driver.switch_to.window(driver.window_handles[Chrome.DAILYTEST_RESULT_TAB])
-            return False
+            return True
+        else:
+            prog.warning(f"{student_name}의 재시험 요일이 올바른 양식이 아닙니다.")
 
-        m0, m1, m2 = makeup_target_inputs
-
-        # 학생 정보 검색
-        info_exists, makeup_test_weekday, makeup_test_time, _ = tdm.studentinfo.get_student_info(student_ws, student_name)
-        if not info_exists:
-            prog.warning(f"{student_name}의 학생 정보가 존재하지 않습니다.")
-
-        if info_exists and makeup_test_weekday is not None:
-            complete, calculated_schedule, time_index = calculate_makeup_test_schedule(makeup_test_weekday, makeup_test_date)
-            if complete:
-                _set_value_with_events(
-                    driver,
-                    driver.find_element(By.XPATH, '//*[@id="ctitle"]'),
-                    tdm.config.MAKEUP_TEST_SCHEDULE_MESSAGE,
-                )
-                _set_input(driver, m0, test_name)
-
-                calculated_schedule_str = date_to_kor_date(calculated_schedule)
-                schedule_text = calculated_schedule_str
-
-                if makeup_test_time is not None:
-                    mt = str(makeup_test_time)
-                    if "/" in mt:
-                        if len(makeup_test_weekday.split("/")) == len(mt.split("/")):
-                            schedule_text = f"{calculated_schedule_str} {mt.split('/')[time_index]}시"
-                        else:
-                            prog.warning(f"{student_name}의 재시험 시간이 올바른 양식이 아닙니다.")
-                    else:
-                        schedule_text = f"{calculated_schedule_str} {mt}시"
-
-                _set_value_with_events(driver, m1, schedule_text)
-                _set_value_with_events(driver, m2, "")
-                driver.switch_to.window(driver.window_handles[Chrome.DAILYTEST_RESULT_TAB])
-                return True
-            else:
-                prog.warning(f"{student_name}의 재시험 요일이 올바른 양식이 아닙니다.")
-
-        # 재시험 일정 없음
-        _set_value_with_events(
-            driver,
-            driver.find_element(By.XPATH, '//*[@id="ctitle"]'),
-            tdm.config.MAKEUP_TEST_NO_SCHEDULE_MESSAGE,
-        )
-        _set_input(driver, m0, test_name)
-        _set_value_with_events(driver, m1, "")
+    # 재시험 일정 없음
+    _set_value_with_events(
+        driver,
+        driver.find_element(By.XPATH, '//*[@id="ctitle"]'),
+        tdm.config.MAKEUP_TEST_NO_SCHEDULE_MESSAGE,
+    )
+    _set_input(driver, m0, test_name)
+    _set_value_with_events(driver, m1, "")
 
-        driver.switch_to.window(driver.window_handles[Chrome.DAILYTEST_RESULT_TAB])
-        return True
-    finally:
-        if student_wb is not None:
-            try:
-                student_wb.close()
-            except Exception:
-                pass
+    driver.switch_to.window(driver.window_handles[Chrome.DAILYTEST_RESULT_TAB])
+    return True
+
+def send_individual_test_message(
+    student_name: str,
+    class_name: str,
+    test_name: str,
+    test_score: int | float,
+    test_average: int | float | str,
+    makeup_test_check: bool,
+    makeup_test_date: dict[str, Any],
+    prog: Progress,
+    holidays: list | None = None,
+) -> bool:
+    """
+    개별 시험에 대한 결과 메시지 전송
+    """
+    driver, table_index_dict = launch_individual_message_browser(makeup_tab=test_score < 80 and not makeup_test_check)
+    return fill_individual_test_message(
+        driver, table_index_dict,
+        student_name, class_name, test_name, test_score, test_average,
+        makeup_test_check, makeup_test_date, prog, holidays,
+    )
@@ -2,11 +2,11 @@ import os
 import openpyxl as xl
 import zipfile
 
-from datetime import datetime
 from openpyxl.utils.cell import get_column_letter as gcl
 from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.worksheet.datavalidation import DataValidation
 
+import tdm.backup
 import tdm.chrome
 import tdm.config
 
@@ -14,6 +14,7 @@ from tdm.defs import ClassInfo
 from tdm.exception import NoMatchingSheetException, FileOpenException, ReopenFileException
 from tdm.progress import Progress
 from tdm.style import BORDER_ALL, ALIGN_CENTER, ALIGN_CENTER_WRAP
+from tdm.util import sync_name_rows
 
 # 파일 기본 작업
 def make_file():
@@ -88,12 +89,7 @@ def isopen() -> bool:
 
 # 파일 유틸리티
 def make_backup_file():
-    if not os.path.isdir(f"{tdm.config.DATA_DIR}/data"):
-        os.mkdir(f"{tdm.config.DATA_DIR}/data")
-    if not os.path.isdir(f"{tdm.config.DATA_DIR}/data/backup"):
-        os.mkdir(f"{tdm.config.DATA_DIR}/data/backup")
-    wb = open(read_only=False)
-    wb.save(f"{tdm.config.DATA_DIR}/data/backup/{ClassInfo.DEFAULT_NAME}({datetime.today().strftime('%Y%m%d%H%M%S')}).xlsx")
+    tdm.backup.make_backup(f"{tdm.config.DATA_DIR}/{ClassInfo.DEFAULT_NAME}.xlsx", ClassInfo.DEFAULT_NAME)
 
 def get_class_info(class_name:str, ws:Worksheet = None):
     """
@@ -154,44 +150,25 @@ def make_temp_file_for_update(new_class_list:list[str]):
     """
     반 업데이트 작업에 필요한 임시 반 정보 파일 생성
 
-    팝업창을 기준으로 업데이트 된 반을 추가하고 삭제된 반을 삭제함
+    팝업창을 기준으로 업데이트 된 반을 추가하고 삭제된 반을 삭제함 (`tdm.util.sync_name_rows`).
+    모의고사 응시여부 열의 데이터 유효성 검사는 범위 하나로 다시 지정
     """
     make_backup_file()
 
     wb = open(read_only=False)
     ws = open_worksheet(wb)
 
-    class_names = set(get_class_names(ws))
-
-    unregistered_class_names = sorted(list(set(new_class_list).difference(class_names)))
-
-    for row in range(2, ws.max_row+1):
-        while ws.cell(row, ClassInfo.CLASS_NAME_COLUMN).value is not None and ws.cell(row, ClassInfo.CLASS_NAME_COLUMN).value not in new_class_list:
-            ws.delete_rows(row)
-
-    temp_path = os.path.abspath(f'{tdm.config.DATA_DIR}/{ClassInfo.TEMP_FILE_NAME}.xlsx')
-
-    if len(unregistered_class_names) == 0:
-        save_to_temp(wb)
-        return temp_path
-
-    for row in range(ws.max_row+1, 1, -1):
-        if ws.cell(row-1, ClassInfo.CLASS_NAME_COLUMN).value is not None:
-            WRITE_RANGE = WRITE_ROW = row
-            break
-
-    for row, class_name in enumerate(unregistered_class_names, start=WRITE_ROW):
-        ws.cell(row, ClassInfo.CLASS_NAME_COLUMN).value = class_name
-
-    for row in range(WRITE_RANGE, ws.max_row + 1):
-        if ws.cell(row, ClassInfo.CLASS_NAME_COLUMN).value is None: break
-        for col in range(1, ClassInfo.MAX + 1):
-            ws.cell(row, col).alignment = ALIGN_CENTER
-            ws.cell(row, col).border    = BORDER_ALL
+    sync_name_rows(
+        ws, set(new_class_list),
+        name_column=ClassInfo.CLASS_NAME_COLUMN,
+        max_column=ClassInfo.MAX,
+        validation_column=ClassInfo.MOCKTEST_CHECK_COLUMN,
+        validation_error="이 셀의 값은 'Y'이어야 합니다.",
+    )
 
     save_to_temp(wb)
 
-    return temp_path
+    return os.path.abspath(f'{tdm.config.DATA_DIR}/{ClassInfo.TEMP_FILE_NAME}.xlsx')
 
 def change_class_info(target_class_name:str, target_teacher_name:str):
     """
@@ -16,6 +16,7 @@ REQUIRED_KEYS = (
     "termsAccepted",
     "noticeSeenId",
 )
+DEFAULT_BACKUP_RETENTION = {"hourly": 24, "daily": 30, "monthly": 0}
 
 
 def _default_config() -> dict:
@@ -28,9 +29,23 @@ def _default_config() -> dict:
         "makeupTestDate": "",
         "termsAccepted": False,
         "noticeSeenId": "",
+        "makeupTestCapacity": {},
+        "backupRetention": dict(DEFAULT_BACKUP_RETENTION),
     }
 
 
+def normalize_backup_retention(raw) -> dict:
+    """백업 보존 정책 `{"hourly": 시간, "daily": 일, "monthly": 개월}` (0은 hourly/daily는 사용 안 함, monthly는 계속 보관)"""
+    retention = dict(DEFAULT_BACKUP_RETENTION)
+    if isinstance(raw, dict):
+        for key in retention:
+            try:
+                retention[key] = max(0, int(raw.get(key, retention[key])))
+            except (TypeError, ValueError):
+                pass
+    return retention
+
+
 def _normalize_config(raw: dict) -> dict:
     normalized = _default_config()
     for key in REQUIRED_KEYS:
@@ -41,6 +56,10 @@ def _normalize_config(raw: dict) -> dict:
             normalized[key] = value if isinstance(value, str) else str(value)
         else:
             normalized[key] = value if isinstance(value, str) else str(value)
+
+    capacity = raw.get("makeupTestCapacity", {})
+    normalized["makeupTestCapacity"] = capacity if isinstance(capacity, dict) else {}
+    normalized["backupRetention"] = normalize_backup_retention(raw.get("backupRetention"))
     return normalized
 
 
@@ -66,7 +85,7 @@ def _save_config(cfg: dict) -> None:
 def _sync_runtime_values() -> None:
     global DATA_FILE_NAME, URL, TEST_RESULT_MESSAGE
     global MAKEUP_TEST_NO_SCHEDULE_MESSAGE, MAKEUP_TEST_SCHEDULE_MESSAGE
-    global DATA_DIR, DATA_DIR_VALID, TERMS_ACCEPTED, NOTICE_SEEN_ID
+    global DATA_DIR, DATA_DIR_VALID, TERMS_ACCEPTED, NOTICE_SEEN_ID, MAKEUP_TEST_CAPACITY, BACKUP_RETENTION
 
     DATA_FILE_NAME = config.get("dataFileName", "").strip()
     URL = config.get("url", "").strip()
@@ -77,6 +96,8 @@ def _sync_runtime_values() -> None:
     DATA_DIR_VALID = bool(DATA_DIR) and os.path.isdir(DATA_DIR)
     TERMS_ACCEPTED = bool(config.get("termsAccepted", False))
     NOTICE_SEEN_ID = config.get("noticeSeenId", "").strip()
+    MAKEUP_TEST_CAPACITY = dict(config.get("makeupTestCapacity", {}))
+    BACKUP_RETENTION = normalize_backup_retention(config.get("backupRetention"))
 
 
 def _ensure_data_directories() -> None:
@@ -91,6 +112,15 @@ CONFIG_EXISTS = CONFIG_PATH.exists()
 _sync_runtime_values()
 
 
+def reload() -> None:
+    """다른 프로세스에서 변경된 설정을 반영하기 위해 config.json을 다시 읽음"""
+    global config, CONFIG_READY, CONFIG_EXISTS
+
+    config, CONFIG_READY = _load_config()
+    CONFIG_EXISTS = CONFIG_PATH.exists()
+    _sync_runtime_values()
+
+
 def is_initialized() -> bool:
     return (
         CONFIG_READY
@@ -128,6 +158,23 @@ def set_notice_seen_id(notice_id: str) -> None:
     _save_config(config)
 
 
+def set_makeup_test_capacity(capacity: dict) -> None:
+    """재시험 정원 설정 (`{"월": 20, "월 16": 8}`, 0 이하는 제한 없음)"""
+    global MAKEUP_TEST_CAPACITY, CONFIG_READY
+    MAKEUP_TEST_CAPACITY = {str(k).strip(): int(v) for k, v in (capacity or {}).items() if str(k).strip() and int(v) > 0}
+    config["makeupTestCapacity"] = MAKEUP_TEST_CAPACITY
+    CONFIG_READY = True
+    _save_config(config)
+
+
+def set_backup_retention(retention: dict) -> None:
+    global BACKUP_RETENTION, CONFIG_READY
+    BACKUP_RETENTION = normalize_backup_retention(retention)
+    config["backupRetention"] = BACKUP_RETENTION
+    CONFIG_READY = True
+    _save_config(config)
+
+
 def initialize_config(
     url: str,
     data_dir: str,
@@ -9,6 +9,7 @@ from openpyxl.utils.cell import get_column_letter as gcl
 from openpyxl.worksheet.formula import ArrayFormula
 from openpyxl.worksheet.worksheet import Worksheet
 
+import tdm.backup
 import tdm.chrome
 import tdm.classinfo
 import tdm.config
@@ -143,8 +144,16 @@ def open(data_only:bool=False, read_only:bool=False) -> xl.Workbook:
     except zipfile.BadZipFile:
         raise ReopenFileException(f"{tdm.config.DATA_FILE_NAME} 파일을 직접 연 후 닫으면 문제가 해결될 수 있습니다.")
 
+def temp_path() -> str:
+    """
+    임시 파일 경로
+
+    작업자 프로세스끼리 같은 임시 파일을 덮어쓰지 않도록 프로세스별로 구분
+    """
+    return f"{tdm.config.DATA_DIR}/data/{DataFile.TEMP_FILE_NAME}-{os.getpid()}.xlsx"
+
 def open_temp(data_only:bool=False, read_only:bool=False) -> xl.Workbook:
-    return xl.load_workbook(f"{tdm.config.DATA_DIR}/data/{DataFile.TEMP_FILE_NAME}.xlsx", data_only=data_only, read_only=read_only)
+    return xl.load_workbook(temp_path(), data_only=data_only, read_only=read_only)
 
 def save(wb:xl.Workbook):
     try:
@@ -157,12 +166,12 @@ def save(wb:xl.Workbook):
 def save_to_temp(wb:xl.Workbook):
     if not os.path.isdir(f"{tdm.config.DATA_DIR}/data"):
         os.mkdir(f"{tdm.config.DATA_DIR}/data")
-    wb.save(f"{tdm.config.DATA_DIR}/data/{DataFile.TEMP_FILE_NAME}.xlsx")
-    os.system(f"attrib +h {tdm.config.DATA_DIR}/data/{DataFile.TEMP_FILE_NAME}.xlsx")
+    wb.save(temp_path())
+    os.system(f"attrib +h {temp_path()}")
 
 def delete_temp():
     try:
-        os.remove(f"{tdm.config.DATA_DIR}/data/{DataFile.TEMP_FILE_NAME}.xlsx")
+        os.remove(temp_path())
     except:
         pass
 
@@ -179,12 +188,7 @@ def file_validation():
 
 # 파일 유틸리티
 def make_backup_file():
-    if not os.path.isdir(f"{tdm.config.DATA_DIR}/data"):
-        os.mkdir(f"{tdm.config.DATA_DIR}/data")
-    if not os.path.isdir(f"{tdm.config.DATA_DIR}/data/backup"):
-        os.mkdir(f"{tdm.config.DATA_DIR}/data/backup")
-    wb = open()
-    wb.save(f"{tdm.config.DATA_DIR}/data/backup/{tdm.config.DATA_FILE_NAME}({datetime.today().strftime('%Y%m%d%H%M%S')}).xlsx")
+    tdm.backup.make_backup(f"{tdm.config.DATA_DIR}/data/{tdm.config.DATA_FILE_NAME}.xlsx", tdm.config.DATA_FILE_NAME)
 
 def get_data_sorted_dict(mocktest = False):
     """
@@ -321,20 +325,22 @@ def check_student_exist(studnet_name):
     return exist
 
 # 파일 작업
-def save_test_data(filepath:str, prog: Progress):
+def save_test_data(filepath:str, prog: Progress, form:tdm.dataform.FormValues=None, student_index:dict[str, tuple]=None):
     """
     데이터 양식에 작성된 데이터를 데이터 파일에 저장
+
+    `form`, `student_index`를 넘기면 기록 양식과 학생 정보를 다시 읽지 않음
     """
     # 임시 파일 삭제
-    if os.path.isfile(f"{tdm.config.DATA_DIR}/data/{DataFile.TEMP_FILE_NAME}.xlsx"):
+    if os.path.isfile(temp_path()):
         delete_temp()
 
-    form_wb = tdm.dataform.open(filepath)
-    form_ws = tdm.dataform.open_worksheet(form_wb)
+    if form is None:
+        form = tdm.dataform.read_form(filepath)
 
-    # 학생 정보 열기
-    student_wb = tdm.studentinfo.open(True)
-    student_ws = tdm.studentinfo.open_worksheet(student_wb)
+    # 학생 정보 색인
+    if student_index is None:
+        student_index = tdm.studentinfo.load_student_index()
 
     file_validation()
 
@@ -357,13 +363,13 @@ def save_test_data(filepath:str, prog: Progress):
             TEST_SCORE_COLUMN   = DataForm.MOCKTEST_SCORE_COLUMN
             TEST_AVERAGE_COLUMN = DataForm.MOCKTEST_AVERAGE_COLUMN
 
-        for i in range(2, form_ws.max_row+1): # 데일리데이터 기록 양식 루프
+        for i in range(2, form.max_row+1): # 데일리데이터 기록 양식 루프
             # 반 필터링
-            if (form_ws.cell(i, DataForm.CLASS_NAME_COLUMN).value is not None) and (form_ws.cell(i, TEST_NAME_COLUMN).value is not None):
-                class_name   = form_ws.cell(i, DataForm.CLASS_NAME_COLUMN).value
+            if (form.value(i, DataForm.CLASS_NAME_COLUMN) is not None) and (form.value(i, TEST_NAME_COLUMN) is not None):
+                class_name   = form.value(i, DataForm.CLASS_NAME_COLUMN)
                 if t == 1: class_name += " (모의고사)"
-                test_name    = form_ws.cell(i, TEST_NAME_COLUMN).value
-                test_average = form_ws.cell(i, TEST_AVERAGE_COLUMN).value
+                test_name    = form.value(i, TEST_NAME_COLUMN)
+                test_average = form.value(i, TEST_AVERAGE_COLUMN)
 
                 no_class = False
 
@@ -416,8 +422,8 @@ def save_test_data(filepath:str, prog: Progress):
                 if type(test_average) in (int, float):
                     ws.cell(CLASS_END, WRITE_COLUMN).fill = class_average_color(test_average)
 
-            test_score   = form_ws.cell(i, TEST_SCORE_COLUMN).value
-            student_name = form_ws.cell(i, DataForm.STUDENT_NAME_COLUMN).value
+            test_score   = form.value(i, TEST_SCORE_COLUMN)
+            student_name = form.value(i, DataForm.STUDENT_NAME_COLUMN)
 
             if test_score is None:
                 continue
@@ -443,7 +449,7 @@ def save_test_data(filepath:str, prog: Progress):
     prog.step("데이터 저장 완료")
 
     # 조건부 서식 수식 로딩
-    _recalculate_with_excel(f"{tdm.config.DATA_DIR}/data/{DataFile.TEMP_FILE_NAME}.xlsx")
+    _recalculate_with_excel(temp_path())
 
     wb           = open_temp()
     data_only_wb = open_temp(data_only=True)
@@ -473,9 +479,9 @@ def save_test_data(filepath:str, prog: Progress):
         if ws.cell(row, STUDENT_NAME_COLUMN).font.color is not None and ws.cell(row, STUDENT_NAME_COLUMN).font.color.rgb == "FFFF0000":
             continue
 
-        exist, _, _, new_student = tdm.studentinfo.get_student_info(student_ws, ws.cell(row, STUDENT_NAME_COLUMN).value)
-        if exist:
-            if new_student:
+        student_info = student_index.get(ws.cell(row, STUDENT_NAME_COLUMN).value)
+        if student_info is not None:
+            if student_info[2]:
                 ws.cell(row, STUDENT_NAME_COLUMN).fill = FILL_NEW_STUDENT
             else:
                 ws.cell(row, STUDENT_NAME_COLUMN).fill = FILL_NONE
@@ -491,7 +497,7 @@ def save_test_data(filepath:str, prog: Progress):
 def save_individual_test_data(target_row:int, target_col:int, test_score:int|float):
     """정규 시험에 미응시한 학생의 결과를 입력하고 해당 반의 평균을 반환"""
     # 임시 파일 삭제
-    if os.path.isfile(f"{tdm.config.DATA_DIR}/data/{DataFile.TEMP_FILE_NAME}.xlsx"):
+    if os.path.isfile(temp_path()):
         delete_temp()
 
     file_validation()
@@ -509,7 +515,7 @@ def save_individual_test_data(target_row:int, target_col:int, test_score:int|flo
 
     save_to_temp(wb)
 
-    _recalculate_with_excel(f"{tdm.config.DATA_DIR}/data/{DataFile.TEMP_FILE_NAME}.xlsx")
+    _recalculate_with_excel(temp_path())
 
     wb           = open_temp()
     data_only_wb = open_temp(True)
@@ -552,8 +558,7 @@ def conditional_formatting():
 
     wb           = open()
     data_only_wb = open(data_only=True, read_only=True)
-    student_wb   = tdm.studentinfo.open()
-    student_ws   = tdm.studentinfo.open_worksheet(student_wb)
+    student_index = tdm.studentinfo.load_student_index()
 
     ws           = wb[DataFile.DEFAULT_SHEET_NAME]
     data_only_ws = data_only_wb[DataFile.DEFAULT_SHEET_NAME]
@@ -623,9 +628,9 @@ def conditional_formatting():
             continue
 
         # 신규생 하이라이트
-        exist, _, _, new_student = tdm.studentinfo.get_student_info(student_ws, ws.cell(row, STUDENT_NAME_COLUMN).value)
-        if exist:
-            if new_student:
+        student_info = student_index.get(ws.cell(row, STUDENT_NAME_COLUMN).value)
+        if student_info is not None:
+            if student_info[2]:
                 ws.cell(row, STUDENT_NAME_COLUMN).fill = FILL_NEW_STUDENT
             else:
                 ws.cell(row, STUDENT_NAME_COLUMN).fill = FILL_NONE
@@ -120,6 +120,35 @@ def make_file() -> bool:
 def open(filepath, data_only=True) -> xl.Workbook:
     return xl.load_workbook(filepath, data_only=data_only)
 
+class FormValues:
+    """
+    기록 양식 값 스냅샷
+
+    셀/스타일 객체 없이 값만 보관하며 `ws.cell(row, col).value`와 같은 좌표(1부터 시작)로 조회
+    """
+    def __init__(self, rows:list[tuple]):
+        self.rows    = rows
+        self.max_row = len(rows)
+
+    def value(self, row:int, col:int):
+        try:
+            return self.rows[row-1][col-1]
+        except IndexError:
+            return None
+
+def read_form(filepath) -> FormValues:
+    """
+    기록 양식을 `read_only`, `values_only`로 한 번 읽어 `FormValues`로 반환
+    """
+    wb = xl.load_workbook(filepath, data_only=True, read_only=True)
+    try:
+        ws = open_worksheet(wb)
+        rows = [tuple(row) for row in ws.iter_rows(max_col=DataForm.MAX, values_only=True)]
+    finally:
+        wb.close()
+
+    return FormValues(rows)
+
 def open_worksheet(wb:xl.Workbook):
     try:
         return wb[DataForm.DEFAULT_NAME]
@@ -6,6 +6,13 @@ class Chrome:
     MAKEUPTEST_SCHEDULE_TAB    =  2 # 재시험 고지 탭(날짜 지정)
     INDIVIDUAL_MAKEUPTEST_TAB  =  1 # 개별 시험 결과 메시지 탭
 
+    ROSTER_CACHE_NAME          = "아이소식 명단" # data 폴더 내 반/학생 명단 캐시(json)
+    ROSTER_CACHE_MAX_AGE       = 60 * 60        # 캐시 유효 시간(초)
+    HTTP_OUTPUT_DIR_NAME       = "아이소식 작성"  # HTTP 방식으로 생성한 페이지 저장 폴더(data 폴더 내)
+
+class MessagePreview:
+    DEFAULT_NAME               = "메시지 미리보기"
+
 class DataFile:
     PRE_DATA_FILE_NAME         = "지난 데이터"
     TEMP_FILE_NAME             = "9IwTEoG59MS6h2UoqveD"
@@ -35,6 +42,10 @@ class DataForm:
 
 class MakeupTestList: 
     DEFAULT_NAME               = "재시험 명단"
+    INDEX_NAME                 = "재시험 명단 색인"
+    ARCHIVE_DIR_NAME           = "재시험 명단 보관"
+    ARCHIVE_INDEX_NAME         = "재시험 명단 보관 색인"
+    ARCHIVE_AFTER_DAYS         = 30
     TEST_DATE_COLUMN           = 1
     CLASS_NAME_COLUMN          = 2
     TEACHER_NAME_COLUMN        = 3
@@ -0,0 +1,194 @@
+import json
+import os
+import openpyxl as xl
+import threading
+
+from copy import copy
+from datetime import datetime, timedelta
+
+import tdm.config
+import tdm.makeupindex
+import tdm.makeuptest
+
+from tdm.defs import MakeupTestList
+from tdm.exception import FileOpenException
+from tdm.progress import Progress
+
+# 보관 색인 항목: [응시일, 반, 이름, 시험명, 재시 날짜, 재시 점수, 보관 월]
+_ARCHIVE_FIELDS = ("test_date", "class_name", "student_name", "test_name", "makeup_test_date", "makeup_test_score", "month")
+
+
+def archive_dir() -> str:
+    return f"{tdm.config.DATA_DIR}/data/{MakeupTestList.ARCHIVE_DIR_NAME}"
+
+def archive_path(month:str) -> str:
+    """`month`: "YYYY-MM" """
+    return f"{archive_dir()}/{MakeupTestList.DEFAULT_NAME} {month}.xlsx"
+
+def summary_path() -> str:
+    return f"{archive_dir()}/{MakeupTestList.ARCHIVE_INDEX_NAME}.json"
+
+def _date_text(value) -> str | None:
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d")
+    return None if value is None else str(value)
+
+def _load_summary() -> list[list]:
+    try:
+        with open(summary_path(), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return []
+    return data if isinstance(data, list) else []
+
+def _save_summary(entries:list[list]) -> None:
+    path = summary_path()
+    # 서버 프로세스의 여러 스레드가 동시에 쓸 수 있으므로 스레드마다 다른 임시 파일 사용
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(entries, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+def _row_ident(ws, row:int) -> tuple:
+    """보관 중복 확인용 행 식별 값 (응시일, 반, 이름, 시험명)"""
+    return (
+        _date_text(ws.cell(row, MakeupTestList.TEST_DATE_COLUMN).value),
+        ws.cell(row, MakeupTestList.CLASS_NAME_COLUMN).value,
+        ws.cell(row, MakeupTestList.STUDENT_NAME_COLUMN).value,
+        ws.cell(row, MakeupTestList.TEST_NAME_COLUMN).value,
+    )
+
+def _open_archive(month:str) -> xl.Workbook:
+    path = archive_path(month)
+    if os.path.isfile(path):
+        return xl.load_workbook(path)
+
+    return tdm.makeuptest.make_workbook()
+
+def _copy_row(src_ws, src_row:int, dst_ws, dst_row:int) -> None:
+    for col in range(1, MakeupTestList.MAX + 1):
+        src = src_ws.cell(src_row, col)
+        dst = dst_ws.cell(dst_row, col)
+        dst.value = src.value
+        if src.has_style:
+            if src_ws.parent is dst_ws.parent:
+                dst._style = copy(src._style)
+            else:
+                dst.number_format = src.number_format
+                dst.alignment     = copy(src.alignment)
+                dst.border        = copy(src.border)
+                dst.fill          = copy(src.fill)
+                dst.font          = copy(src.font)
+
+def archive_completed_tests(prog:Progress, after_days:int = MakeupTestList.ARCHIVE_AFTER_DAYS) -> int:
+    """
+    재시 점수가 입력되었고 응시일이 `after_days`일보다 오래된 행을 월별 보관 파일로 이동
+
+    재시험 명단을 한 번 훑으면서 남길 행은 위로 당겨 쓰고 보관할 행은 응시 월별로 모은 뒤,
+    보관 파일과 보관 색인을 먼저 저장하고 재시험 명단을 저장
+
+    보관 파일/보관 색인에 이미 있는 행(응시일, 반, 이름, 시험명이 같은 행)은 다시 추가하지 않으므로,
+    중간에 실패해 재시험 명단에 행이 남아 있어도 다시 실행하면 중복 없이 이어서 보관
+
+    return: 보관한 행 수
+    """
+    if tdm.makeuptest.isopen():
+        raise FileOpenException(f"{MakeupTestList.DEFAULT_NAME} 파일을 닫은 뒤 다시 시도해주세요")
+
+    cutoff = datetime.today() - timedelta(days=after_days)
+
+    wb = tdm.makeuptest.open()
+    ws = tdm.makeuptest.open_worksheet(wb)
+
+    prog.info(f"{MakeupTestList.DEFAULT_NAME} 확인 중...")
+
+    archive_rows: dict[str, list[int]] = {}
+    keep_rows: list[int] = []
+    last_row = 1
+    for row in range(2, ws.max_row + 1):
+        test_date = ws.cell(row, MakeupTestList.TEST_DATE_COLUMN).value
+        if test_date is None and all(ws.cell(row, col).value is None for col in range(1, MakeupTestList.MAX + 1)):
+            continue
+        last_row = row
+
+        score = ws.cell(row, MakeupTestList.MAKEUPTEST_SCORE_COLUMN).value
+        if isinstance(test_date, datetime) and test_date < cutoff and score not in (None, ""):
+            archive_rows.setdefault(test_date.strftime("%Y-%m"), []).append(row)
+        else:
+            keep_rows.append(row)
+
+    archived = sum(len(rows) for rows in archive_rows.values())
+    if archived == 0:
+        wb.close()
+        return 0
+
+    # 1) 월별 보관 파일에 추가 (월마다 보관 파일 저장 후 보관 색인 저장)
+    os.makedirs(archive_dir(), exist_ok=True)
+    summary = _load_summary()
+    summary_idents = {tuple(entry[:4]) for entry in summary}
+    for i, (month, rows) in enumerate(sorted(archive_rows.items()), start=1):
+        prog.phase(i, len(archive_rows), f"{month} 보관 파일 저장 중... ({len(rows)}건)")
+
+        archive_wb = _open_archive(month)
+        archive_ws = archive_wb[MakeupTestList.DEFAULT_NAME]
+
+        write_row = archive_ws.max_row + 1
+        while write_row > 2 and archive_ws.cell(write_row - 1, MakeupTestList.TEST_DATE_COLUMN).value is None:
+            write_row -= 1
+        archived_idents = {_row_ident(archive_ws, row) for row in range(2, write_row)}
+
+        added = False
+        for row in rows:
+            ident = _row_ident(ws, row)
+            if ident not in archived_idents:
+                _copy_row(ws, row, archive_ws, write_row)
+                write_row += 1
+                archived_idents.add(ident)
+                added = True
+
+            if ident not in summary_idents:
+                summary.append([
+                    *ident,
+                    _date_text(ws.cell(row, MakeupTestList.MAKEUPTEST_DATE_COLUMN).value),
+                    ws.cell(row, MakeupTestList.MAKEUPTEST_SCORE_COLUMN).value,
+                    month,
+                ])
+                summary_idents.add(ident)
+
+        if added:
+            try:
+                archive_wb.save(archive_path(month))
+            except PermissionError:
+                raise FileOpenException(f"{os.path.basename(archive_path(month))} 파일을 닫은 뒤 다시 시도해주세요")
+        _save_summary(summary)
+
+    # 2) 남길 행을 위로 당겨 쓰고 남은 아래쪽을 한 번에 삭제
+    prog.info(f"{MakeupTestList.DEFAULT_NAME} 정리 중...")
+    for write_row, row in enumerate(keep_rows, start=2):
+        if write_row != row:
+            _copy_row(ws, row, ws, write_row)
+    first_unused = len(keep_rows) + 2
+    if first_unused <= last_row:
+        ws.delete_rows(first_unused, last_row - first_unused + 1)
+
+    tdm.makeuptest.save(wb)
+
+    # 행 번호가 바뀌었으므로 재시험 색인은 다음 조회 때 다시 구성
+    tdm.makeupindex.reset()
+
+    return archived
+
+def search_archive(student_name:str = "", class_name:str = "", test_name:str = "") -> list[dict]:
+    """보관 색인에서 이름/반/시험명(부분 일치)으로 보관된 재시험 검색"""
+    results = []
+    for entry in _load_summary():
+        item = dict(zip(_ARCHIVE_FIELDS, entry))
+        if student_name and student_name not in str(item["student_name"] or ""):
+            continue
+        if class_name and class_name not in str(item["class_name"] or ""):
+            continue
+        if test_name and test_name not in str(item["test_name"] or ""):
+            continue
+        results.append(item)
+
+    return results
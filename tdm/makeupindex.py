@@ -0,0 +1,305 @@
+import hashlib
+import json
+import os
+import openpyxl as xl
+import threading
+import zipfile
+
+from datetime import datetime
+from typing import Any, Iterable
+
+import tdm.config
+
+from tdm.defs import MakeupTestList
+from tdm.exception import NoMatchingSheetException, ReopenFileException
+
+INDEX_VERSION = 2
+
+# 행 기록: [반, 이름, 시험명, 재시 점수 입력 여부, 응시일, 재시 날짜, 담당T] (날짜는 "YYYY-MM-DD")
+_CLASS, _STUDENT, _TEST, _SCORED, _TEST_DATE, _MAKEUP_DATE, _TEACHER = range(7)
+
+
+def list_path() -> str:
+    return f"{tdm.config.DATA_DIR}/data/{MakeupTestList.DEFAULT_NAME}.xlsx"
+
+def index_path() -> str:
+    return f"{tdm.config.DATA_DIR}/data/{MakeupTestList.INDEX_NAME}.json"
+
+def file_stat() -> tuple[int, int] | None:
+    """재시험 명단 파일의 (mtime_ns, size), 파일이 없으면 None"""
+    try:
+        st = os.stat(list_path())
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+def _open_read_only() -> xl.Workbook:
+    try:
+        return xl.load_workbook(list_path(), read_only=True, data_only=True)
+    except PermissionError:
+        raise ReopenFileException(f"{MakeupTestList.DEFAULT_NAME} 파일에 접근할 수 없습니다.\n파일을 직접 연 후 닫으면 문제가 해결될 수 있습니다.")
+    except zipfile.BadZipFile:
+        raise ReopenFileException(f"{MakeupTestList.DEFAULT_NAME} 파일을 직접 연 후 닫으면 문제가 해결될 수 있습니다.")
+
+def date_key(value) -> str | None:
+    """날짜 색인 키 ("YYYY-MM-DD")"""
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d")
+    if value is None or str(value).strip() == "":
+        return None
+    return str(value).strip()
+
+def _row_key(values:tuple) -> bytes:
+    """앞부분 해시에 사용하는 행 식별 값 (점수 열은 제외하여 점수 입력으로 해시가 바뀌지 않도록 함)"""
+    ident = (
+        values[MakeupTestList.TEST_DATE_COLUMN-1],
+        values[MakeupTestList.CLASS_NAME_COLUMN-1],
+        values[MakeupTestList.STUDENT_NAME_COLUMN-1],
+        values[MakeupTestList.TEST_NAME_COLUMN-1],
+    )
+    return json.dumps(ident, ensure_ascii=False, default=str).encode("utf-8")
+
+def _record(values:tuple) -> list | None:
+    """행 값으로 만든 행 기록 (학생 이름이 없으면 None)"""
+    student_name = values[MakeupTestList.STUDENT_NAME_COLUMN-1]
+    if student_name is None:
+        return None
+    return [
+        values[MakeupTestList.CLASS_NAME_COLUMN-1],
+        student_name,
+        values[MakeupTestList.TEST_NAME_COLUMN-1],
+        values[MakeupTestList.MAKEUPTEST_SCORE_COLUMN-1] is not None,
+        date_key(values[MakeupTestList.TEST_DATE_COLUMN-1]),
+        date_key(values[MakeupTestList.MAKEUPTEST_DATE_COLUMN-1]),
+        values[MakeupTestList.TEACHER_NAME_COLUMN-1],
+    ]
+
+def _records(rows:Iterable[tuple[int, tuple]]) -> dict[int, list]:
+    records = {}
+    for row, values in rows:
+        record = _record(values)
+        if record is not None:
+            records[row] = record
+    return records
+
+class MakeupTestIndex:
+    """
+    재시험 명단 색인
+
+    파일은 아래쪽으로만 늘어나므로 마지막으로 읽은 행(`last_row`)과 그때까지의 행 식별 값 해시(`prefix_digest`)를 보관하고,
+    해시가 그대로면 새로 추가된 행만 기록 (파일 자체는 매번 끝까지 읽음, `scan` 참고)
+    """
+    def __init__(self, data:dict[str, Any] | None = None):
+        data = data or {}
+        self.stat: tuple[int, int] | None = tuple(data["stat"]) if data.get("stat") else None
+        self.last_row: int = data.get("last_row", 1)
+        self.prefix_digest: str = data.get("prefix_digest", "")
+        self.rows: dict[int, list] = {int(row): record for row, record in data.get("rows", {}).items()}
+        self._date_index: dict[int, dict[str, list[int]]] = {}
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": INDEX_VERSION,
+            "stat": list(self.stat) if self.stat else None,
+            "last_row": self.last_row,
+            "prefix_digest": self.prefix_digest,
+            "rows": {str(row): record for row, record in self.rows.items()},
+        }
+
+    def open_tests(self) -> dict[str, dict[str, int]]:
+        """
+        1st key: 학생 이름
+
+        2nd key: "(반) 시험명"
+
+        value: 행 인덱스
+        """
+        student_test_index_dict: dict[str, dict[str, int]] = {}
+        for row in sorted(self.rows):
+            record = self.rows[row]
+            if record[_SCORED]:
+                continue
+            student_test_index_dict.setdefault(record[_STUDENT], {})[f"({record[_CLASS]}) {record[_TEST]}"] = row
+
+        return student_test_index_dict
+
+    def get(self, row:int) -> list | None:
+        return self.rows.get(row)
+
+    def entry(self, row:int) -> tuple[str, str, bool] | None:
+        """(학생 이름, "(반) 시험명", 재시 점수 입력 여부), 색인에 없는 행이면 None"""
+        record = self.rows.get(row)
+        if record is None:
+            return None
+        return record[_STUDENT], f"({record[_CLASS]}) {record[_TEST]}", bool(record[_SCORED])
+
+    def rows_on(self, date:datetime | str, column:int = MakeupTestList.MAKEUPTEST_DATE_COLUMN) -> list[int]:
+        """
+        `column`(`MAKEUPTEST_DATE_COLUMN` 또는 `TEST_DATE_COLUMN`)의 날짜가 `date`인 행 목록
+
+        날짜별 색인은 처음 조회할 때 행 기록에서 한 번 만들어 둠
+        """
+        field = {MakeupTestList.MAKEUPTEST_DATE_COLUMN: _MAKEUP_DATE, MakeupTestList.TEST_DATE_COLUMN: _TEST_DATE}[column]
+        index = self._date_index.get(field)
+        if index is None:
+            index = {}
+            for row in sorted(self.rows):
+                key = self.rows[row][field]
+                if key is not None:
+                    index.setdefault(key, []).append(row)
+            self._date_index[field] = index
+
+        return list(index.get(date_key(date), ()))
+
+    def record(self, row:int) -> dict[str, Any] | None:
+        """행 기록을 이름 있는 항목으로 반환"""
+        record = self.rows.get(row)
+        if record is None:
+            return None
+        return {
+            "row": row,
+            "class_name": record[_CLASS],
+            "student_name": record[_STUDENT],
+            "test_name": record[_TEST],
+            "scored": bool(record[_SCORED]),
+            "test_date": record[_TEST_DATE],
+            "makeup_test_date": record[_MAKEUP_DATE],
+            "teacher_name": record[_TEACHER],
+        }
+
+    def mark_scored(self, rows:Iterable[int]) -> None:
+        for row in rows:
+            record = self.rows.get(row)
+            if record is not None:
+                record[_SCORED] = True
+
+    def scan(self) -> None:
+        """
+        재시험 명단을 `read_only`, `values_only`로 한 번 훑어 색인 갱신
+
+        파일은 매번 끝까지 읽음 (엑셀에서 직접 입력한 점수/재시 날짜를 반영해야 하고, `read_only` 모드는 `min_row`를 지정해도
+        앞부분을 파싱하므로 읽는 양은 줄지 않음). 앞부분 해시가 저장된 값과 같으면 기존 행 기록은 점수 입력 여부와 재시 날짜만
+        갱신하고 새 행만 기록하며, 다르면 같은 순회에서 읽어 둔 값으로 전체 재구성
+        """
+        wb = _open_read_only()
+        try:
+            if MakeupTestList.DEFAULT_NAME not in wb.sheetnames:
+                raise NoMatchingSheetException(f"'{MakeupTestList.DEFAULT_NAME}.xlsx'의 시트명을 '{MakeupTestList.DEFAULT_NAME}'으로 변경해 주세요.")
+            ws = wb[MakeupTestList.DEFAULT_NAME]
+
+            prefix_rows = self.last_row
+            digest = hashlib.sha1()
+            prefix_ok = True
+            prefix_checked = prefix_rows < 2
+            pending: list[tuple[int, tuple]] = []  # 앞부분 해시를 확인하기 전까지 재사용한 행 값
+            rows: dict[int, list] = {}
+            last_row = 1
+            last_digest = digest.hexdigest()
+
+            for row, values in enumerate(ws.iter_rows(min_row=2, max_col=MakeupTestList.MAX, values_only=True), start=2):
+                values = tuple(values) + (None,) * (MakeupTestList.MAX - len(values))
+                digest.update(_row_key(values))
+                if values[MakeupTestList.TEST_DATE_COLUMN-1] is not None:
+                    last_row = row
+                    last_digest = digest.hexdigest()
+
+                if row <= prefix_rows and prefix_ok and row in self.rows:
+                    # 기존 기록 재사용 (점수 입력 여부, 재시 날짜만 갱신)
+                    self.rows[row][_SCORED] = values[MakeupTestList.MAKEUPTEST_SCORE_COLUMN-1] is not None
+                    self.rows[row][_MAKEUP_DATE] = date_key(values[MakeupTestList.MAKEUPTEST_DATE_COLUMN-1])
+                    pending.append((row, values))
+                else:
+                    record = _record(values)
+                    if record is not None:
+                        rows[row] = record
+
+                if row == prefix_rows:
+                    prefix_checked = True
+                    prefix_ok = last_row == prefix_rows and last_digest == self.prefix_digest
+                    if not prefix_ok:
+                        rows.update(_records(pending))
+                    pending = []
+        finally:
+            wb.close()
+
+        if not prefix_checked:
+            # 앞부분보다 짧아짐 (행 삭제)
+            prefix_ok = False
+            rows.update(_records(pending))
+
+        self._date_index = {}
+        if prefix_ok:
+            self.rows = {r: rec for r, rec in self.rows.items() if r <= prefix_rows}
+            self.rows.update(rows)
+        else:
+            # 앞부분이 바뀜 (행 삭제/정렬 등): 방금 읽은 값으로 재구성
+            self.rows = rows
+
+        # 다음 갱신 때 비교할 앞부분 해시 (방금 읽은 마지막 행까지)
+        self.last_row = last_row
+        self.prefix_digest = last_digest
+
+def _read_index() -> MakeupTestIndex | None:
+    try:
+        with open(index_path(), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+        return None
+    return MakeupTestIndex(data)
+
+def _write_index(index:MakeupTestIndex) -> None:
+    path = index_path()
+    # 서버 프로세스의 여러 스레드가 동시에 쓸 수 있으므로 스레드마다 다른 임시 파일 사용
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index.to_dict(), f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+def load() -> MakeupTestIndex:
+    """
+    최신 재시험 명단 색인 반환
+
+    파일의 mtime/크기가 색인과 같으면 파일을 읽지 않고, 다르면 `MakeupTestIndex.scan`으로 갱신 후 저장
+    """
+    stat = file_stat()
+    if stat is None:
+        raise FileNotFoundError(f"{MakeupTestList.DEFAULT_NAME} 파일이 존재하지 않습니다.\n데이터 저장 시 재시험자가 발생하면 자동으로 생성됩니다.")
+
+    index = _read_index() or MakeupTestIndex()
+    if index.stat == stat:
+        return index
+
+    index.scan()
+    index.stat = stat
+    _write_index(index)
+
+    return index
+
+def record_scores(rows:Iterable[int], stat_before:tuple[int, int] | None) -> None:
+    """
+    재시 점수를 저장한 뒤 파일을 다시 읽지 않고 색인에서 해당 행을 닫음
+
+    `stat_before`: 점수 저장을 위해 파일을 열기 직전의 `file_stat()` (색인이 그 시점 기준으로 최신일 때만 반영)
+    """
+    index = _read_index()
+    if index is None or stat_before is None or index.stat != stat_before:
+        return
+
+    index.mark_scored(rows)
+    index.stat = file_stat()
+    _write_index(index)
+
+def reset() -> None:
+    """색인 삭제 (다음 조회 시 전체 재구성)"""
+    try:
+        os.remove(index_path())
+    except OSError:
+        pass
@@ -0,0 +1,249 @@
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import Iterable
+
+import tdm.config
+import tdm.dataform
+import tdm.makeupindex
+
+from tdm.defs import DataForm, MakeupTestList
+from tdm.util import WEEKDAYS, MakeupSchedule, MakeupScheduleResolver
+
+DEFAULT_MAX_WEEKS = 4  # 정원/휴일로 밀릴 때 찾아볼 최대 주 수
+
+
+def parse_capacity(capacity:dict[str, int] | None) -> dict[tuple[int, str | None], int]:
+    """
+    `{"월": 20, "월 16": 8}` 형식의 정원 설정을 `{(요일 번호, 시간 또는 None): 정원}`으로 변환
+
+    알 수 없는 요일이나 숫자가 아닌 정원은 무시
+    """
+    parsed = {}
+    for key, value in (capacity or {}).items():
+        parts = str(key).split()
+        if not parts or parts[0] not in WEEKDAYS:
+            continue
+        try:
+            limit = int(value)
+        except (TypeError, ValueError):
+            continue
+        parsed[(WEEKDAYS.index(parts[0]), parts[1] if len(parts) > 1 else None)] = limit
+
+    return parsed
+
+def parse_holidays(holidays:Iterable[str | date] | None) -> set[date]:
+    """휴일 선택 창에서 고른 휴일 (`"YYYY-MM-DD"` 또는 날짜) 목록을 날짜 집합으로 변환"""
+    parsed = set()
+    for value in holidays or ():
+        if isinstance(value, datetime):
+            parsed.add(value.date())
+        elif isinstance(value, date):
+            parsed.add(value)
+        else:
+            try:
+                parsed.add(datetime.strptime(str(value).strip()[:10], "%Y-%m-%d").date())
+            except ValueError:
+                continue
+
+    return parsed
+
+def _slot_of(schedule:MakeupSchedule | None, d:datetime) -> tuple[int, str | None]:
+    """재시 날짜 `d`의 요일이 학생 응시 요일 중 몇 번째인지와 그 요일의 응시 시간"""
+    if schedule is None or not schedule.valid or d.weekday() not in schedule.weekdays:
+        return 0, None
+    i = schedule.weekdays.index(d.weekday())
+    return i, schedule.time_at(i)
+
+class MakeupSlotPlanner(MakeupScheduleResolver):
+    """
+    휴일과 요일/시간별 정원을 반영하는 재시험 일정 배정기
+
+    - 학생마다 가능한 요일의 날짜를 주 단위로 늘려가며 휴일이 아니고 정원이 남은 가장 이른 일정에 배정
+    - 같은 날짜면 학생 정보에 먼저 적힌 요일 우선, 같은 학생은 한 번만 배정 (같은 작업 안에서 항상 같은 결과)
+    - 모든 후보가 정원을 넘으면 휴일이 아닌 가장 이른 일정에 배정하고 `overflow`에 기록
+    - 재시험 명단에 이미 잡힌 재시험은 `book_existing`으로 정원에 반영
+
+    휴일 선택 창은 휴일인 요일의 날짜를 일주일 미뤄서 보내므로, 미뤄진 날짜의 7일 전이 `holidays`에 있으면
+    원래 날짜부터 후보로 삼고 휴일은 `holidays`로 건너뜀
+    """
+    def __init__(
+        self,
+        makeup_test_date:dict[str, datetime],
+        holidays:Iterable[date] = (),
+        capacity:dict[str, int] | None = None,
+        max_weeks:int = DEFAULT_MAX_WEEKS,
+    ):
+        super().__init__(makeup_test_date)
+        self.holidays = parse_holidays(holidays)
+        for weekday, d in enumerate(self.dates):
+            if d is not None and (d - timedelta(days=7)).date() in self.holidays:
+                self.dates[weekday] = d - timedelta(days=7)
+        self.capacity = parse_capacity(capacity)
+        self.max_weeks = max_weeks
+        self.used: Counter = Counter()
+        self.assignments: dict[str, tuple[bool, datetime | None, int]] = {}
+        self.overflow: list[str] = []
+
+    def candidate_dates(self) -> list[datetime]:
+        """배정 후보가 될 수 있는 모든 날짜 (각 요일 날짜부터 `max_weeks`주)"""
+        return sorted({
+            d + timedelta(days=7 * week)
+            for d in self.dates if d is not None
+            for week in range(self.max_weeks)
+        })
+
+    def book_existing(
+        self,
+        index:tdm.makeupindex.MakeupTestIndex,
+        student_index:dict[str, tuple],
+        wave_students:Iterable[str] = (),
+        today:datetime | None = None,
+    ) -> None:
+        """
+        재시험 명단에 이미 잡힌 재시험을 배정 전에 반영
+
+        - 후보 날짜에 재시 날짜가 잡힌 행을 학생 응시 시간별로 세어 정원에서 뺌
+        - 이번 배정 대상 학생이 오늘 응시한 시험으로 이미 저장되어 있으면 (저장 후 메시지 작성 등) 저장된 날짜를 그대로 사용
+        """
+        for d in self.candidate_dates():
+            for row in index.rows_on(d, MakeupTestList.MAKEUPTEST_DATE_COLUMN):
+                info = student_index.get(index.record(row)["student_name"])
+                self.used[(d, _slot_of(info[3] if info else None, d)[1])] += 1
+
+        wave_students = set(wave_students)
+        for row in index.rows_on(today or datetime.today(), MakeupTestList.TEST_DATE_COLUMN):
+            record = index.record(row)
+            student_name = record["student_name"]
+            if student_name not in wave_students or student_name in self.assignments or not record["makeup_test_date"]:
+                continue
+            try:
+                d = datetime.strptime(record["makeup_test_date"], "%Y-%m-%d")
+            except ValueError:
+                continue
+            info = student_index.get(student_name)
+            self.assignments[student_name] = (True, d, _slot_of(info[3] if info else None, d)[0])
+
+    def _limit(self, weekday:int, time:str | None) -> int | None:
+        limit = self.capacity.get((weekday, time))
+        if limit is None:
+            limit = self.capacity.get((weekday, None))
+        return limit
+
+    def resolve(self, schedule:MakeupSchedule, student_name:str | None = None) -> tuple[bool, datetime | None, int]:
+        if student_name is not None and student_name in self.assignments:
+            return self.assignments[student_name]
+
+        result = self._assign(schedule, student_name)
+        if student_name is not None:
+            self.assignments[student_name] = result
+        return result
+
+    def _assign(self, schedule:MakeupSchedule, student_name:str | None) -> tuple[bool, datetime | None, int]:
+        if not schedule.valid or any(self.dates[weekday] is None for weekday in schedule.weekdays):
+            return False, None, 0
+
+        candidates = []
+        for week in range(self.max_weeks):
+            for i, weekday in enumerate(schedule.weekdays):
+                d = self.dates[weekday] + timedelta(days=7 * week)
+                if d.date() not in self.holidays:
+                    candidates.append((d, i, weekday))
+        if not candidates:
+            return False, None, 0
+        candidates.sort(key=lambda c: (c[0], c[1]))
+
+        for d, i, weekday in candidates:
+            time = schedule.time_at(i)
+            limit = self._limit(weekday, time)
+            if limit is None or self.used[(d, time)] < limit:
+                self.used[(d, time)] += 1
+                return True, d, i
+
+        d, i, _ = candidates[0]
+        self.used[(d, schedule.time_at(i))] += 1
+        if student_name is not None:
+            self.overflow.append(student_name)
+        return True, d, i
+
+def failing_students(form:"tdm.dataform.FormValues") -> list[str]:
+    """기록 양식 행 순서대로 재시험 대상(80점 미만, 재시험 제외 표시 없음) 학생 이름"""
+    students = []
+    seen = set()
+    for row in range(2, form.max_row + 1):
+        student_name = form.value(row, DataForm.STUDENT_NAME_COLUMN)
+        if student_name is None or str(student_name).strip() == "":
+            continue
+        student_name = str(student_name).strip()
+        if student_name in seen:
+            continue
+        if form.value(row, DataForm.MAKEUP_TEST_CHECK_COLUMN) in ("x", "X"):
+            continue
+
+        for column in (DataForm.DAILYTEST_SCORE_COLUMN, DataForm.MOCKTEST_SCORE_COLUMN):
+            score = form.value(row, column)
+            if type(score) in (int, float) and score < 80:
+                students.append(student_name)
+                seen.add(student_name)
+                break
+
+    return students
+
+def _new_planner(
+    student_index:dict[str, tuple],
+    makeup_test_date:dict[str, datetime],
+    wave_students:list[str],
+    holidays:Iterable[str | date] | None,
+    capacity:dict[str, int] | None,
+) -> MakeupSlotPlanner:
+    planner = MakeupSlotPlanner(
+        makeup_test_date,
+        holidays or (),
+        tdm.config.MAKEUP_TEST_CAPACITY if capacity is None else capacity,
+    )
+    try:
+        index = tdm.makeupindex.load()
+    except FileNotFoundError:
+        # 재시험 명단이 아직 없으면 잡힌 재시험도 없음
+        return planner
+    planner.book_existing(index, student_index, wave_students)
+    return planner
+
+def plan_makeup_wave(
+    form:"tdm.dataform.FormValues",
+    student_index:dict[str, tuple],
+    makeup_test_date:dict[str, datetime],
+    holidays:Iterable[str | date] | None = None,
+    capacity:dict[str, int] | None = None,
+) -> MakeupSlotPlanner:
+    """
+    기록 양식의 재시험 대상 전체를 행 순서대로 한 번에 배정
+
+    재시험 명단 저장과 메시지 작성이 같은 배정 결과를 쓰도록 두 작업 모두 이 함수로 배정기 생성
+
+    `holidays`: 휴일 선택 창에서 고른 휴일, `capacity`가 없으면 설정의 재시험 정원 사용
+    """
+    students = failing_students(form)
+    planner = _new_planner(student_index, makeup_test_date, students, holidays, capacity)
+    for student_name in students:
+        info = student_index.get(student_name)
+        if info is not None:
+            planner.resolve(info[3], student_name)
+
+    return planner
+
+def plan_student(
+    student_name:str,
+    student_index:dict[str, tuple],
+    makeup_test_date:dict[str, datetime],
+    holidays:Iterable[str | date] | None = None,
+    capacity:dict[str, int] | None = None,
+) -> tuple[bool, datetime | None, int]:
+    """
+    개별 결과 저장/메시지 작성용 한 학생 배정 (`plan_makeup_wave`와 같은 휴일/정원/기존 재시험 규칙)
+
+    재시험 명단에 먼저 저장했으면 메시지 작성 때 저장된 날짜를 그대로 사용
+    """
+    info = student_index.get(student_name)
+    if info is None:
+        return False, None, 0
+    return _new_planner(student_index, makeup_test_date, [student_name], holidays, capacity).resolve(info[3], student_name)
@@ -6,19 +6,25 @@ from datetime import datetime
 from openpyxl.utils.cell import get_column_letter as gcl
 
 import tdm.classinfo
+import tdm.makeupindex
+import tdm.makeupplan
 import tdm.dataform
 import tdm.studentinfo
 import tdm.config
 
 from tdm.defs import MakeupTestList, DataForm
 from tdm.exception import NoMatchingSheetException, FileOpenException, ReopenFileException
-from tdm.util import calculate_makeup_test_schedule
+from tdm.util import MakeupSchedule
 from tdm.progress import Progress
 from tdm.style import ALIGN_CENTER, ALIGN_CENTER_WRAP, FILL_NEW_STUDENT, BORDER_ALL
 
 
 # 파일 기본 작업
 def make_file():
+    make_workbook().save(f"{tdm.config.DATA_DIR}/data/{MakeupTestList.DEFAULT_NAME}.xlsx")
+
+def make_workbook() -> xl.Workbook:
+    """머리글만 있는 재시험 명단 통합 문서 (보관 파일도 같은 양식 사용)"""
     wb = xl.Workbook()
     ws = wb.worksheets[0]
     ws.title = MakeupTestList.DEFAULT_NAME
@@ -39,7 +45,7 @@ def make_file():
         ws.cell(1, col).alignment = ALIGN_CENTER_WRAP
         ws.cell(1, col).border    = BORDER_ALL
 
-    wb.save(f"{tdm.config.DATA_DIR}/data/{MakeupTestList.DEFAULT_NAME}.xlsx")
+    return wb
 
 def open(data_only:bool=False) -> xl.Workbook:
     try:
@@ -74,173 +80,257 @@ def get_studnet_test_index_dict():
     2nd key: 시험명
 
     value: 행 인덱스
+
+    재시험 명단 색인(`tdm.makeupindex`)을 사용하므로 마지막 조회 이후 추가된 행만 읽음
     """
-    wb = open(True)
-    ws = open_worksheet(wb)
+    return tdm.makeupindex.load().open_tests()
+
+NO_TIME_SLOT = "시간 미정"
+
+def makeup_test_time_slot(schedule:MakeupSchedule | None, date:datetime) -> str:
+    """
+    학생의 재시험 응시 요일/시간에서 `date` 요일에 해당하는 응시 시간
 
-    student_test_index_dict:dict[str, dict[str, int]] = {}
-    for row in range(2, ws.max_row+1):
-        if ws.cell(row, MakeupTestList.MAKEUPTEST_SCORE_COLUMN).value is None:
-            class_name       = ws.cell(row, MakeupTestList.CLASS_NAME_COLUMN).value
-            student_name     = ws.cell(row, MakeupTestList.STUDENT_NAME_COLUMN).value
-            makeup_test_name = ws.cell(row, MakeupTestList.TEST_NAME_COLUMN).value
-            try:
-                student_test_index_dict[student_name]
-            except:
-                student_test_index_dict[student_name] = {}
+    요일별로 시간이 다르면(`월/목`, `16/18`) 해당 요일의 시간, 정할 수 없으면 `NO_TIME_SLOT`
+    """
+    if schedule is None or schedule.times is None:
+        return NO_TIME_SLOT
 
-            test_name = f"({class_name}) {makeup_test_name}"
-            student_test_index_dict[student_name][test_name] = row
+    if len(set(schedule.times)) == 1:
+        return schedule.times[0]
 
-    return student_test_index_dict
+    if date.weekday() in schedule.weekdays:
+        return schedule.time_at(schedule.weekdays.index(date.weekday())) or NO_TIME_SLOT
 
-# 파일 작업
-def save_makeup_test_list(filepath: str, makeup_test_date: dict, prog: Progress):
-    form_wb = None
-    student_wb = None
-    wb = None
+    return NO_TIME_SLOT
 
+def _time_slot_order(slot:str):
     try:
-        form_wb = tdm.dataform.open(filepath)
-        form_ws = tdm.dataform.open_worksheet(form_wb)
+        return (0, float(slot.replace("시", "").replace(":", ".")), slot)
+    except ValueError:
+        return (1, 0, slot)
 
-        # 재시험 정보 파일 없으면 생성
-        if not os.path.isfile(f"{tdm.config.DATA_DIR}/data/{MakeupTestList.DEFAULT_NAME}.xlsx"):
-            make_file()
+def get_makeup_test_roster(date:datetime, column:int = MakeupTestList.MAKEUPTEST_DATE_COLUMN) -> dict:
+    """
+    `date`에 재시험을 보는 학생 명단 (`column=TEST_DATE_COLUMN`이면 그날 시험에서 재시험 대상이 된 학생)
 
-        wb = open()
-        ws = open_worksheet(wb)
+    재시험 명단 날짜 색인과 학생 정보 색인만 사용하므로 재시험 명단 전체를 다시 읽지 않음
 
-        # 학생 정보
-        student_wb = tdm.studentinfo.open(True)
-        student_ws = tdm.studentinfo.open_worksheet(student_wb)
+    return `{"date", "count", "slots": [{"time", "students": [행 기록]}]}` (응시 시간 순)
+    """
+    index = tdm.makeupindex.load()
+    student_index = tdm.studentinfo.load_student_index()
+
+    slots: dict[str, list[dict]] = {}
+    for row in index.rows_on(date, column):
+        record = index.record(row)
+        _, _, new_student, schedule = student_index.get(record["student_name"], (None, None, False, None))
+        record["new_student"] = new_student
+        slots.setdefault(makeup_test_time_slot(schedule, date), []).append(record)
+
+    return {
+        "date": date.strftime("%Y-%m-%d"),
+        "count": sum(len(students) for students in slots.values()),
+        "slots": [
+            {"time": slot, "students": sorted(slots[slot], key=lambda r: (str(r["class_name"]), str(r["student_name"])))}
+            for slot in sorted(slots, key=_time_slot_order)
+        ],
+    }
+
+def export_makeup_test_roster(date:datetime) -> str:
+    """
+    `date`의 재시험 명단을 응시 시간별로 정리한 파일 생성
 
-        # ✅ 오늘 날짜 캐시 (루프 밖)
-        today = datetime.today().date()
-        today_key = today.strftime("%y%m%d")
+    return: 생성한 파일 경로
+    """
+    roster = get_makeup_test_roster(date)
 
-        # 재시험 데이터 작성 시작 위치 탐색
-        for row in range(ws.max_row + 1, 1, -1):
-            if ws.cell(row - 1, MakeupTestList.TEST_DATE_COLUMN).value is not None:
-                MAKEUP_TEST_RANGE = MAKEUP_TEST_WRITE_ROW = row
-                break
-        else:
-            # 시트가 비어있는 특이 케이스 방어
-            MAKEUP_TEST_RANGE = MAKEUP_TEST_WRITE_ROW = 2
+    wb = xl.Workbook()
+    ws = wb.worksheets[0]
+    ws.title = date.strftime("%m.%d")
+
+    headers = ("응시 시간", "이름", "반", "담당T", "시험명", "응시일", "재시 점수", "비고")
+    for col, header in enumerate(headers, start=1):
+        ws.cell(1, col).value     = header
+        ws.cell(1, col).alignment = ALIGN_CENTER_WRAP
+        ws.cell(1, col).border    = BORDER_ALL
+    ws.freeze_panes = "A2"
+
+    row = 2
+    for slot in roster["slots"]:
+        for record in slot["students"]:
+            values = (
+                slot["time"],
+                record["student_name"],
+                record["class_name"],
+                record["teacher_name"],
+                record["test_name"],
+                record["test_date"],
+                None,
+                None,
+            )
+            for col, value in enumerate(values, start=1):
+                ws.cell(row, col).value     = value
+                ws.cell(row, col).alignment = ALIGN_CENTER
+                ws.cell(row, col).border    = BORDER_ALL
+            if record["new_student"]:
+                ws.cell(row, 2).fill = FILL_NEW_STUDENT
+            row += 1
+
+    path = f"{tdm.config.DATA_DIR}/{MakeupTestList.DEFAULT_NAME}({date.strftime('%m.%d')}).xlsx"
+    try:
+        wb.save(path)
+    except PermissionError:
+        raise FileOpenException(f"{MakeupTestList.DEFAULT_NAME}({date.strftime('%m.%d')}) 파일을 닫은 뒤 다시 시도해주세요")
+
+    return path
+
+# 파일 작업
+def save_makeup_test_list(filepath: str, makeup_test_date: dict, prog: Progress, form: tdm.dataform.FormValues = None, student_index: dict[str, tuple] = None, planner: tdm.makeupplan.MakeupSlotPlanner = None, holidays: list = None):
+    """
+    기록 양식에서 80점 미만 학생을 재시험 명단에 추가
 
-        # ✅ (핵심) 중복 검사 캐시: "오늘 날짜인 행"만 스캔해서 set 구축
-        #     기존 로직은 '오늘자 영역에서 같은 학생+반이면 duplicated'였음
-        today_existing = set()  # (student_name, class_name)
+    `form`, `student_index`를 넘기면 기록 양식과 학생 정보를 다시 읽지 않음
 
-        # 뒤에서 앞으로 훑되, 날짜가 오늘보다 과거로 내려가면 break
-        check = ws.max_row
-        while check > 1:
-            test_date = ws.cell(check, MakeupTestList.TEST_DATE_COLUMN).value
+    재시험 날짜는 `planner`(없으면 `holidays`로 `tdm.makeupplan.plan_makeup_wave`)의 배정 결과 사용
+    """
+    if form is None:
+        form = tdm.dataform.read_form(filepath)
+
+    # 학생 정보 색인
+    if student_index is None:
+        student_index = tdm.studentinfo.load_student_index()
+
+    # 재시험 정보 파일 없으면 생성
+    if not os.path.isfile(f"{tdm.config.DATA_DIR}/data/{MakeupTestList.DEFAULT_NAME}.xlsx"):
+        make_file()
 
-            if test_date is None or type(test_date) != datetime:
-                check -= 1
+    wb = open()
+    ws = open_worksheet(wb)
+
+    # ✅ 오늘 날짜 캐시 (루프 밖)
+    today = datetime.today().date()
+    today_key = today.strftime("%y%m%d")
+
+    # 휴일/정원을 반영한 재시험 일정 배정 (작업당 1회)
+    if planner is None:
+        planner = tdm.makeupplan.plan_makeup_wave(form, student_index, makeup_test_date, holidays)
+    for student_name in planner.overflow:
+        prog.warning(f"{student_name}의 재시험 일정에 남은 자리가 없어 정원을 초과하여 배정했습니다.")
+
+    # 재시험 데이터 작성 시작 위치 탐색
+    for row in range(ws.max_row + 1, 1, -1):
+        if ws.cell(row - 1, MakeupTestList.TEST_DATE_COLUMN).value is not None:
+            MAKEUP_TEST_RANGE = MAKEUP_TEST_WRITE_ROW = row
+            break
+    else:
+        # 시트가 비어있는 특이 케이스 방어
+        MAKEUP_TEST_RANGE = MAKEUP_TEST_WRITE_ROW = 2
+
+    # ✅ (핵심) 중복 검사 캐시: "오늘 날짜인 행"만 스캔해서 set 구축
+    #     기존 로직은 '오늘자 영역에서 같은 학생+반이면 duplicated'였음
+    today_existing = set()  # (student_name, class_name)
+
+    # 뒤에서 앞으로 훑되, 날짜가 오늘보다 과거로 내려가면 break
+    check = ws.max_row
+    while check > 1:
+        test_date = ws.cell(check, MakeupTestList.TEST_DATE_COLUMN).value
+
+        if test_date is None or type(test_date) != datetime:
+            check -= 1
+            continue
+
+        dkey = test_date.strftime("%y%m%d")
+        if dkey == today_key:
+            sname = ws.cell(check, MakeupTestList.STUDENT_NAME_COLUMN).value
+            cname = ws.cell(check, MakeupTestList.CLASS_NAME_COLUMN).value
+            if sname is not None and cname is not None:
+                today_existing.add((sname, cname))
+            check -= 1
+            continue
+
+        if dkey < today_key:
+            break
+
+        check -= 1
+
+    for test_type in range(2):
+        if test_type == 0:
+            TEST_NAME_COLUMN = DataForm.DAILYTEST_NAME_COLUMN
+            TEST_SCORE_COLUMN = DataForm.DAILYTEST_SCORE_COLUMN
+        else:
+            TEST_NAME_COLUMN = DataForm.MOCKTEST_NAME_COLUMN
+            TEST_SCORE_COLUMN = DataForm.MOCKTEST_SCORE_COLUMN
+
+        # 데일리데이터 기록 양식 루프
+        class_name = test_name = teacher_name = None
+
+        for i in range(2, form.max_row + 1):
+            # 반/시험명 갱신
+            c = form.value(i, DataForm.CLASS_NAME_COLUMN)
+            tn = form.value(i, TEST_NAME_COLUMN)
+            if c is not None and tn is not None:
+                class_name = c
+                test_name = tn
+                teacher_name = form.value(i, DataForm.TEACHER_NAME_COLUMN)
+
+            test_score = form.value(i, TEST_SCORE_COLUMN)
+            if test_score is None or type(test_score) not in (int, float) or test_score >= 80:
                 continue
 
-            dkey = test_date.strftime("%y%m%d")
-            if dkey == today_key:
-                sname = ws.cell(check, MakeupTestList.STUDENT_NAME_COLUMN).value
-                cname = ws.cell(check, MakeupTestList.CLASS_NAME_COLUMN).value
-                if sname is not None and cname is not None:
-                    today_existing.add((sname, cname))
-                check -= 1
+            makeup_test_check = form.value(i, DataForm.MAKEUP_TEST_CHECK_COLUMN)
+            if makeup_test_check in ("x", "X"):
                 continue
 
-            if dkey < today_key:
-                break
+            student_name = form.value(i, DataForm.STUDENT_NAME_COLUMN)
+            if not student_name or not class_name:
+                continue
 
-            check -= 1
+            # ✅ O(1) 중복 검사 (기존 while check 루프 제거)
+            key = (student_name, class_name)
+            if key in today_existing:
+                continue
+
+            # 학생 재시험 정보 검색
+            complete = student_name in student_index
+            makeup_test_weekday, _, new_student, schedule = student_index.get(student_name, (None, None, False, None))
+            if not complete:
+                prog.warning(f"{student_name}의 학생 정보가 존재하지 않습니다.")
+
+            ws.cell(MAKEUP_TEST_WRITE_ROW, MakeupTestList.TEST_DATE_COLUMN).value = today
+            ws.cell(MAKEUP_TEST_WRITE_ROW, MakeupTestList.CLASS_NAME_COLUMN).value = class_name
+            ws.cell(MAKEUP_TEST_WRITE_ROW, MakeupTestList.TEACHER_NAME_COLUMN).value = teacher_name
+            ws.cell(MAKEUP_TEST_WRITE_ROW, MakeupTestList.STUDENT_NAME_COLUMN).value = student_name
+            ws.cell(MAKEUP_TEST_WRITE_ROW, MakeupTestList.TEST_NAME_COLUMN).value = test_name
 
-        for test_type in range(2):
-            if test_type == 0:
-                TEST_NAME_COLUMN = DataForm.DAILYTEST_NAME_COLUMN
-                TEST_SCORE_COLUMN = DataForm.DAILYTEST_SCORE_COLUMN
-            else:
-                TEST_NAME_COLUMN = DataForm.MOCKTEST_NAME_COLUMN
-                TEST_SCORE_COLUMN = DataForm.MOCKTEST_SCORE_COLUMN
-
-            # 데일리데이터 기록 양식 루프
-            class_name = test_name = teacher_name = None
-
-            for i in range(2, form_ws.max_row + 1):
-                # 반/시험명 갱신
-                c = form_ws.cell(i, DataForm.CLASS_NAME_COLUMN).value
-                tn = form_ws.cell(i, TEST_NAME_COLUMN).value
-                if c is not None and tn is not None:
-                    class_name = c
-                    test_name = tn
-                    teacher_name = form_ws.cell(i, DataForm.TEACHER_NAME_COLUMN).value
-
-                test_score = form_ws.cell(i, TEST_SCORE_COLUMN).value
-                if test_score is None or type(test_score) not in (int, float) or test_score >= 80:
-                    continue
-
-                makeup_test_check = form_ws.cell(i, DataForm.MAKEUP_TEST_CHECK_COLUMN).value
-                if makeup_test_check in ("x", "X"):
-                    continue
-
-                student_name = form_ws.cell(i, DataForm.STUDENT_NAME_COLUMN).value
-                if not student_name or not class_name:
-                    continue
-
-                # ✅ O(1) 중복 검사 (기존 while check 루프 제거)
-                key = (student_name, class_name)
-                if key in today_existing:
-                    continue
-
-                # 학생 재시험 정보 검색
-                complete, makeup_test_weekday, _, new_student = tdm.studentinfo.get_student_info(student_ws, student_name)
-                if not complete:
-                    prog.warning(f"{student_name}의 학생 정보가 존재하지 않습니다.")
-
-                ws.cell(MAKEUP_TEST_WRITE_ROW, MakeupTestList.TEST_DATE_COLUMN).value = today
-                ws.cell(MAKEUP_TEST_WRITE_ROW, MakeupTestList.CLASS_NAME_COLUMN).value = class_name
-                ws.cell(MAKEUP_TEST_WRITE_ROW, MakeupTestList.TEACHER_NAME_COLUMN).value = teacher_name
-                ws.cell(MAKEUP_TEST_WRITE_ROW, MakeupTestList.STUDENT_NAME_COLUMN).value = student_name
-                ws.cell(MAKEUP_TEST_WRITE_ROW, MakeupTestList.TEST_NAME_COLUMN).value = test_name
-
-                if new_student:
-                    ws.cell(MAKEUP_TEST_WRITE_ROW, MakeupTestList.STUDENT_NAME_COLUMN).fill = FILL_NEW_STUDENT
-
-                if makeup_test_weekday is not None:
-                    ok, calculated_schedule, _ = calculate_makeup_test_schedule(makeup_test_weekday, makeup_test_date)
-                    if not ok:
-                        prog.warning(f"{student_name}의 재시험 일정이 올바른 양식이 아닙니다.")
-
-                    ws.cell(MAKEUP_TEST_WRITE_ROW, MakeupTestList.MAKEUPTEST_DATE_COLUMN).value = calculated_schedule
-                    ws.cell(MAKEUP_TEST_WRITE_ROW, MakeupTestList.MAKEUPTEST_DATE_COLUMN).number_format = "mm월 dd일(aaa)"
-
-                # ✅ 오늘자 중복 캐시에 즉시 반영(같은 실행에서 중복 추가 방지)
-                today_existing.add(key)
-
-                MAKEUP_TEST_WRITE_ROW += 1
-
-        # ✅ 정렬 및 테두리: "추가된 행 범위만" 적용
-        for row in range(MAKEUP_TEST_RANGE, MAKEUP_TEST_WRITE_ROW):
-            for col in range(1, MakeupTestList.MAX + 1):
-                cell = ws.cell(row, col)
-                cell.alignment = ALIGN_CENTER
-                cell.border = BORDER_ALL
-
-        return wb
-    finally:
-        # ✅ close (잠김/메모리 누수 방지)
-        try:
-            if form_wb is not None:
-                form_wb.close()
-        except Exception:
-            pass
-        try:
-            if student_wb is not None:
-                student_wb.close()
-        except Exception:
-            pass
+            if new_student:
+                ws.cell(MAKEUP_TEST_WRITE_ROW, MakeupTestList.STUDENT_NAME_COLUMN).fill = FILL_NEW_STUDENT
+
+            if makeup_test_weekday is not None:
+                ok, calculated_schedule, _ = planner.resolve(schedule, student_name)
+                if not ok:
+                    prog.warning(f"{student_name}의 재시험 일정이 올바른 양식이 아닙니다.")
+
+                ws.cell(MAKEUP_TEST_WRITE_ROW, MakeupTestList.MAKEUPTEST_DATE_COLUMN).value = calculated_schedule
+                ws.cell(MAKEUP_TEST_WRITE_ROW, MakeupTestList.MAKEUPTEST_DATE_COLUMN).number_format = "mm월 dd일(aaa)"
+
+            # ✅ 오늘자 중복 캐시에 즉시 반영(같은 실행에서 중복 추가 방지)
+            today_existing.add(key)
+
+            MAKEUP_TEST_WRITE_ROW += 1
+
+    # ✅ 정렬 및 테두리: "추가된 행 범위만" 적용
+    for row in range(MAKEUP_TEST_RANGE, MAKEUP_TEST_WRITE_ROW):
+        for col in range(1, MakeupTestList.MAX + 1):
+            cell = ws.cell(row, col)
+            cell.alignment = ALIGN_CENTER
+            cell.border = BORDER_ALL
+
+    return wb
 
 def save_makeup_test_result(target_row:int, makeup_test_score:str) -> bool:
+    stat = tdm.makeupindex.file_stat()
+
     wb = open()
     ws = open_worksheet(wb)
 
@@ -248,14 +338,74 @@ def save_makeup_test_result(target_row:int, makeup_test_score:str) -> bool:
 
     save(wb)
 
+    # 파일을 다시 읽지 않고 색인에서 해당 재시험 제거
+    tdm.makeupindex.record_scores([target_row] if makeup_test_score not in (None, "") else [], stat)
+
     return True
 
-def save_individual_makeup_test(student_name:str, class_name:str, test_name:str, test_score:int|float, makeup_test_date:dict, prog:Progress):
+def save_makeup_test_results(entries:list[dict]) -> list[dict]:
+    """
+    재시 점수 여러 건을 한 번 열고 한 번 저장
+
+    `entries`: `{"row": 행 인덱스, "score": 점수, "student_name": 학생 이름, "test_name": "(반) 시험명"}` 목록
+    (`student_name`, `test_name`이 있으면 색인으로 해당 행이 같은 재시험인지 확인)
+
+    return: 입력 순서대로 `{"row", "ok", "error"}` 목록 (확인에 실패한 항목은 저장하지 않음)
+    """
+    index = tdm.makeupindex.load()
+
+    results: list[dict] = []
+    targets: dict[int, str] = {}
+    for entry in entries:
+        row = int(entry["row"])
+        score = entry.get("score")
+        error = None
+
+        info = index.entry(row)
+        if score is None or str(score).strip() == "":
+            error = "점수가 입력되지 않았습니다."
+        elif info is None:
+            error = f"{MakeupTestList.DEFAULT_NAME}에 {row}행이 존재하지 않습니다."
+        else:
+            student_name, test_name, scored = info
+            if entry.get("student_name") is not None and entry["student_name"] != student_name:
+                error = f"{row}행의 학생이 {student_name}(으)로 바뀌었습니다. 새로고침 후 다시 시도해주세요."
+            elif entry.get("test_name") is not None and entry["test_name"] != test_name:
+                error = f"{row}행의 시험이 {test_name}(으)로 바뀌었습니다. 새로고침 후 다시 시도해주세요."
+            elif scored:
+                error = f"{student_name}의 {test_name} 재시험 점수가 이미 입력되어 있습니다."
+            elif row in targets:
+                error = f"{student_name}의 {test_name} 재시험 점수가 중복으로 입력되었습니다."
+
+        if error is None:
+            targets[row] = str(score).strip()
+        results.append({"row": row, "ok": error is None, "error": error})
+
+    if not targets:
+        return results
+
+    stat = tdm.makeupindex.file_stat()
+
     wb = open()
     ws = open_worksheet(wb)
 
-    student_wb = tdm.studentinfo.open(True)
-    student_ws = tdm.studentinfo.open_worksheet(student_wb)
+    for row, score in targets.items():
+        ws.cell(row, MakeupTestList.MAKEUPTEST_SCORE_COLUMN).value = score
+
+    save(wb)
+
+    tdm.makeupindex.record_scores(targets.keys(), stat)
+
+    return results
+
+def save_individual_makeup_test(student_name:str, class_name:str, test_name:str, test_score:int|float, makeup_test_date:dict, prog:Progress, holidays:list = None):
+    """
+    개별 시험 결과의 재시험 대상 학생을 재시험 명단에 추가
+
+    재시험 날짜는 일괄 저장과 같은 규칙(휴일, 정원, 이미 잡힌 재시험)으로 `tdm.makeupplan.plan_student`에서 배정
+    """
+    wb = open()
+    ws = open_worksheet(wb)
 
     class_wb = tdm.classinfo.open(True)
     class_ws = tdm.classinfo.open_worksheet(class_wb)
@@ -269,7 +419,10 @@ def save_individual_makeup_test(student_name:str, class_name:str, test_name:str,
     if not exist:
         prog.warning(f"{class_name}의 반 정보가 존재하지 않습니다.")
 
-    exist, makeup_test_weekday, _, new_student = tdm.studentinfo.get_student_info(student_ws, student_name)
+    student_index = tdm.studentinfo.load_student_index()
+    student_info = student_index.get(student_name)
+    exist = student_info is not None
+    makeup_test_weekday, _, new_student, schedule = student_info if exist else (None, None, False, None)
     if not exist:
         prog.warning(f"{student_name}의 학생 정보가 존재하지 않습니다.")
 
@@ -286,7 +439,7 @@ def save_individual_makeup_test(student_name:str, class_name:str, test_name:str,
     if makeup_test_weekday is not None:
         # ws.cell(MAKEUP_TEST_WRITE_ROW, MakeupTestList.MAKEUPTEST_WEEKDAY_COLUMN).value = makeup_test_weekday
 
-        complete, calculated_schedule, _ = calculate_makeup_test_schedule(makeup_test_weekday, makeup_test_date)
+        complete, calculated_schedule, _ = tdm.makeupplan.plan_student(student_name, student_index, makeup_test_date, holidays)
         if not complete:
             prog.warning(f"{student_name}의 재시험 일정이 올바른 양식이 아닙니다.")
 
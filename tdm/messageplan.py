@@ -0,0 +1,350 @@
+import html
+import json
+
+from datetime import datetime
+from typing import Any, Iterable
+
+import tdm.chrome
+import tdm.config
+import tdm.dataform
+import tdm.makeupplan
+import tdm.studentinfo
+
+from tdm.defs import DataForm, MessagePreview
+from tdm.util import MakeupSchedule, MakeupScheduleResolver, date_to_kor_date
+from tdm.progress import Progress
+
+class MessagePlan:
+    """
+    아이소식 탭별 작성 작업 목록
+
+    브라우저 작성과 미리보기(dry-run)가 같은 계획을 사용
+    """
+    def __init__(self):
+        # (반, 학생, 시험명, 점수, 평균)
+        self.daily_ops: list[tuple[str, str, str | None, int | float, str | None]] = []
+        # (반, 학생, 시험명)
+        self.nosched_ops: list[tuple[str, str, str | None]] = []
+        # (반, 학생, 시험명, 재시험 일정)
+        self.sched_ops: list[tuple[str, str, str | None, str]] = []
+
+        self.student_warnings: list[tuple[str, str]] = [] # (반, 경고)
+        self.missing_classes: list[str] = []
+        # 캐시된 명단과 대조한 결과 (보고만 하고 작업은 남김)
+        self.unlisted_classes: list[str] = []
+        self.unlisted_students: list[tuple[str, str]] = [] # (반, 학생)
+
+    def class_names(self) -> list[str]:
+        return list(dict.fromkeys(op[0] for op in self.daily_ops))
+
+    def is_empty(self) -> bool:
+        return not (self.daily_ops or self.nosched_ops or self.sched_ops)
+
+    def _drop(self, keep) -> None:
+        self.daily_ops   = [op for op in self.daily_ops   if keep(op[0], op[1])]
+        self.nosched_ops = [op for op in self.nosched_ops if keep(op[0], op[1])]
+        self.sched_ops   = [op for op in self.sched_ops   if keep(op[0], op[1])]
+
+    def drop_classes(self, class_names: Iterable[str]) -> list[str]:
+        """
+        주어진 반의 작업 제거
+
+        return 새로 제외된 반 이름 리스트
+        """
+        dropped = [c for c in dict.fromkeys(class_names) if c not in self.missing_classes]
+        if not dropped:
+            return []
+        dropped_set = set(dropped)
+        self.missing_classes.extend(dropped)
+        self.student_warnings = [w for w in self.student_warnings if w[0] not in dropped_set]
+        self._drop(lambda class_name, _: class_name not in dropped_set)
+        return dropped
+
+    def check_roster(self, roster: dict[str, Iterable[str]]) -> "MessagePlan":
+        """
+        아이소식 명단(캐시)에 없는 반/학생을 기록
+
+        캐시는 오래되었을 수 있으므로 작업은 제거하지 않음. 실제로 없는 반/학생은 작성 단계에서 현재 페이지 기준으로 제외
+        """
+        class_names = self.class_names()
+        self.unlisted_classes = [c for c in class_names if c not in roster]
+
+        unlisted_set = set(self.unlisted_classes)
+        roster_sets = {class_name: set(students) for class_name, students in roster.items()}
+        self.unlisted_students = [
+            (class_name, student_name)
+            for class_name, student_name, *_ in self.daily_ops
+            if class_name not in unlisted_set and student_name not in roster_sets.get(class_name, ())
+        ]
+
+        return self
+
+    def warnings(self) -> list[str]:
+        return (
+            [f"아이소식에 {class_name} 반이 존재하지 않습니다." for class_name in self.missing_classes]
+            + [f"아이소식 명단에 {class_name} 반이 없습니다." for class_name in self.unlisted_classes if class_name not in self.missing_classes]
+            + [f"아이소식 명단의 {class_name} 내 {student_name} 학생이 없습니다." for class_name, student_name in self.unlisted_students]
+            + [msg for _, msg in self.student_warnings]
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "summary": {
+                "daily": len(self.daily_ops),
+                "makeup_no_schedule": len(self.nosched_ops),
+                "makeup_schedule": len(self.sched_ops),
+                "warnings": len(self.warnings()),
+            },
+            "tabs": [
+                {
+                    "title": "시험 결과 전송",
+                    "message": tdm.config.TEST_RESULT_MESSAGE,
+                    "entries": [
+                        {"class": c, "student": s, "test_name": n, "score": score, "average": avg}
+                        for c, s, n, score, avg in self.daily_ops
+                    ],
+                },
+                {
+                    "title": "재시험 일정 없는 학생",
+                    "message": tdm.config.MAKEUP_TEST_NO_SCHEDULE_MESSAGE,
+                    "entries": [
+                        {"class": c, "student": s, "test_name": n}
+                        for c, s, n in self.nosched_ops
+                    ],
+                },
+                {
+                    "title": "재시험 일정 있는 학생",
+                    "message": tdm.config.MAKEUP_TEST_SCHEDULE_MESSAGE,
+                    "entries": [
+                        {"class": c, "student": s, "test_name": n, "schedule": sched}
+                        for c, s, n, sched in self.sched_ops
+                    ],
+                },
+            ],
+            "warnings": self.warnings(),
+        }
+
+def makeup_schedule_text(makeup_test_weekday:str, makeup_test_time, makeup_test_date:dict[str, datetime]) -> str | None:
+    """
+    재시험 일정 문구 (`mm월 dd일 h시`) 생성
+
+    요일이 올바르지 않으면 `None`
+    """
+    return schedule_text(MakeupSchedule(makeup_test_weekday, makeup_test_time), MakeupScheduleResolver(makeup_test_date))
+
+def schedule_text(schedule:MakeupSchedule, resolver:MakeupScheduleResolver, student_name:str | None = None) -> str | None:
+    """`makeup_schedule_text`와 같은 문구를 미리 해석한 일정과 작업별 요일표(또는 배정기)로 생성"""
+    complete, calculated_schedule, time_index = resolver.resolve(schedule, student_name)
+    if not complete:
+        return None
+
+    s = date_to_kor_date(calculated_schedule)
+    makeup_test_time = schedule.time_at(time_index)
+    if makeup_test_time is not None:
+        s = f"{s} {makeup_test_time}시"
+    return s
+
+def build_message_plan(
+    form:"tdm.dataform.FormValues",
+    student_index:dict[str, tuple],
+    makeup_test_date:dict[str, datetime],
+    roster:dict[str, Iterable[str]] | None = None,
+    planner:tdm.makeupplan.MakeupSlotPlanner | None = None,
+    holidays:Iterable[str] | None = None,
+) -> MessagePlan:
+    """
+    기록 양식으로부터 시험 결과/재시험 안내 작업 생성
+
+    `roster`가 주어지면 아이소식 명단에 없는 반/학생을 경고로 기록 (작업은 남김)
+
+    재시험 일정은 재시험 명단 저장과 같은 배정 결과(`planner`, 없으면 `holidays`로 `tdm.makeupplan.plan_makeup_wave`) 사용
+    """
+    plan = MessagePlan()
+    if planner is None:
+        planner = tdm.makeupplan.plan_makeup_wave(form, student_index, makeup_test_date, holidays)
+
+    class_name = None
+    daily_test_name = mock_test_name = None
+    daily_test_average = mock_test_average = None
+
+    for row in range(2, form.max_row + 1):
+        if form.value(row, DataForm.CLASS_NAME_COLUMN) is not None:
+            class_name = str(form.value(row, DataForm.CLASS_NAME_COLUMN))
+            daily_name_value = form.value(row, DataForm.DAILYTEST_NAME_COLUMN)
+            mock_name_value = form.value(row, DataForm.MOCKTEST_NAME_COLUMN)
+            daily_avg_value = form.value(row, DataForm.DAILYTEST_AVERAGE_COLUMN)
+            mock_avg_value = form.value(row, DataForm.MOCKTEST_AVERAGE_COLUMN)
+
+            daily_test_name = str(daily_name_value) if daily_name_value is not None else None
+            mock_test_name = str(mock_name_value) if mock_name_value is not None else None
+            daily_test_average = str(daily_avg_value) if daily_avg_value is not None else None
+            mock_test_average = str(mock_avg_value) if mock_avg_value is not None else None
+
+            if daily_test_name is None and mock_test_name is None:
+                # 시험명이 없는 반은 학생 행도 작업을 생성하지 않는다.
+                class_name = None
+                continue
+
+        if class_name is None:
+            continue
+
+        student_name_raw = form.value(row, DataForm.STUDENT_NAME_COLUMN)
+        if student_name_raw is None:
+            continue
+        student_name = str(student_name_raw).strip()
+        if not student_name:
+            continue
+        daily_test_score = form.value(row, DataForm.DAILYTEST_SCORE_COLUMN)
+        mock_test_score  = form.value(row, DataForm.MOCKTEST_SCORE_COLUMN)
+
+        if daily_test_score is not None:
+            test_name, test_score, test_average = daily_test_name, daily_test_score, daily_test_average
+        elif mock_test_score is not None:
+            test_name, test_score, test_average = mock_test_name, mock_test_score, mock_test_average
+        else:
+            continue
+
+        if type(test_score) not in (int, float):
+            continue
+
+        plan.daily_ops.append((class_name, student_name, test_name, test_score, test_average))
+
+        # 재시험 분기: 어느 탭에 쓸지만 결정
+        if test_score >= 80:
+            continue
+        if form.value(row, DataForm.MAKEUP_TEST_CHECK_COLUMN) in ("x", "X"):
+            continue
+
+        student_info = student_index.get(student_name)
+        if student_info is not None and student_info[0]:
+            text = schedule_text(student_info[3], planner, student_name)
+            if text is not None:
+                plan.sched_ops.append((class_name, student_name, test_name, text))
+                continue
+        elif student_info is None:
+            plan.student_warnings.append((class_name, f"{student_name}의 학생 정보가 존재하지 않습니다."))
+
+        plan.nosched_ops.append((class_name, student_name, test_name))
+
+    if roster is not None:
+        plan.check_roster(roster)
+
+    return plan
+
+def load_message_plan(
+    filepath:str,
+    makeup_test_date:dict[str, datetime],
+    roster:dict[str, Iterable[str]] | None = None,
+    holidays:Iterable[str] | None = None,
+) -> MessagePlan:
+    """
+    기록 양식 파일과 학생 정보 파일을 읽어 `MessagePlan` 생성
+    """
+    form = tdm.dataform.read_form(filepath)
+    student_index = tdm.studentinfo.load_student_index()
+
+    return build_message_plan(form, student_index, makeup_test_date, roster, holidays=holidays)
+
+# 미리보기 보고서
+def _render_html(report:dict[str, Any]) -> str:
+    e = html.escape
+    parts = [
+        "<!DOCTYPE html>",
+        "<html lang=\"ko\"><head><meta charset=\"utf-8\">",
+        f"<title>{e(MessagePreview.DEFAULT_NAME)}</title>",
+        "<style>body{font-family:sans-serif;margin:24px}table{border-collapse:collapse;margin-bottom:24px}"
+        "th,td{border:1px solid #999;padding:4px 8px;text-align:center}pre{background:#f4f4f4;padding:8px;white-space:pre-wrap}"
+        ".warn{color:#b45309}</style>",
+        "</head><body>",
+        f"<h1>{e(MessagePreview.DEFAULT_NAME)} ({e(report['generated_at'])})</h1>",
+    ]
+
+    if report["warnings"]:
+        parts.append(f"<h2 class=\"warn\">경고 {len(report['warnings'])}건</h2><ul class=\"warn\">")
+        parts.extend(f"<li>{e(w)}</li>" for w in report["warnings"])
+        parts.append("</ul>")
+
+    for tab in report["tabs"]:
+        parts.append(f"<h2>{e(tab['title'])} ({len(tab['entries'])}명)</h2>")
+        parts.append(f"<pre>{e(tab['message'])}</pre>")
+        if not tab["entries"]:
+            continue
+        columns = list(tab["entries"][0].keys())
+        parts.append("<table><tr>" + "".join(f"<th>{e(c)}</th>" for c in columns) + "</tr>")
+        for entry in tab["entries"]:
+            parts.append("<tr>" + "".join(f"<td>{e('' if entry[c] is None else str(entry[c]))}</td>" for c in columns) + "</tr>")
+        parts.append("</table>")
+
+    parts.append("</body></html>")
+    return "\n".join(parts)
+
+def write_report(plan:MessagePlan) -> tuple[str, str]:
+    """
+    계획을 `메시지 미리보기(mm.dd).json/html`로 저장
+
+    return `json 경로`, `html 경로`
+    """
+    report = plan.to_dict()
+    stem = f"{tdm.config.DATA_DIR}/{MessagePreview.DEFAULT_NAME}({datetime.today().strftime('%m.%d')})"
+
+    with open(f"{stem}.json", "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    with open(f"{stem}.html", "w", encoding="utf-8") as f:
+        f.write(_render_html(report))
+
+    return f"{stem}.json", f"{stem}.html"
+
+def preflight(
+    filepath:str,
+    makeup_test_date:dict[str, datetime],
+    prog:Progress,
+    form:"tdm.dataform.FormValues | None" = None,
+    student_index:dict[str, tuple] | None = None,
+    planner:tdm.makeupplan.MakeupSlotPlanner | None = None,
+    holidays:Iterable[str] | None = None,
+) -> MessagePlan:
+    """
+    브라우저 실행 전 기록 양식을 아이소식 명단(캐시)과 대조하여 불일치를 한 번에 보고
+
+    불일치는 보고만 하고 작업에서 제외하지 않음 (작성 단계에서 현재 페이지로 다시 확인)
+
+    명단을 가져올 수 없으면 대조 없이 계획만 생성 (반 존재 여부는 브라우저 단계에서 확인)
+
+    `form`, `student_index`를 넘기면 기록 양식과 학생 정보를 다시 읽지 않음 (`planner`는 함께 넘길 때만 사용)
+    """
+    try:
+        roster = tdm.chrome.get_cached_class_student_dict()
+    except Exception:
+        roster = None
+        prog.warning("아이소식 명단을 불러올 수 없어 사전 점검을 생략합니다.")
+
+    if form is None or student_index is None:
+        plan = load_message_plan(filepath, makeup_test_date, roster, holidays)
+    else:
+        plan = build_message_plan(form, student_index, makeup_test_date, roster, planner, holidays)
+    for msg in plan.warnings():
+        prog.warning(msg)
+
+    return plan
+
+def dry_run(
+    filepath:str,
+    makeup_test_date:dict[str, datetime],
+    prog:Progress | None = None,
+    holidays:Iterable[str] | None = None,
+) -> tuple[MessagePlan, str, str]:
+    """
+    브라우저 없이 작성될 메시지를 계산하고 보고서로 저장
+
+    아이소식 명단은 캐시(`tdm.chrome.get_cached_class_student_dict`)를 사용
+    """
+    roster = tdm.chrome.get_cached_class_student_dict()
+    plan = load_message_plan(filepath, makeup_test_date, roster, holidays)
+
+    if prog:
+        for msg in plan.warnings():
+            prog.warning(msg)
+
+    json_path, html_path = write_report(plan)
+    return plan, json_path, html_path
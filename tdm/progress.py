@@ -1,6 +1,7 @@
 # src-pyloid/progress.py
 from __future__ import annotations
 from typing import Callable, Literal, Optional
+import threading
 import time
 
 Level = Literal["info", "success", "warning", "error"]
@@ -17,6 +18,8 @@ class Progress:
         self.total = total
         self.phase_step: Optional[int] = None
         self.phase_total: Optional[int] = None
+        # 여러 스레드에서 같은 Progress로 보고할 때 단계 번호가 꼬이지 않도록 보호
+        self._lock = threading.Lock()
 
     def _post(
         self,
@@ -28,23 +31,24 @@ class Progress:
         error: Optional[str] = None,
         detail: Optional[str] = None,
     ):
-        if inc:
-            self.step_no += 1
-        payload = {
-            "ts": time.time(),
-            "step": self.step_no,
-            "total": self.total,
-            "phase_step": self.phase_step,
-            "phase_total": self.phase_total,
-            "level": level,
-            "status": status,
-            "message": message,
-        }
-        if error is not None:
-            payload["error"] = error
-        if detail is not None:
-            payload["detail"] = detail
-        self.emit_cb(payload)
+        with self._lock:
+            if inc:
+                self.step_no += 1
+            payload = {
+                "ts": time.time(),
+                "step": self.step_no,
+                "total": self.total,
+                "phase_step": self.phase_step,
+                "phase_total": self.phase_total,
+                "level": level,
+                "status": status,
+                "message": message,
+            }
+            if error is not None:
+                payload["error"] = error
+            if detail is not None:
+                payload["detail"] = detail
+            self.emit_cb(payload)
 
     def info(self, msg: str, *, inc: bool = False):    self._post(msg, "info",    "running", inc)
     def success(self, msg: str, *, inc: bool = False): self._post(msg, "success", "running", inc)
@@ -4,7 +4,6 @@ import zipfile
 
 from openpyxl.utils.cell import get_column_letter as gcl
 from openpyxl.worksheet.worksheet import Worksheet
-from openpyxl.worksheet.datavalidation import DataValidation
 
 import tdm.chrome
 import tdm.config
@@ -12,6 +11,7 @@ import tdm.config
 from tdm.defs import StudentInfo
 from tdm.exception import NoMatchingSheetException, FileOpenException, ReopenFileException
 from tdm.style import ALIGN_CENTER, ALIGN_CENTER_WRAP, BORDER_ALL
+from tdm.util import MakeupSchedule, sync_name_rows
 
 # 파일 기본 작업
 def make_file() -> bool:
@@ -44,6 +44,19 @@ def open(data_only:bool=False) -> xl.Workbook:
     except zipfile.BadZipFile:
         raise ReopenFileException(f"{StudentInfo.DEFAULT_NAME} 파일을 직접 연 후 닫으면 문제가 해결될 수 있습니다.")
 
+def open_read_only() -> xl.Workbook:
+    """
+    조회 전용 (`read_only`, `data_only`) 열기
+
+    셀/서식 객체를 만들지 않고 행 단위로 값만 읽을 때 사용
+    """
+    try:
+        return xl.load_workbook(f"{tdm.config.DATA_DIR}/{StudentInfo.DEFAULT_NAME}.xlsx", read_only=True, data_only=True)
+    except PermissionError:
+        raise ReopenFileException(f"{StudentInfo.DEFAULT_NAME} 파일에 접근할 수 없습니다.\n파일을 직접 연 후 닫으면 문제가 해결될 수 있습니다.")
+    except zipfile.BadZipFile:
+        raise ReopenFileException(f"{StudentInfo.DEFAULT_NAME} 파일을 직접 연 후 닫으면 문제가 해결될 수 있습니다.")
+
 def open_worksheet(wb:xl.Workbook):
     try:
         return wb[StudentInfo.DEFAULT_NAME]
@@ -77,6 +90,46 @@ def get_student_info(ws:Worksheet, student_name:str):
     
     return True, makeup_test_weekday, makeup_test_time, new_studnet == 'N'
 
+def get_student_index(ws:Worksheet) -> dict[str, tuple]:
+    """
+    학생 정보 시트를 한 번 순회하여 학생 이름으로 조회하는 색인 생성
+
+    동명이인이 있으면 `get_student_info`와 같이 위쪽 행 기준
+
+    재시험 요일/시간은 색인을 만들 때 `MakeupSchedule`로 한 번 해석해 둠
+
+    return `dict[학생 이름:(재시험 요일, 재시험 시간, 신규생 여부, MakeupSchedule)]`
+    """
+    return _build_student_index(ws.iter_rows(min_row=2, max_col=StudentInfo.MAX, values_only=True))
+
+def _build_student_index(rows) -> dict[str, tuple]:
+    student_index = {}
+    for values in rows:
+        values = tuple(values) + (None,) * (StudentInfo.MAX - len(values))
+        student_name = values[StudentInfo.STUDENT_NAME_COLUMN-1]
+        if student_name is None or student_name in student_index:
+            continue
+        makeup_test_weekday = values[StudentInfo.MAKEUPTEST_WEEKDAY_COLUMN-1]
+        makeup_test_time    = values[StudentInfo.MAKEUPTEST_TIME_COLUMN-1]
+        student_index[student_name] = (
+            makeup_test_weekday,
+            makeup_test_time,
+            values[StudentInfo.NEW_STUDENT_CHECK_COLUMN-1] == 'N',
+            MakeupSchedule(makeup_test_weekday, makeup_test_time),
+        )
+
+    return student_index
+
+def load_student_index() -> dict[str, tuple]:
+    """
+    학생 정보 파일에서 필요한 4개 열의 값만 `read_only`로 읽어 `get_student_index`와 같은 색인 생성
+    """
+    wb = open_read_only()
+    try:
+        return get_student_index(open_worksheet(wb))
+    finally:
+        wb.close()
+
 # 파일 작업
 def add_student(target_student_name:str):
     """
@@ -111,39 +164,25 @@ def delete_student(target_student_name:str):
     save(wb)
 
 def update_student(wb:xl.Workbook=None):
-    latest_student_names = tdm.chrome.get_student_names()
+    """
+    아이소식 학생 명단으로 학생 정보 파일 갱신
+
+    남길 행은 위로 당겨 쓰고 새 학생은 이름순으로 이어 쓰며 나간 학생 행은 한 번에 삭제 (`tdm.util.sync_name_rows`).
+    기수 신규생 열의 데이터 유효성 검사는 범위 하나로 다시 지정
+    """
+    latest_student_names = set(tdm.chrome.get_student_names())
 
     if wb is None:
         wb = open()
 
     ws = open_worksheet(wb)
 
-    student_names = [ws.cell(row, StudentInfo.STUDENT_NAME_COLUMN).value for row in range(2, ws.max_row+1)]
-    
-    deleted_student_names      = set(student_names).difference(latest_student_names)
-    unregistered_student_names = list(set(latest_student_names).difference(student_names))
-    
-    for row in range(ws.max_row+1, 1, -1):
-        if ws.cell(row-1, StudentInfo.STUDENT_NAME_COLUMN).value is not None:
-            WRITE_ROW = row
-            break
-    
-    for student_name in sorted(unregistered_student_names):
-        ws.cell(WRITE_ROW, StudentInfo.STUDENT_NAME_COLUMN).value = student_name
-
-        dv = DataValidation(type="list", formula1="=Z1", allow_blank=True, errorStyle="stop", showErrorMessage=True)
-        dv.error = "이 셀의 값은 'N'이어야 합니다."
-        ws.add_data_validation(dv)
-        dv.add(ws.cell(WRITE_ROW, StudentInfo.NEW_STUDENT_CHECK_COLUMN))
-
-        for col in range(1, StudentInfo.MAX+1):
-            ws.cell(WRITE_ROW, col).alignment = ALIGN_CENTER
-            ws.cell(WRITE_ROW, col).border    = BORDER_ALL
-
-        WRITE_ROW += 1
-
-    for row in range(ws.max_row, 1, -1):
-        if ws.cell(row, StudentInfo.STUDENT_NAME_COLUMN).value in deleted_student_names:
-            ws.delete_rows(row)
+    sync_name_rows(
+        ws, latest_student_names,
+        name_column=StudentInfo.STUDENT_NAME_COLUMN,
+        max_column=StudentInfo.MAX,
+        validation_column=StudentInfo.NEW_STUDENT_CHECK_COLUMN,
+        validation_error="이 셀의 값은 'N'이어야 합니다.",
+    )
 
     save(wb)
@@ -2,26 +2,89 @@ from copy import copy
 from datetime import datetime
 from openpyxl.cell import Cell
 from openpyxl.styles import PatternFill
-from tdm.style import FILL_BELOW_60, FILL_BELOW_70, FILL_BELOW_80, FILL_CLASS_AVG, FILL_STUDENT_AVG, FILL_NONE
+from openpyxl.utils.cell import get_column_letter as gcl
+from openpyxl.worksheet.datavalidation import DataValidation
+from openpyxl.worksheet.worksheet import Worksheet
+from tdm.style import ALIGN_CENTER, BORDER_ALL, FILL_BELOW_60, FILL_BELOW_70, FILL_BELOW_80, FILL_CLASS_AVG, FILL_STUDENT_AVG, FILL_NONE
+
+WEEKDAYS = ("월", "화", "수", "목", "금", "토", "일")
+_WEEKDAY_INDEX = {weekday: i for i, weekday in enumerate(WEEKDAYS)}
+
+class MakeupSchedule:
+    """
+    학생 정보의 재시험 응시 요일/시간(`월/목`, `16/18`)을 한 번 해석해 둔 값
+
+    `weekdays`: 요일 번호(월=0) 목록, `valid`: 모든 요일을 해석했는지 여부
+
+    `times`: 요일별 응시 시간 (시간이 없으면 None), `time_valid`: 요일 수와 시간 수가 맞는지 여부
+    """
+    __slots__ = ("weekdays", "valid", "times", "time_valid")
+
+    def __init__(self, makeup_test_weekday:str | None, makeup_test_time=None):
+        tokens = [] if makeup_test_weekday is None else [w.replace(" ", "") for w in str(makeup_test_weekday).split("/")]
+        self.weekdays: tuple[int, ...] = tuple(_WEEKDAY_INDEX.get(token, -1) for token in tokens)
+        self.valid = bool(self.weekdays) and -1 not in self.weekdays
+
+        self.times: tuple[str, ...] | None = None
+        self.time_valid = True
+        if makeup_test_time is not None and str(makeup_test_time).strip() != "":
+            parts = [t.strip() for t in str(makeup_test_time).split("/")]
+            if len(parts) == 1:
+                self.times = (parts[0],) * max(len(tokens), 1)
+            elif len(parts) == len(tokens):
+                self.times = tuple(parts)
+            else:
+                self.time_valid = False
+
+    def time_at(self, index:int) -> str | None:
+        """`index`번째 요일의 응시 시간"""
+        if self.times is None or index >= len(self.times):
+            return None
+        return self.times[index]
+
+class MakeupScheduleResolver:
+    """
+    작업 1회분 `makeup_test_date`(요일 → 재시험 날짜)로 만든 요일 번호 → 날짜 표
+
+    작업 시작 시 한 번 만들고 학생마다 `resolve`로 가장 가까운 재시험 일정 조회
+    """
+    def __init__(self, makeup_test_date:dict[str, datetime]):
+        self.dates: list[datetime | None] = [None] * len(WEEKDAYS)
+        for weekday, date in makeup_test_date.items():
+            i = _WEEKDAY_INDEX.get(str(weekday).replace(" ", ""))
+            if i is not None:
+                self.dates[i] = date
+
+    def resolve(self, schedule:MakeupSchedule, student_name:str | None = None) -> tuple[bool, datetime | None, int]:
+        """
+        return `계산 성공 여부`, `계산된 날짜`, `계산된 시간` (같은 날짜면 앞쪽 요일 기준)
+
+        `student_name`은 학생별로 배정하는 하위 클래스(`tdm.makeupplan.MakeupSlotPlanner`)에서 사용
+        """
+        if not schedule.valid:
+            return False, None, 0
+
+        calculated_date = None
+        time_index = 0
+        for i, weekday in enumerate(schedule.weekdays):
+            date = self.dates[weekday]
+            if date is None:
+                return False, None, 0
+            if calculated_date is None or date < calculated_date:
+                calculated_date = date
+                time_index = i
+
+        return True, calculated_date, time_index
 
 def calculate_makeup_test_schedule(makeup_test_weekday:str, makeup_test_date:dict[str:datetime]):
     """
     학생의 재시험 응시 희망 요일에 따라 가장 가까운 재시험 일정을 계산
 
+    여러 학생을 계산할 때는 `MakeupScheduleResolver`를 한 번 만들어 사용
+
     return `계산 성공 여부`, `계산된 날짜`, `계산된 시간`
     """
-    try:
-        weekday_list = makeup_test_weekday.split("/")
-        calculated_date = makeup_test_date[weekday_list[0].replace(" ", "")]
-        time_index = 0
-        for tmp_idx in range(len(weekday_list)):
-            if calculated_date > makeup_test_date[weekday_list[tmp_idx].replace(" ", "")]:
-                calculated_date = makeup_test_date[weekday_list[tmp_idx].replace(" ", "")]
-                time_index = tmp_idx
-    except KeyError:
-        return False, None, 0
-
-    return True, makeup_test_date[weekday_list[time_index]], time_index
+    return MakeupScheduleResolver(makeup_test_date).resolve(MakeupSchedule(makeup_test_weekday))
 
 def date_to_kor_date(date:datetime) -> str:
     """
@@ -41,6 +104,92 @@ def copy_cell(dst:Cell, src:Cell):
     dst.alignment     = copy(src.alignment)
     dst.number_format = copy(src.number_format)
 
+def sync_name_rows(
+    ws:Worksheet,
+    names:set[str],
+    name_column:int,
+    max_column:int,
+    validation_column:int,
+    validation_error:str,
+) -> None:
+    """
+    이름 열 기준으로 목록 시트(학생 정보, 반 정보)를 `names`에 맞춤
+
+    1) 기존 행을 한 번 읽어 남길 행/새 이름/지울 행으로 분류
+    2) 남길 행은 위로 당겨 씀 (시트의 모든 열을 복사, 이미 제자리인 앞부분은 그대로)
+    3) 새 이름은 이름순으로 이어 쓰고 `max_column`열까지 서식 지정 (열마다 서식을 한 번 만들고 공유)
+    4) 남은 아래쪽을 한 번에 삭제
+    5) `validation_column` 열에만 걸린 데이터 유효성 검사를 지우고 `=Z1` 목록 규칙 하나로 다시 지정
+
+    이름이 빈 행은 지우지 않고 앞뒤 행과의 순서를 유지한 채 함께 당겨 씀.
+    마지막 이름 아래의 행은 건드리지 않음
+    """
+    # 1) 기존 행 분류
+    keep_rows: list[int] = []
+    registered = set()
+    last_row = 1
+    for row, values in enumerate(ws.iter_rows(min_row=2, max_col=name_column, values_only=True), start=2):
+        name = values[name_column-1]
+        if name is None:
+            keep_rows.append(row)
+            continue
+        last_row = row
+        if name in names:
+            keep_rows.append(row)
+            registered.add(name)
+    keep_rows = [row for row in keep_rows if row <= last_row]
+
+    new_names = sorted(names - registered)
+
+    # 2) 남길 행을 위로 당겨 쓰기
+    all_columns = max(ws.max_column, max_column)
+    write_row = 2
+    for row in keep_rows:
+        if row != write_row:
+            for col in range(1, all_columns+1):
+                src = ws.cell(row, col)
+                dst = ws.cell(write_row, col)
+                dst.value  = src.value
+                dst._style = copy(src._style)
+        write_row += 1
+
+    # 3) 새 이름 이어 쓰기
+    style_templates = {}
+    for name in new_names:
+        for col in range(1, max_column+1):
+            cell = ws.cell(write_row, col)
+            cell.value = name if col == name_column else None
+            if col not in style_templates:
+                cell.style     = "Normal"
+                cell.alignment = ALIGN_CENTER
+                cell.border    = BORDER_ALL
+                style_templates[col] = copy(cell._style)
+            else:
+                cell._style = copy(style_templates[col])
+        if write_row <= last_row:
+            # 지울 행 자리에 쓰는 경우 서식 범위 밖 열에 남은 값도 비움
+            for col in range(max_column+1, all_columns+1):
+                cell = ws.cell(write_row, col)
+                cell.value = None
+                cell.style = "Normal"
+        write_row += 1
+
+    # 4) 남은 아래쪽 한 번에 삭제
+    if write_row <= last_row:
+        ws.delete_rows(write_row, last_row - write_row + 1)
+
+    # 5) 행별로 추가되던 규칙을 범위 하나로 교체
+    ws.data_validations.dataValidation = [
+        dv for dv in ws.data_validations.dataValidation
+        if not all(r.min_col == r.max_col == validation_column for r in dv.sqref.ranges)
+    ]
+    if write_row > 2:
+        dv = DataValidation(type="list", formula1="=Z1", allow_blank=True, errorStyle="stop", showErrorMessage=True)
+        dv.error = validation_error
+        ws.add_data_validation(dv)
+        column = gcl(validation_column)
+        dv.add(f"{column}2:{column}{write_row-1}")
+
 def class_average_color(score:int|float) -> PatternFill:
     """
     반 전체 평균에 대한 점수 기반 색 채우기 (`시험 평균` 행)
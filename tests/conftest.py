@@ -0,0 +1,38 @@
+import sys
+import types
+
+import pytest
+
+import tdm.config
+
+# tdm.chrome은 크롬 창 숨김 플래그를 win32process에서 가져오므로 윈도우가 아닌 환경에서는 상수만 채움
+try:
+    import win32process  # noqa: F401
+except ImportError:
+    sys.modules["win32process"] = types.SimpleNamespace(CREATE_NO_WINDOW=0x08000000)
+
+
+class RecordingProgress:
+    """`tdm.progress.Progress`와 같은 호출을 받아 단계/경고 메시지를 기록"""
+    def __init__(self):
+        self.steps: list[str] = []
+        self.warnings: list[str] = []
+
+    def step(self, msg: str):                    self.steps.append(msg)
+    def warning(self, msg: str, *, inc=False):   self.warnings.append(msg)
+    def info(self, msg: str, *, inc=False):      pass
+    def success(self, msg: str, *, inc=False):   pass
+    def phase(self, step, total, msg, level="info"): pass
+
+
+@pytest.fixture
+def prog() -> RecordingProgress:
+    return RecordingProgress()
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """빈 데이터 폴더를 설정값으로 사용"""
+    (tmp_path / "data" / "backup").mkdir(parents=True)
+    monkeypatch.setattr(tdm.config, "DATA_DIR", str(tmp_path))
+    return tmp_path
@@ -0,0 +1,200 @@
+import threading
+
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import tdm.chrome
+import tdm.config
+import tdm.studentinfo
+
+from bs4 import BeautifulSoup
+
+from tdm.defs import Chrome
+
+
+class FakeElement:
+    def __init__(self):
+        self.value = None
+
+
+class FakeDriver:
+    """`fill_individual_test_message`가 쓰는 만큼만 흉내 낸 크롬 드라이버 (값 입력은 요소에 기록)"""
+    def __init__(self, tabs: int):
+        self.window_handles = [f"tab-{i}" for i in range(tabs)]
+        self.current = 0
+        self.ctitle = {}
+        self.switch_to = self
+
+    def window(self, handle):
+        self.current = self.window_handles.index(handle)
+
+    def find_element(self, by, value):
+        return self.ctitle.setdefault(self.current, FakeElement())
+
+    def execute_script(self, script, *args):
+        if "window.open" in script:
+            self.window_handles.append(f"tab-{len(self.window_handles)}")
+        elif args and isinstance(args[0], FakeElement):
+            args[0].value = args[1]
+
+
+@pytest.fixture
+def individual(monkeypatch, data_dir):
+    monkeypatch.setattr(tdm.config, "URL", "http://aisosik.invalid/")
+    monkeypatch.setattr(tdm.config, "MAKEUP_TEST_SCHEDULE_MESSAGE", "재시험 일정 안내")
+    monkeypatch.setattr(tdm.config, "MAKEUP_TEST_NO_SCHEDULE_MESSAGE", "재시험 안내")
+    monkeypatch.setattr(tdm.config, "MAKEUP_TEST_CAPACITY", {})
+    monkeypatch.setattr(
+        tdm.studentinfo, "load_student_index",
+        lambda: tdm.studentinfo._build_student_index([("홍길동", "월/목", "16", None)]),
+    )
+
+    tables: dict[int, dict[str, tuple]] = {}
+    def cache_table_inputs(driver, class_index):
+        return tables.setdefault(driver.current, {"홍길동": (FakeElement(), FakeElement(), FakeElement())})
+    monkeypatch.setattr(tdm.chrome, "_cache_table_inputs", cache_table_inputs)
+
+    return tables
+
+
+MAKEUP_TEST_DATE = {
+    "월": datetime(2026, 10, 26), "화": datetime(2026, 10, 27), "수": datetime(2026, 10, 28),
+    "목": datetime(2026, 10, 29), "금": datetime(2026, 10, 23), "토": datetime(2026, 10, 24),
+    "일": datetime(2026, 10, 25),
+}
+
+
+def test_fill_individual_test_message_writes_makeup_schedule(individual, prog):
+    driver = FakeDriver(tabs=1)
+
+    assert tdm.chrome.fill_individual_test_message(
+        driver, {"A반": 0}, "홍길동", "A반", "단어 1회", 60, 75, False, MAKEUP_TEST_DATE, prog,
+    )
+
+    makeup = individual[Chrome.INDIVIDUAL_MAKEUPTEST_TAB]["홍길동"]
+    assert [el.value for el in makeup] == ["단어 1회", "10월 26일 16시", ""]
+    assert driver.ctitle[Chrome.INDIVIDUAL_MAKEUPTEST_TAB].value == "재시험 일정 안내"
+    assert driver.current == Chrome.DAILYTEST_RESULT_TAB
+    assert prog.warnings == []
+
+
+def test_fill_individual_test_message_skips_holiday(individual, prog):
+    # 휴일 선택 창은 휴일인 월요일을 일주일 미뤄서 보냄
+    makeup_test_date = {**MAKEUP_TEST_DATE, "월": datetime(2026, 11, 2)}
+
+    assert tdm.chrome.fill_individual_test_message(
+        FakeDriver(tabs=2), {"A반": 0}, "홍길동", "A반", "단어 1회", 60, 75, False,
+        makeup_test_date, prog, ["2026-10-26"],
+    )
+
+    makeup = individual[Chrome.INDIVIDUAL_MAKEUPTEST_TAB]["홍길동"]
+    assert makeup[1].value == "10월 29일 16시"
+
+AISOSIK_PAGE = """<html><head><title>아이소식</title></head><body>
+<textarea id="ctitle" name="ctitle"></textarea>
+<div class="style1">A반</div>
+<table id="table_0">
+  <tr class="style12">
+    <td><input name="a0"></td><td><input name="a1"></td><td><input name="a2"></td>
+    <td class="style9">홍길동</td>
+  </tr>
+  <tr class="style12">
+    <td><input name="b0"></td><td><input name="b1"></td><td><input name="b2"></td>
+    <td class="style9">김철수</td>
+  </tr>
+</table>
+</body></html>"""
+
+
+@pytest.fixture
+def aisosik_server():
+    """아이소식 페이지를 대신하는 로컬 서버"""
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = AISOSIK_PAGE.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_http_backend_writes_pages(aisosik_server, data_dir, monkeypatch, prog):
+    from tdm.messageplan import MessagePlan
+
+    monkeypatch.setattr(tdm.config, "URL", aisosik_server)
+    monkeypatch.setattr(tdm.config, "TEST_RESULT_MESSAGE", "시험 결과")
+    monkeypatch.setattr(tdm.config, "MAKEUP_TEST_NO_SCHEDULE_MESSAGE", "재시험 안내")
+    monkeypatch.setattr(tdm.config, "MAKEUP_TEST_SCHEDULE_MESSAGE", "재시험 일정 안내")
+
+    plan = MessagePlan()
+    plan.daily_ops   = [("A반", "홍길동", "단어 1회", 60, 75), ("A반", "김철수", "단어 1회", 90, 75), ("B반", "이영희", "단어 1회", 70, 70)]
+    plan.nosched_ops = []
+    plan.sched_ops   = [("A반", "홍길동", "단어 1회", "10월 26일 16시")]
+
+    backend = tdm.chrome.get_message_backend("http", open_pages=False)
+    assert backend.write("", MAKEUP_TEST_DATE, prog, plan=plan)
+
+    assert len(prog.steps) == backend.steps
+    assert prog.warnings == ["아이소식에 B반 반이 존재하지 않습니다."]
+
+    daily = backend.payloads["시험 결과 전송"]
+    assert daily["ctitle"] == "시험 결과"
+    assert [daily[k] for k in ("a0", "a1", "a2", "b1")] == ["단어 1회", "60", "75", "90"]
+    assert backend.payloads["재시험 일정 있는 학생"]["a1"] == "10월 26일 16시"
+
+    with open(backend.pages[0], encoding="utf-8") as f:
+        soup = BeautifulSoup(f.read(), "html.parser")
+    assert soup.find("base")["href"] == aisosik_server
+
+
+class QuitRecorder:
+    def __init__(self):
+        self.quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_selenium_backend_launches_browser_before_write(monkeypatch, prog):
+    driver = QuitRecorder()
+    monkeypatch.setattr(tdm.chrome, "_launch_message_browser", lambda clone_tabs: (driver, {"A반": 0}))
+
+    used = {}
+    def send_test_result_message(filepath, makeup_test_date, prog, clone_tabs, plan, browser_future):
+        used["browser"] = browser_future.result()
+        return True
+    monkeypatch.setattr(tdm.chrome, "send_test_result_message", send_test_result_message)
+
+    backend = tdm.chrome.get_message_backend("selenium")
+    backend.prepare()
+    assert backend.write("", MAKEUP_TEST_DATE, prog, plan=object())
+    backend.discard()
+
+    assert used["browser"] == (driver, {"A반": 0})
+    assert not driver.quit_called
+
+
+def test_selenium_backend_discard_quits_unused_browser(monkeypatch):
+    driver = QuitRecorder()
+    monkeypatch.setattr(tdm.chrome, "_launch_message_browser", lambda clone_tabs: (driver, {}))
+
+    backend = tdm.chrome.get_message_backend("selenium")
+    backend.prepare()
+    backend.discard()
+
+    assert driver.quit_called
@@ -0,0 +1,54 @@
+from datetime import datetime
+
+import openpyxl as xl
+import pytest
+
+import tdm.makeuparchive
+import tdm.makeupindex
+import tdm.makeuptest
+
+from tdm.defs import MakeupTestList
+from tdm.exception import FileOpenException
+
+
+def _write_list(rows: list[tuple]) -> None:
+    wb = tdm.makeuptest.make_workbook()
+    ws = wb[MakeupTestList.DEFAULT_NAME]
+    for row, (test_date, class_name, student_name, test_name, score) in enumerate(rows, start=2):
+        ws.cell(row, MakeupTestList.TEST_DATE_COLUMN).value        = test_date
+        ws.cell(row, MakeupTestList.CLASS_NAME_COLUMN).value       = class_name
+        ws.cell(row, MakeupTestList.STUDENT_NAME_COLUMN).value     = student_name
+        ws.cell(row, MakeupTestList.TEST_NAME_COLUMN).value        = test_name
+        ws.cell(row, MakeupTestList.MAKEUPTEST_SCORE_COLUMN).value = score
+    wb.save(tdm.makeupindex.list_path())
+
+
+def _archived_students(month: str) -> list[str]:
+    ws = xl.load_workbook(tdm.makeuparchive.archive_path(month))[MakeupTestList.DEFAULT_NAME]
+    return [ws.cell(row, MakeupTestList.STUDENT_NAME_COLUMN).value for row in range(2, ws.max_row + 1)]
+
+
+def test_archive_retry_after_failed_list_save_does_not_duplicate(data_dir, monkeypatch, prog):
+    _write_list([
+        (datetime(2026, 7, 1),  "A반", "홍길동", "단어 1회", 90),
+        (datetime(2026, 8, 3),  "A반", "김철수", "단어 2회", 85),
+        (datetime(2026, 10, 1), "A반", "이영희", "단어 3회", None),
+    ])
+
+    save = tdm.makeuptest.save
+    def failing_save(wb):
+        raise FileOpenException("재시험 명단 파일을 닫은 뒤 다시 시도해주세요")
+    monkeypatch.setattr(tdm.makeuptest, "save", failing_save)
+
+    with pytest.raises(FileOpenException):
+        tdm.makeuparchive.archive_completed_tests(prog, after_days=30)
+
+    monkeypatch.setattr(tdm.makeuptest, "save", save)
+    assert tdm.makeuparchive.archive_completed_tests(prog, after_days=30) == 2
+
+    assert _archived_students("2026-07") == ["홍길동"]
+    assert _archived_students("2026-08") == ["김철수"]
+    assert [item["student_name"] for item in tdm.makeuparchive.search_archive()] == ["홍길동", "김철수"]
+
+    ws = tdm.makeuptest.open()[MakeupTestList.DEFAULT_NAME]
+    assert [ws.cell(row, MakeupTestList.STUDENT_NAME_COLUMN).value for row in range(2, ws.max_row + 1)] == ["이영희"]
@@ -0,0 +1,74 @@
+import os
+
+from datetime import datetime
+
+import pytest
+
+import tdm.makeupindex
+import tdm.makeuptest
+
+from tdm.defs import MakeupTestList
+
+
+def _save(ws, stamp: int) -> None:
+    path = tdm.makeupindex.list_path()
+    ws.parent.save(path)
+    # 같은 크기로 빠르게 다시 저장해도 색인이 바뀐 것으로 보도록 수정 시각을 고정값으로 지정
+    os.utime(path, ns=(stamp, stamp))
+
+
+def _append(ws, test_date: datetime, class_name: str, student_name: str, test_name: str, makeup_date: datetime) -> None:
+    row = ws.max_row + 1
+    ws.cell(row, MakeupTestList.TEST_DATE_COLUMN).value       = test_date
+    ws.cell(row, MakeupTestList.CLASS_NAME_COLUMN).value      = class_name
+    ws.cell(row, MakeupTestList.STUDENT_NAME_COLUMN).value    = student_name
+    ws.cell(row, MakeupTestList.TEST_NAME_COLUMN).value       = test_name
+    ws.cell(row, MakeupTestList.MAKEUPTEST_DATE_COLUMN).value = makeup_date
+
+
+@pytest.fixture
+def makeup_list(data_dir, monkeypatch):
+    wb = tdm.makeuptest.make_workbook()
+    ws = wb[MakeupTestList.DEFAULT_NAME]
+    _append(ws, datetime(2026, 10, 19), "A반", "홍길동", "단어 1회", datetime(2026, 10, 22))
+    _append(ws, datetime(2026, 10, 19), "A반", "김철수", "단어 1회", datetime(2026, 10, 22))
+    _save(ws, 1_000_000_000)
+
+    opened = []
+    open_read_only = tdm.makeupindex._open_read_only
+    monkeypatch.setattr(tdm.makeupindex, "_open_read_only", lambda: opened.append(1) or open_read_only())
+
+    return ws, opened
+
+
+def test_load_reuses_prefix_and_records_new_rows(makeup_list):
+    ws, opened = makeup_list
+    index = tdm.makeupindex.load()
+    assert index.rows_on("2026-10-22") == [2, 3]
+
+    # 기존 행에 엑셀에서 직접 점수 입력 + 새 행 추가
+    ws.cell(2, MakeupTestList.MAKEUPTEST_SCORE_COLUMN).value = 90
+    _append(ws, datetime(2026, 10, 20), "B반", "이영희", "단어 2회", datetime(2026, 10, 23))
+    _save(ws, 2_000_000_000)
+
+    opened.clear()
+    index = tdm.makeupindex.load()
+    assert len(opened) == 1
+    assert index.entry(2) == ("홍길동", "(A반) 단어 1회", True)
+    assert index.record(4)["student_name"] == "이영희"
+    assert index.open_tests() == {"김철수": {"(A반) 단어 1회": 3}, "이영희": {"(B반) 단어 2회": 4}}
+
+
+def test_load_rebuilds_in_one_pass_when_prefix_changes(makeup_list):
+    ws, opened = makeup_list
+    tdm.makeupindex.load()
+
+    ws.delete_rows(2)
+    _save(ws, 2_000_000_000)
+
+    opened.clear()
+    index = tdm.makeupindex.load()
+    assert len(opened) == 1
+    assert sorted(index.rows) == [2]
+    assert index.entry(2) == ("김철수", "(A반) 단어 1회", False)
+    assert index.last_row == 2